@@ -49,7 +49,7 @@
     'price': 90.99,
     'currency': 'USD',
     
-    'version': '18.0.1.0.0',
+    'version': '18.0.1.2.0',
     'license': 'LGPL-3',
     'category': 'Sales/CRM',
     
@@ -65,6 +65,8 @@
         'security/ir.model.access.csv',
         'views/config_views.xml',
         'views/task_views.xml',
+        'views/sync_run_views.xml',
+        'data/circuit_breaker.xml',
         'data/cron.xml',
     ],
     
@@ -0,0 +1,117 @@
+# odoo_gohighlevel_connector/cli/sync_worker.py
+import argparse
+import logging
+import signal
+import sys
+import threading
+import time
+
+import psycopg2
+
+from odoo import SUPERUSER_ID, api
+from odoo.cli import Command
+from odoo.modules.registry import Registry
+from odoo.sql_db import connection_info_for
+from odoo.tools import config
+
+from ..models.backend import SYNC_WORKER_LOCK
+from ..models.request_log import log_error
+
+_logger = logging.getLogger(__name__)
+
+# (label, model, method) run in order on every round, each in its own transaction
+ROUND_STEPS = [
+    ("deferred pushes", "ghl.sync.queue", "_process_pending"),
+    ("sync runs", "ghl.sync.run", "cron_process_runs"),
+    ("polling", "odoo.ghl.backend", "cron_poll_changes"),
+    ("sweep partitions", "ghl.sync.partition", "cron_sweep_partitions"),
+]
+
+
+class GhlSyncWorker(Command):
+    """Run the GoHighLevel sync in a dedicated long-running process.
+
+    Loops over deferred pushes, "Sync Now" runs, scheduled polls and the
+    task / note sweep partitions, keeping the registry, the settings cache
+    and the HTTP connections to GHL warm between rounds. While it runs, the
+    poll and sync run crons stand down; they take over again as soon as the
+    worker stops. SIGINT / SIGTERM finish the current step, then exit.
+
+        odoo-bin ghl_sync_worker -c odoo.conf -d mydb
+    """
+
+    name = "ghl_sync_worker"
+
+    def run(self, cmdargs):
+        parser = argparse.ArgumentParser(
+            prog=f"{sys.argv[0].split('/')[-1]} {self.name}",
+            description=self.__doc__,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+        )
+        parser.add_argument(
+            "--interval", type=float, default=5,
+            help="Seconds to wait between two rounds (default: 5)",
+        )
+        parser.add_argument(
+            "--retry-interval", type=float, default=300,
+            help="Seconds between two retries of the failed queue entries (default: 300)",
+        )
+        opts, odoo_args = parser.parse_known_args(cmdargs)
+        config.parse_config(odoo_args, setup_logging=True)
+        dbname = (config["db_name"] or "").split(",")[0]
+        if not dbname:
+            parser.error("a database is required (-d / --database)")
+
+        lock = self._acquire_lock(dbname)
+        if lock is None:
+            _logger.error("A GHL sync worker is already running on database %s.", dbname)
+            sys.exit(1)
+
+        stop = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stop.set())
+
+        _logger.info("GHL sync worker started on database %s.", dbname)
+        next_retry = time.monotonic() + opts.retry_interval
+        try:
+            while not stop.is_set():
+                steps = list(ROUND_STEPS)
+                if time.monotonic() >= next_retry:
+                    steps.append(("failed queue entries", "ghl.sync.queue", "cron_retry_failed_syncs"))
+                    next_retry = time.monotonic() + opts.retry_interval
+                self._round(dbname, steps, stop)
+                stop.wait(opts.interval)
+        finally:
+            lock.close()
+        _logger.info("GHL sync worker stopped.")
+
+    def _acquire_lock(self, dbname):
+        """Take the worker lock on a dedicated connection (None if taken).
+
+        The connection is kept open for the life of the process: Postgres
+        releases the lock when it closes, however the process ends.
+        """
+        _dsn, info = connection_info_for(dbname)
+        conn = psycopg2.connect(**info)
+        conn.autocommit = True
+        with conn.cursor() as cr:
+            cr.execute("SELECT pg_try_advisory_lock(%s)", (SYNC_WORKER_LOCK,))
+            if cr.fetchone()[0]:
+                return conn
+        conn.close()
+        return None
+
+    def _round(self, dbname, steps, stop):
+        registry = Registry(dbname).check_signaling()
+        for label, model, method in steps:
+            if stop.is_set():
+                break
+            try:
+                with registry.cursor() as cr:
+                    env = api.Environment(cr, SUPERUSER_ID, {"ghl_sync_worker_process": True})
+                    if model not in env:
+                        return  # Module not installed (yet) on this database
+                    getattr(env[model], method)()
+            except Exception as e:
+                log_error(_logger, "GHL sync worker: %s failed", e, label)
+        registry.signal_changes()
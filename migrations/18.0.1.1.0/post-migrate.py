@@ -0,0 +1,46 @@
+# odoo_gohighlevel_connector/migrations/18.0.1.1.0/post-migrate.py
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Tables that used to carry the ghl.sync.mixin columns
+SYNCED_TABLES = [
+    ("res_partner", "res.partner"),
+    ("crm_lead", "crm.lead"),
+    ("project_task", "project.task"),
+    ("mail_message", "mail.message"),
+]
+
+
+def migrate(cr, version):
+    """Move binding columns from business tables into ghl_binding."""
+    for table, model in SYNCED_TABLES:
+        cr.execute(
+            """
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = %s AND column_name = 'ghl_id'
+            """,
+            (table,),
+        )
+        if not cr.fetchone():
+            continue
+        cr.execute(
+            f"""
+            INSERT INTO ghl_binding (model, res_id, ghl_id, remote_updated_at, last_synced_at)
+            SELECT %s, id, ghl_id, ghl_remote_updated_at, ghl_last_synced_at
+            FROM {table}
+            WHERE ghl_id IS NOT NULL AND ghl_id != ''
+            ORDER BY id
+            ON CONFLICT DO NOTHING
+            """,
+            (model,),
+        )
+        _logger.info("Moved %s GHL bindings from %s", cr.rowcount, table)
+        cr.execute(
+            f"""
+            ALTER TABLE {table}
+                DROP COLUMN ghl_id,
+                DROP COLUMN IF EXISTS ghl_remote_updated_at,
+                DROP COLUMN IF EXISTS ghl_last_synced_at
+            """
+        )
@@ -0,0 +1,62 @@
+# odoo_gohighlevel_connector/migrations/18.0.1.2.0/post-migrate.py
+import logging
+
+_logger = logging.getLogger(__name__)
+
+ENTITIES = ("contacts", "opportunities", "tasks", "notes")
+# Watermark parameters, by entity
+WATERMARK_PARAMS = {
+    "contacts": "odoo_ghl.last_contact_pull",
+    "opportunities": "odoo_ghl.last_opportunity_pull",
+    "tasks": "odoo_ghl.last_task_pull",
+    "notes": "odoo_ghl.last_note_pull",
+}
+
+
+def migrate(cr, version):
+    """Move the sync watermarks, cursors and poll schedule into ghl_sync_state."""
+    cr.execute("SELECT value FROM ir_config_parameter WHERE key = 'odoo_ghl.location_id'")
+    row = cr.fetchone()
+    location = (row and row[0]) or "-"
+
+    def upsert(key, column, value, cast=""):
+        cr.execute(
+            f"""
+            INSERT INTO ghl_sync_state (location_id, key, {column})
+            VALUES (%s, %s, %s{cast})
+            ON CONFLICT (location_id, key) DO UPDATE SET {column} = EXCLUDED.{column}
+            """,
+            (location, key, value),
+        )
+
+    for entity, param in WATERMARK_PARAMS.items():
+        cr.execute("SELECT value FROM ir_config_parameter WHERE key = %s AND value != ''", (param,))
+        row = cr.fetchone()
+        if row:
+            # Stored as ISO strings in UTC, naive or with a trailing Z; the
+            # column is naive UTC. A timestamptz cast would read the naive
+            # ones in the session's TimeZone.
+            upsert(entity, "watermark", row[0], "::timestamp")
+    for entity in ENTITIES:
+        for column in ("next_poll", "poll_interval"):
+            cr.execute(
+                "SELECT value FROM ir_config_parameter WHERE key = %s AND value != ''",
+                (f"odoo_ghl.{entity}_{column}",),
+            )
+            row = cr.fetchone()
+            if row:
+                upsert(entity, column, row[0], "::timestamp" if column == "next_poll" else "::float")
+    cr.execute("SELECT key, value FROM ir_config_parameter WHERE key LIKE 'odoo\\_ghl.resume\\_%%'")
+    for key, value in cr.fetchall():
+        upsert(key[len("odoo_ghl.resume_"):], "cursor", value, "::jsonb")
+
+    cr.execute(
+        """
+        DELETE FROM ir_config_parameter
+         WHERE key IN %s OR key LIKE 'odoo\\_ghl.resume\\_%%'
+        """,
+        (tuple(WATERMARK_PARAMS.values()) + tuple(
+            f"odoo_ghl.{entity}_{column}" for entity in ENTITIES for column in ("next_poll", "poll_interval")
+        ),),
+    )
+    _logger.info("Moved %s GHL sync parameters into ghl_sync_state", cr.rowcount)
@@ -1,9 +1,15 @@
 # odoo_gohighlevel_connector/models/__init__.py
+from . import circuit_breaker
 from . import backend
 from . import config_settings
+from . import ghl_binding
 from . import sync_mixin
 from . import contact
 from . import opportunity
 from . import task
 from . import note
 from . import ghl_mapping
+from . import sync_run
+from . import sync_partition
+from . import api_lane
+from . import sync_state
@@ -0,0 +1,161 @@
+# odoo_gohighlevel_connector/models/api_lane.py
+import logging
+import threading
+import time
+
+from odoo import api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+# Priority lanes of the GHL API calls, highest first. The lane of a call
+# comes from the ``ghl_lane`` context key; calls made outside the sync
+# crons (a user saving a record) are interactive.
+LANES = [
+    ('interactive', 'Interactive'),
+    ('poll', 'Polling'),
+    ('bulk', 'Bulk'),
+]
+LANE_RANK = {lane: rank for rank, (lane, _label) in enumerate(LANES)}
+
+# Share of the GHL burst rate limit a lane leaves to the lanes above it
+LANE_RESERVE = {"interactive": 0.0, "poll": 0.25, "bulk": 0.5}
+
+# A lane counts as active for this long after its last call
+ACTIVE_SECONDS = 5
+# A lower lane never waits longer than this before one call (no starvation)
+MAX_YIELD_SECONDS = 30
+YIELD_STEP = 0.25
+CACHE_TTL = 1
+
+# Burst rate limit reported by the last GHL response of this process
+_rate_lock = threading.Lock()
+_rate = {"remaining": None, "max": None, "reset_at": 0.0}
+
+# Per-process copy of the lane rows: {dbname: (fetched_at, {lane: active until (monotonic)})}
+_active_cache = {}
+# {(dbname, lane): monotonic time this process last announced the lane}
+_announced = {}
+
+
+def observe_rate_limit(headers):
+    """Record the burst rate-limit headers of a GHL response.
+
+    ORM-free and thread-safe, called for every response.
+    """
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        maximum = int(headers["X-RateLimit-Max"])
+        interval = int(headers.get("X-RateLimit-Interval-Milliseconds") or 10000) / 1000
+    except (KeyError, TypeError, ValueError):
+        return
+    with _rate_lock:
+        _rate.update(remaining=remaining, max=maximum, reset_at=time.monotonic() + interval)
+
+
+def _must_yield(dbname, lane):
+    now = time.monotonic()
+    _fetched_at, active = _active_cache.get(dbname, (0.0, {}))
+    if any(until > now for other, until in active.items() if LANE_RANK[other] < LANE_RANK[lane]):
+        return True
+    with _rate_lock:
+        remaining, maximum, reset_at = _rate["remaining"], _rate["max"], _rate["reset_at"]
+    return remaining is not None and now < reset_at and remaining < maximum * LANE_RESERVE[lane]
+
+
+def wait_turn(dbname, lane):
+    """Hold a call of ``lane`` while a higher lane is active or the burst
+    budget is down to the reserve of the higher lanes.
+
+    ORM-free, so the page prefetcher and the push threads can call it; the
+    lane activity comes from the process cache refreshed by ``_refresh``.
+    Returns the seconds waited.
+    """
+    started = time.monotonic()
+    if lane == "interactive":
+        return 0.0
+    while time.monotonic() - started < MAX_YIELD_SECONDS and _must_yield(dbname, lane):
+        time.sleep(YIELD_STEP)
+    return time.monotonic() - started
+
+
+class GHLApiLane(models.Model):
+    """Last activity of each API lane, shared by all workers.
+
+    Higher lanes announce their traffic here (at most every few seconds
+    per process, through a separate cursor); lower lanes read it through a
+    short per-process cache and yield while a higher lane is active.
+    """
+
+    _name = "ghl.api.lane"
+    _description = "GoHighLevel API Lane"
+    _log_access = False
+
+    lane = fields.Selection(LANES, string="Lane", required=True, readonly=True)
+    active_until = fields.Datetime(string="Active Until", readonly=True)
+
+    _sql_constraints = [
+        ('lane_uniq', 'unique(lane)', 'Each lane can only exist once.'),
+    ]
+
+    @api.model
+    def _current_lane(self):
+        lane = self.env.context.get("ghl_lane")
+        return lane if lane in LANE_RANK else "interactive"
+
+    @api.model
+    def _announce(self, lane):
+        """Tell the lower lanes of every worker that ``lane`` is calling GHL."""
+        dbname = self.env.cr.dbname
+        now = time.monotonic()
+        if now - _announced.get((dbname, lane), 0.0) < ACTIVE_SECONDS / 2:
+            return
+        _announced[(dbname, lane)] = now
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                """
+                INSERT INTO ghl_api_lane (lane, active_until)
+                VALUES (%s, (clock_timestamp() at time zone 'UTC') + make_interval(secs => %s))
+                ON CONFLICT (lane) DO UPDATE SET active_until = EXCLUDED.active_until
+                """,
+                (lane, ACTIVE_SECONDS),
+            )
+        _active_cache.setdefault(dbname, (0.0, {}))[1][lane] = now + ACTIVE_SECONDS
+
+    @api.model
+    def _refresh(self):
+        """Reload the activity of the lanes into the process cache."""
+        dbname = self.env.cr.dbname
+        now = time.monotonic()
+        cached = _active_cache.get(dbname)
+        if cached and now - cached[0] < CACHE_TTL:
+            return
+        # Own cursor: the caller's snapshot would not see other workers' traffic
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                "SELECT lane, EXTRACT(EPOCH FROM active_until - (clock_timestamp() at time zone 'UTC')) FROM ghl_api_lane"
+            )
+            rows = cr.fetchall()
+        _active_cache[dbname] = (now, {lane: now + float(left) for lane, left in rows if left is not None})
+
+    @api.model
+    def _heartbeat(self):
+        """Announce the current lane and refresh the cache, without waiting.
+
+        Returns the lane, for callers handing the wait over to threads.
+        """
+        lane = self._current_lane()
+        if LANE_RANK[lane] < len(LANES) - 1:
+            self._announce(lane)  # The lowest lane has nobody to hold back
+        if lane != "interactive":
+            self._refresh()
+        return lane
+
+    @api.model
+    def _acquire(self):
+        """Wait for the turn of the current lane before calling GHL."""
+        lane = self._heartbeat()
+        if lane != "interactive":
+            waited = wait_turn(self.env.cr.dbname, lane)
+            if waited >= YIELD_STEP:
+                _logger.debug("GHL %s call yielded %.1fs to higher priority traffic", lane, waited)
+        return lane
@@ -1,18 +1,349 @@
 # odoo_gohighlevel_connector/models/backend.py
+import dataclasses
+import functools
 import logging
-from datetime import datetime
+import math
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
+from datetime import datetime, timedelta
 import pytz
 
 import requests
+from psycopg2 import errors
 
-from odoo import api, fields, models, _
-from odoo import api, fields, models, _
+from odoo import api, fields, models, tools, _
 from odoo.exceptions import UserError
+from odoo.osv import expression
+from odoo.tools.safe_eval import safe_eval
+
+from .api_lane import observe_rate_limit, wait_turn
+from .circuit_breaker import GHLCircuitOpenError
+from .note import GHL_NOTE_MODELS
+from .field_mapping import CONTACT_MAPPING, OPPORTUNITY_MAPPING, TASK_MAPPING, Lookups
+from .request_log import MAX_LOGGED_BODY, endpoint_template, log_call, log_summary, redact_text
+from .page_size import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageSizer
+from .query_guard import QueryGuard, call_counter, http_call_count
+from .sync_partition import PARTITIONED_ENTITIES
+from .sync_run import ENTITY_PULLS
 import re
 import json
 
 _logger = logging.getLogger(__name__)
 
+GHL_BASE_URL = "https://services.leadconnectorhq.com"
+
+# Shared by every call of this process (crons, threads, the sync worker),
+# so connections to GHL are kept alive and reused
+_http_session = requests.Session()
+
+# Postgres advisory lock held by the dedicated sync worker for its lifetime
+SYNC_WORKER_LOCK = 0x47484C57
+
+# Context used for every write originating from the sync engine:
+# - ghl_sync_running: prevents the create/write hooks from pushing back
+# - tracking_disable / mail_*: no tracking values, chatter logs,
+#   follower subscriptions or notifications for imported data
+GHL_SYNC_CONTEXT = {
+    "ghl_sync_running": True,
+    "tracking_disable": True,
+    "mail_notrack": True,
+    "mail_create_nolog": True,
+    "mail_create_nosubscribe": True,
+    "mail_auto_subscribe_no_notify": True,
+    "mail_post_autofollow": False,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class GHLConfig:
+    """Typed snapshot of the GoHighLevel settings (watermarks excluded)."""
+
+    api_token: str
+    location_id: str
+    sync_on: str
+    sync_direction: str
+    conflict_policy: str
+    sync_contacts: bool
+    sync_opportunities: bool
+    sync_tasks: bool
+    sync_notes: bool
+    poll_interval_minutes: int
+    adaptive_polling: bool
+    poll_min_minutes: int
+    poll_max_minutes: int
+    pull_prefetch_pages: int
+    cron_time_budget_seconds: int
+    query_guard: str
+    contact_domain: str
+    opportunity_domain: str
+    task_domain: str
+    contact_tags: frozenset
+    pipeline_ids: frozenset
+    reconcile_slices: int
+    reconcile_time_budget_seconds: int
+    reconcile_max_calls: int
+    log_payload_sample_rate: float
+    task_pull_mode: str
+
+    def push_on_save(self, flag):
+        """Whether create/write of the entity behind ``flag`` pushes to GHL."""
+        return (
+            getattr(self, flag)
+            and self.sync_direction in ("odoo_to_ghl", "both")
+            and self.sync_on == "create_update"
+        )
+
+
+class GHLAPIError(UserError):
+    """GHL call failure; ``status_code`` is None for connection errors.
+
+    The message only quotes the response redacted; the raw body, which
+    may hold contact data, is kept in ``response_body``.
+    """
+
+    def __init__(self, message, status_code=None, response_body=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_body = response_body
+
+    @property
+    def is_outage(self):
+        """Whether the failure says GHL is unhealthy, not that we sent bad data."""
+        return self.status_code is None or self.status_code == 429 or self.status_code >= 500
+
+
+def _ghl_url(endpoint):
+    # Support full URLs (for nextPageUrl) or endpoints
+    if endpoint.startswith("http"):
+        return endpoint  # Full URL provided (nextPageUrl)
+    return f"{GHL_BASE_URL}{endpoint}"  # Endpoint provided
+
+
+def _ghl_http(method, url, headers, params=None, payload=None, sample_rate=0.0, counter=None):
+    """Perform one GHL API call and return the decoded JSON body.
+
+    Deliberately free of any ORM access so it can run in worker threads.
+    Logs one redacted summary line per call (see request_log), with the
+    payload for a ``sample_rate`` share of the calls. The call is counted
+    on ``counter``, by default the one of the current thread (worker
+    threads get the counter of the thread they work for).
+    """
+    (counter or call_counter()).add()
+    started = time.monotonic()
+    try:
+        response = _http_session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params or {},
+            json=payload,
+            timeout=30,
+        )
+    except Exception as e:
+        log_call(method, url, None, time.monotonic() - started, 0, params, payload,
+                 body=repr(e), sample_rate=sample_rate)
+        raise GHLAPIError(_("Could not connect to GoHighLevel API:\n%s") % redact_text(e))
+    observe_rate_limit(response.headers)
+    log_call(method, url, response.status_code, time.monotonic() - started, len(response.content),
+             params, payload, body=response.text if response.status_code >= 400 else None,
+             sample_rate=sample_rate)
+
+    if response.status_code >= 400:
+        raise GHLAPIError(
+            _("GoHighLevel API error %s:\n%s")
+            % (response.status_code, redact_text(response.text)[:MAX_LOGGED_BODY]),
+            status_code=response.status_code,
+            response_body=response.text,
+        )
+
+    if not response.text:
+        return {}
+    try:
+        return response.json()
+    except Exception:
+        _logger.warning("GHL API non-JSON response from %s: %s", endpoint_template(url),
+                        redact_text(response.text)[:MAX_LOGGED_BODY])
+        return {}
+
+
+def _extract_page(data, records_keys, normalize):
+    """Return (normalized rows, total reported by GHL or None, next page URL)."""
+    meta = data.get("meta") or {}
+    total, next_url = meta.get("total"), meta.get("nextPageUrl")
+    for key in records_keys:
+        if data.get(key):
+            return [normalize(r) for r in data[key]], total, next_url
+    return [], total, next_url
+
+
+def _fetch_pages(url, params, headers, records_keys, normalize, pages, stop, gate, sample_rate, sizer=None,
+                 counter=None):
+    """Background page fetcher used by ``_iter_pages``.
+
+    Puts (rows, total, next_url) pages on ``pages``, then ``None`` once the last
+    page has been fetched, or the exception that interrupted fetching.
+    ``gate`` is called before each request to wait for the caller's lane;
+    ``sizer`` (a PageSizer) sets the size of each page; calls are counted
+    on the ``counter`` of the caller's thread.
+    """
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        while url and not stop.is_set():
+            gate()
+            if sizer:
+                url, params = sizer.apply(url, params)
+            started = time.monotonic()
+            try:
+                data = _ghl_http(
+                    "GET", _ghl_url(url), headers, params=params, sample_rate=sample_rate, counter=counter
+                )
+            except GHLAPIError as e:
+                if sizer and sizer.failed(e):
+                    continue  # Same page again, smaller
+                raise
+            page = _extract_page(data, records_keys, normalize)
+            if sizer:
+                sizer.observe(time.monotonic() - started, len(page[0]))
+            if not put(page):
+                return
+            url = page[2]
+            params = {}  # nextPageUrl already contains everything
+    except Exception as e:
+        put(e)
+        return
+    put(None)
+
+
+# Per synced model: (config flag, request builder, response key, updatedAt keys)
+PUSH_HANDLERS = {
+    "res.partner": ("sync_contacts", "_prepare_contact_push", "contact", ("dateUpdated", "updatedAt")),
+    "crm.lead": ("sync_opportunities", "_prepare_opportunity_push", "opportunity", ("updatedAt",)),
+    "project.task": ("sync_tasks", "_prepare_task_push", "task", ("updatedAt",)),
+    "mail.message": ("sync_notes", "_prepare_note_push", "note", ("dateAdded",)),
+}
+
+# Concurrent requests used by the batch push planner
+PUSH_WORKERS = 4
+
+# Changes in one poll above which an entity's adaptive poll interval shrinks
+ADAPTIVE_BUSY_CHANGES = 10
+
+# Records of each model the sync never applies to, whatever the settings
+BASE_SCOPE = {
+    "res.partner": [("is_company", "=", False)],
+    "crm.lead": [("type", "=", "opportunity")],
+    "project.task": [],
+    "mail.message": [("model", "in", GHL_NOTE_MODELS), ("message_type", "=", "comment")],
+}
+
+# Setting holding the configurable domain of each model
+SCOPE_SETTINGS = {
+    "res.partner": "contact_domain",
+    "crm.lead": "opportunity_domain",
+    "project.task": "task_domain",
+}
+
+# Page size of the task search; the contact and opportunity pulls adapt
+# theirs, starting from DEFAULT_PAGE_SIZE (see page_size)
+PULL_PAGE_SIZE = MAX_PAGE_SIZE
+
+# Entities re-scanned by the rolling reconciliation; the task / note sweeps
+# already visit every contact in scope on each poll
+ROLLING_RECONCILE_ENTITIES = ("contacts", "opportunities")
+PULL_MODELS = {"contacts": "res.partner", "opportunities": "crm.lead"}
+
+# Configuration keys of the pull watermarks kept in ghl.sync.state
+WATERMARK_KEYS = {
+    "contacts": "last_contact_pull",
+    "opportunities": "last_opportunity_pull",
+    "tasks": "last_task_pull",
+    "notes": "last_note_pull",
+}
+
+# Contacts swept between two progress checkpoints in pull_tasks / pull_notes
+CONTACT_SWEEP_BATCH = 25
+# Bound contacts one pull_tasks / pull_notes call fetches; a sweep over more
+# continues after them in the next slice
+SWEEP_FETCH_SIZE = 2000
+
+# Statuses of the task search saying the location cannot use it (plan,
+# token scope), rather than that the call failed
+TASK_SEARCH_UNAVAILABLE = (401, 403, 404, 405)
+
+# Pulled records hitting a concurrent update are retried this many times,
+# waiting PULL_RETRY_BACKOFF seconds (doubled per attempt) in between
+PULL_RETRIES = 3
+PULL_RETRY_BACKOFF = 0.5
+CONCURRENCY_ERRORS = (
+    errors.SerializationFailure,
+    errors.DeadlockDetected,
+    errors.LockNotAvailable,
+)
+
+# Compact, pre-normalized rows handed over by the page fetcher: only the keys
+# the pull mapping reads, plus the parsed remote timestamp.
+CONTACT_PULL_KEYS = ("id",) + CONTACT_MAPPING.pull_keys
+OPPORTUNITY_PULL_KEYS = ("id",) + OPPORTUNITY_MAPPING.pull_keys
+
+# Field mapping of each model pushed through a mapping spec
+PUSH_MAPPINGS = {
+    "res.partner": CONTACT_MAPPING,
+    "crm.lead": OPPORTUNITY_MAPPING,
+    "project.task": TASK_MAPPING,
+}
+
+
+def _split_setting(value):
+    """Comma-separated setting -> frozenset of its non-empty items."""
+    return frozenset(item.strip() for item in (value or "").split(",") if item.strip())
+
+
+def _number_setting(value, default, cast=int):
+    """Numeric setting, ``default`` when it is unset or not a number.
+
+    A mistyped system parameter must not break every save that consults
+    the settings.
+    """
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        _logger.warning("Invalid GoHighLevel setting %r, using %s instead.", value, default)
+        return default
+
+
+def _json_default(value):
+    """Serialize the datetimes found in pulled vals for the retry queue."""
+    if isinstance(value, datetime):
+        return fields.Datetime.to_string(value)
+    return str(value)
+
+
+def _normalize_contact(c):
+    row = {key: c.get(key) for key in CONTACT_PULL_KEYS}
+    row["updated_at"] = OdooGHLBackend._parse_remote_dt(
+        c.get("dateUpdated") or c.get("updatedAt")
+    )
+    return row
+
+
+def _normalize_opportunity(o):
+    row = {key: o.get(key) for key in OPPORTUNITY_PULL_KEYS}
+    row["updated_at"] = OdooGHLBackend._parse_remote_dt(o.get("updatedAt"))
+    return row
+
 
 class OdooGHLBackend(models.AbstractModel):
     _name = "odoo.ghl.backend"
@@ -22,44 +353,60 @@ class OdooGHLBackend(models.AbstractModel):
     # Read config from ir.config_parameter
     # ---------------------------------------------------------------
     @api.model
-    def _get_config(self):
+    @tools.ormcache()
+    def _get_config_snapshot(self):
+        """Cached, immutable view of the sync settings.
+
+        The ormcache is cleared whenever an ir.config_parameter is written
+        (and explicitly when the settings are saved), so the create/write
+        hooks can consult it on every save at no cost.
+        """
         ICP = self.env["ir.config_parameter"].sudo()
-        return {
-            "api_token": ICP.get_param("odoo_ghl.api_token") or "",
-            "location_id": ICP.get_param("odoo_ghl.location_id") or "",
-            "sync_on": ICP.get_param("odoo_ghl.sync_on", default="create_update"),
-            "sync_direction": ICP.get_param(
-                "odoo_ghl.sync_direction", default="both"
-            ),
-            "sync_contacts": ICP.get_param(
-                "odoo_ghl.sync_contacts", default="True"
-            )
-            == "True",
-            "sync_opportunities": ICP.get_param(
-                "odoo_ghl.sync_opportunities", default="True"
-            )
-            == "True",
-            "sync_tasks": ICP.get_param("odoo_ghl.sync_tasks", default="False")
+        return GHLConfig(
+            api_token=ICP.get_param("odoo_ghl.api_token") or "",
+            location_id=ICP.get_param("odoo_ghl.location_id") or "",
+            sync_on=ICP.get_param("odoo_ghl.sync_on", default="create_update"),
+            sync_direction=ICP.get_param("odoo_ghl.sync_direction", default="both"),
+            conflict_policy=ICP.get_param("odoo_ghl.conflict_policy", default="ghl"),
+            sync_contacts=ICP.get_param("odoo_ghl.sync_contacts", default="True") == "True",
+            sync_opportunities=ICP.get_param("odoo_ghl.sync_opportunities", default="True")
             == "True",
-            "sync_notes": ICP.get_param("odoo_ghl.sync_notes", default="False")
+            sync_tasks=ICP.get_param("odoo_ghl.sync_tasks", default="False") == "True",
+            sync_notes=ICP.get_param("odoo_ghl.sync_notes", default="False") == "True",
+            poll_interval_minutes=_number_setting(ICP.get_param("odoo_ghl.poll_interval_minutes", default="10"), 10),
+            adaptive_polling=ICP.get_param("odoo_ghl.adaptive_polling", default="True")
             == "True",
-            "last_contact_pull": ICP.get_param("odoo_ghl.last_contact_pull") or None,
-            "last_opportunity_pull": ICP.get_param(
-                "odoo_ghl.last_opportunity_pull"
-            )
-            or None,
-            "last_task_pull": ICP.get_param("odoo_ghl.last_task_pull") or None,
-            "last_note_pull": ICP.get_param("odoo_ghl.last_note_pull") or None,
-        }
+            poll_min_minutes=_number_setting(ICP.get_param("odoo_ghl.poll_min_minutes", default="5"), 5),
+            poll_max_minutes=_number_setting(ICP.get_param("odoo_ghl.poll_max_minutes", default="60"), 60),
+            pull_prefetch_pages=_number_setting(ICP.get_param("odoo_ghl.pull_prefetch_pages", default="1"), 0),
+            cron_time_budget_seconds=_number_setting(
+                ICP.get_param("odoo_ghl.cron_time_budget_seconds", default="90"), 0
+            ),
+            query_guard=ICP.get_param("odoo_ghl.query_guard", default="warn"),
+            contact_domain=ICP.get_param("odoo_ghl.contact_domain", default="[]"),
+            opportunity_domain=ICP.get_param("odoo_ghl.opportunity_domain", default="[]"),
+            task_domain=ICP.get_param("odoo_ghl.task_domain", default="[]"),
+            contact_tags=_split_setting(ICP.get_param("odoo_ghl.contact_tags")),
+            pipeline_ids=_split_setting(ICP.get_param("odoo_ghl.pipeline_ids")),
+            reconcile_slices=max(_number_setting(ICP.get_param("odoo_ghl.reconcile_slices", default="1"), 1), 1),
+            reconcile_time_budget_seconds=_number_setting(
+                ICP.get_param("odoo_ghl.reconcile_time_budget_seconds", default="1800"), 0
+            ),
+            reconcile_max_calls=_number_setting(ICP.get_param("odoo_ghl.reconcile_max_calls", default="0"), 0),
+            log_payload_sample_rate=min(max(
+                _number_setting(ICP.get_param("odoo_ghl.log_payload_sample_rate", default="0"), 0.0, float), 0.0
+            ), 1.0),
+            task_pull_mode=ICP.get_param("odoo_ghl.task_pull_mode", default="search"),
+        )
 
     @api.model
-    def _save_last_pull(
-        self, contact=None, opportunity=None, task=None, note=None
-    ):
-        settings = self.env["res.config.settings"]
-        settings._set_last_pull(
-            contact=contact, opportunity=opportunity, task=task, note=note
-        )
+    def _get_config(self):
+        cfg = dataclasses.asdict(self._get_config_snapshot())
+        watermarks = self.env["ghl.sync.state"].sudo()._get_watermarks(ENTITY_PULLS)
+        for entity, cfg_key in WATERMARK_KEYS.items():
+            watermark = watermarks.get(entity)
+            cfg[cfg_key] = watermark.isoformat() if watermark else None
+        return cfg
 
     # ---------------------------------------------------------------
     # HTTP helper
@@ -81,52 +428,100 @@ class OdooGHLBackend(models.AbstractModel):
 
     @api.model
     def _request(self, method, endpoint, api_token, params=None, payload=None):
-        base_url = "https://services.leadconnectorhq.com"
-        
-        # Support full URLs (for nextPageUrl) or endpoints
-        if endpoint.startswith("http"):
-            url = endpoint  # Full URL provided (nextPageUrl)
-        else:
-            url = f"{base_url}{endpoint}"  # Endpoint provided
-        
-        headers = self._base_headers(api_token)
-
-        _logger.info(
-            "GHL API %s %s params=%s payload=%s", method, url, params, payload
-        )
+        return self._timed_request(method, endpoint, api_token, params=params, payload=payload)[0]
 
+    @api.model
+    def _timed_request(self, method, endpoint, api_token, params=None, payload=None):
+        """``_request`` also returning the seconds the call itself took
+        (waiting for the API lane excluded)."""
+        headers = self._base_headers(api_token)
+        breaker = self.env["ghl.circuit.breaker"]
+        breaker._before_call()
+        self.env["ghl.api.lane"]._acquire()
+        started = time.monotonic()
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                params=params or {},
-                json=payload,
-                timeout=30,
-            )
-        except Exception as e:
-            _logger.exception("GHL API connection error: %s", e)
-            raise UserError(_("Could not connect to GoHighLevel API:\n%s") % e)
-
-        if response.status_code >= 400:
-            _logger.error(
-                "GHL API error %s %s: %s",
-                response.status_code,
-                url,
-                response.text,
-            )
-            raise UserError(
-                _("GoHighLevel API error %s:\n%s")
-                % (response.status_code, response.text)
+            data = _ghl_http(
+                method, _ghl_url(endpoint), headers, params=params, payload=payload,
+                sample_rate=self._get_config_snapshot().log_payload_sample_rate,
             )
+        except GHLAPIError as e:
+            if e.is_outage:
+                breaker._record_failure(e)
+            raise
+        elapsed = time.monotonic() - started
+        self._record_call_health(elapsed)
+        return data, elapsed
 
-        if not response.text:
-            return {}
+    @api.model
+    def _record_call_health(self, elapsed):
+        """Feed a successful call's latency to the circuit breaker."""
+        breaker = self.env["ghl.circuit.breaker"]
+        slow_call = breaker._get_settings()["slow_call"]
+        if elapsed > slow_call:
+            breaker._record_failure(_("Slow response: %.1fs") % elapsed)
+        else:
+            breaker._record_success()
+
+    @api.model
+    def _iter_pages(self, url, params, api_token, records_keys, normalize, prefetch=0, sizer=None):
+        """Yield (normalized rows, total, next URL) pages, following ``meta.nextPageUrl``.
+
+        With ``prefetch`` > 0 a background thread keeps up to that many pages
+        ahead of the caller, so the next HTTP round trip overlaps with the
+        DB work done on the current page. The thread only does HTTP and
+        normalization; it never touches the environment or the cursor.
+        A ``sizer`` (see page_size) adapts the size of the pages.
+        """
+        if prefetch <= 0:
+            while url:
+                if sizer:
+                    url, params = sizer.apply(url, params)
+                try:
+                    data, elapsed = self._timed_request("GET", url, api_token, params=params)
+                except GHLAPIError as e:
+                    if sizer and sizer.failed(e):
+                        continue  # Same page again, smaller
+                    raise
+                page = _extract_page(data, records_keys, normalize)
+                if sizer:
+                    sizer.observe(elapsed, len(page[0]))
+                yield page
+                url = page[2]
+                params = {}  # nextPageUrl already contains everything
+            return
+
+        headers = self._base_headers(api_token)
+        breaker = self.env["ghl.circuit.breaker"]
+        breaker._before_call()
+        Lane = self.env["ghl.api.lane"]
+        # The fetcher waits on the process cache, refreshed here per page
+        gate = functools.partial(wait_turn, self.env.cr.dbname, Lane._heartbeat())
+        pages = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        fetcher = threading.Thread(
+            target=_fetch_pages,
+            args=(
+                url, params, headers, records_keys, normalize, pages, stop, gate,
+                self._get_config_snapshot().log_payload_sample_rate, sizer, call_counter(),
+            ),
+            name="ghl-page-prefetch",
+            daemon=True,
+        )
+        fetcher.start()
         try:
-            return response.json()
-        except Exception:
-            _logger.warning("GHL API non-JSON response: %s", response.text)
-            return {}
+            while True:
+                page = pages.get()
+                if page is None:
+                    return
+                if isinstance(page, Exception):
+                    if isinstance(page, GHLAPIError) and page.is_outage:
+                        breaker._record_failure(page)
+                    raise page
+                breaker._record_success()
+                Lane._heartbeat()
+                yield page
+        finally:
+            stop.set()
 
     @api.model
     def test_api_connection(self, api_token, location_id):
@@ -162,78 +557,583 @@ class OdooGHLBackend(models.AbstractModel):
             dt = dt.replace(microsecond=0)
             return dt
         except Exception as e:
-            _logger.error(f"Failed to parse datetime '{value}': {str(e)}")
+            _logger.warning("Failed to parse GHL datetime %r: %s", value, e)
             return False
 
+    @api.model
+    def _enqueue_push(self, records, error, state="failed"):
+        """Record pushes of ``records`` (of one model) in the retry queue
+        (``draft`` = deferred, not failed).
+
+        A record already waiting in the queue has its entry refreshed
+        instead of getting a second one.
+        """
+        if not records:
+            return
+        Queue = self.env["ghl.sync.queue"].sudo()
+        waiting = Queue.search([
+            ("model_name", "=", records._name),
+            ("record_id", "in", records.ids),
+            ("action", "=", "push"),
+            ("state", "in", ("draft", "failed")),
+        ])
+        waiting.write({"error_message": str(error), "state": state})
+        queued = set(waiting.mapped("record_id"))
+        Queue.create([
+            {
+                "name": record.display_name or f"{record._name},{record.id}",
+                "model_name": record._name,
+                "record_id": record.id,
+                "action": "push",
+                "error_message": str(error),
+                "state": state,
+            }
+            for record in records
+            if record.id not in queued
+        ])
+
+    @api.model
+    def _enqueue_pull(self, record, vals, error):
+        """Park a pulled change that could not be applied, with its values.
+
+        ``record`` is the record to update, or an empty recordset of the
+        model when the change was a creation.
+        """
+        _logger.error("Could not apply pulled %s %s: %s", record._name, record.id or "creation", redact_text(error))
+        self.env["ghl.sync.queue"].sudo().create({
+            "name": vals.get("name") or (record and record.display_name) or record._name,
+            "model_name": record._name,
+            "record_id": record.id or 0,
+            "action": "pull",
+            "payload": json.dumps(vals, default=_json_default),
+            "error_message": str(error),
+            "state": "failed",
+        })
+
+    @api.model
+    def _apply_queued_pull(self, model_name, record_id, vals):
+        """Re-apply the values of a parked pull (see ``_enqueue_pull``)."""
+        Model = self.env[model_name].sudo()
+        if not record_id and vals.get("ghl_id"):
+            # Created by a later pull in the meantime: update that record
+            record_id = self.env["ghl.binding"]._get_res_ids(model_name, [vals["ghl_id"]]).get(vals["ghl_id"])
+        if record_id:
+            record = Model.browse(record_id).exists()
+            if record:
+                self._sync_env(record).write(vals)
+            return
+        self._sync_env(Model).create(vals)
+
+    @api.model
+    def _apply_pulled(self, model, to_write, to_create):
+        """Apply a batch of pulled changes; returns the number applied.
+
+        ``to_write`` holds ``(record, vals)`` pairs, ``to_create`` the vals
+        of new records of ``model``. The batch is applied under a single
+        savepoint, whose exit flushes the buffered writes and recomputes in
+        one go. When that fails it is replayed record by record, each
+        under its own savepoint: concurrency errors are retried with
+        backoff from a fresh transaction (committing what was applied so
+        far, as the snapshot predates the concurrent update), other errors
+        park the record and its values in the retry queue. Either way the
+        rest of the batch goes through.
+        """
+        cr = self.env.cr
+        try:
+            with cr.savepoint():
+                for record, vals in to_write:
+                    self._sync_env(record).write(vals)
+                if to_create:
+                    self._sync_env(model).create(to_create)
+            return len(to_write) + len(to_create)
+        except Exception as e:
+            _logger.warning(
+                "Applying %s pulled %s failed (%s), retrying one by one",
+                len(to_write) + len(to_create), model._name, redact_text(e),
+            )
+
+        applied = 0
+        items = to_write + [(model.browse(), vals) for vals in to_create]
+        for record, vals in items:
+            for attempt in range(PULL_RETRIES + 1):
+                if "ghl_last_synced_at" in vals:
+                    # A retry may run in a new transaction: its time is the write_date
+                    vals = {**vals, "ghl_last_synced_at": cr.now()}
+                try:
+                    with cr.savepoint():
+                        if record:
+                            self._sync_env(record).write(vals)
+                        else:
+                            self._sync_env(model).create(vals)
+                    applied += 1
+                except CONCURRENCY_ERRORS as e:
+                    if attempt < PULL_RETRIES:
+                        cr.commit()
+                        time.sleep(PULL_RETRY_BACKOFF * 2 ** attempt)
+                        continue
+                    self._enqueue_pull(record, vals, e)
+                except Exception as e:
+                    self._enqueue_pull(record, vals, e)
+                break
+        return applied
+
+    @api.model
+    def _with_budget(self):
+        """Return self with the deadline of the current cron slice.
+
+        Keeps a deadline already in the context, so one budget covers a
+        whole cron invocation. A budget of 0 disables slicing.
+        """
+        if self.env.context.get("ghl_deadline"):
+            return self
+        budget = self._get_config_snapshot().cron_time_budget_seconds
+        if budget <= 0:
+            return self
+        return self.with_context(ghl_deadline=time.monotonic() + budget)
+
+    @api.model
+    def _with_lane(self, lane):
+        """Return self calling GHL in ``lane`` (see api_lane), unless the
+        caller already chose one."""
+        if self.env.context.get("ghl_lane"):
+            return self
+        return self.with_context(ghl_lane=lane)
+
+    @api.model
+    def _budget_exhausted(self):
+        deadline = self.env.context.get("ghl_deadline")
+        if deadline and time.monotonic() >= deadline:
+            return True
+        call_limit = self.env.context.get("ghl_call_limit")
+        return bool(call_limit) and http_call_count() >= call_limit
+
+    @api.model
+    def _page_sizer(self, entity, limit=None):
+        """Page sizer of the ``entity`` pull, starting from the size it
+        settled on in its previous runs; a ``limit`` fixes the size."""
+        if limit:
+            return PageSizer(limit, fixed=True)
+        size = self.env["ghl.sync.state"].sudo()._get(entity).get("page_size")
+        return PageSizer(size or DEFAULT_PAGE_SIZE)
+
+    @api.model
+    def _save_page_size(self, entity, sizer):
+        """Remember the page size ``sizer`` settled on for the next run."""
+        if not sizer.fixed and sizer.size != sizer.initial:
+            _logger.info("GHL %s page size: %s -> %s", entity, sizer.initial, sizer.size)
+            self.env["ghl.sync.state"].sudo()._set(entity, page_size=sizer.size)
+
+    @api.model
+    def _resume_key(self, entity, partition=None):
+        """Key of the resume cursor of ``entity``'s pull (or sweep partition).
+
+        A manual sync run (``ghl_sync_run_id`` in the context) keeps cursors
+        of its own, so it neither picks up nor clears the position of the
+        poll cron pulling the same entity.
+        """
+        key = f"{entity}_{partition[0]}_of_{partition[1]}" if partition else entity
+        run_id = self.env.context.get("ghl_sync_run_id")
+        return f"run:{run_id}:{key}" if run_id else key
+
+    @api.model
+    def _get_resume(self, key):
+        """Where a pull interrupted by the time budget stopped, or {}."""
+        return self.env["ghl.sync.state"].sudo()._get(key).get("cursor") or {}
+
+    @api.model
+    def _set_resume(self, key, state=None):
+        """Record (or, without ``state``, clear) where a pull continues."""
+        self.env["ghl.sync.state"].sudo()._set(key, cursor=state or None)
+
+    @api.model
+    def _sync_checkpoint(self, pages, records, total=None):
+        """Report progress of the current sync run and commit the work so far.
+
+        Only reports when running under a ``ghl.sync.run`` (the run processor
+        cron sets ``ghl_sync_run_line_id``) or a partition sweep worker (which
+        renews its lease instead). Returns True when the caller should stop
+        at this boundary: the run has been cancelled, the lease lost, or the
+        time budget of the cron slice used up (see ``_budget_exhausted``).
+        """
+        out_of_time = self._budget_exhausted()
+        partition_id = self.env.context.get("ghl_sync_partition_id")
+        if partition_id:
+            # Sweep worker: keep the work so far and hold on to the lease
+            self.env.cr.commit()
+            partition = self.env["ghl.sync.partition"].browse(partition_id)
+            return not partition._renew(self.env.context["ghl_sync_worker"]) or out_of_time
+        line_id = self.env.context.get("ghl_sync_run_line_id")
+        if not line_id:
+            return out_of_time
+        line = self.env["ghl.sync.run.line"].sudo().browse(line_id)
+        vals = {"pages": pages, "records": records}
+        if total:
+            vals["total"] = total
+        line.write(vals)
+        self.env.cr.commit()
+        return out_of_time or line.run_id._is_cancel_requested()
+
+    @api.model
+    def _sync_env(self, records):
+        """Return ``records`` in the low-overhead sync import mode."""
+        return records.with_context(**GHL_SYNC_CONTEXT)
+
+    @api.model
+    def _changed_vals(self, record, vals):
+        """Return the subset of ``vals`` that would actually change ``record``.
+
+        Incoming values are normalized through the field's own cache
+        conversion (x2many commands, many2one ids, float rounding) so they
+        compare equal to what the record already holds.
+        """
+        changed = {}
+        for fname, value in vals.items():
+            field = record._fields[fname]
+            try:
+                new = field.convert_to_record(field.convert_to_cache(value, record), record)
+            except Exception:
+                changed[fname] = value
+                continue
+            old = record[fname]
+            if field.type in ("char", "text", "html", "selection") and not new and not old:
+                continue  # None, False and "" are all "empty"
+            if new != old:
+                changed[fname] = value
+        return changed
+
+    @api.model
+    def _is_echo(self, binding, updated_at, fingerprint):
+        """Whether a pulled row is a version of the record we already hold.
+
+        Our own pushes bump GHL's updatedAt; the push response stores that
+        version and the fingerprint of its values on the binding, so the
+        change coming back on the next pull is recognised and skipped.
+        """
+        if binding.remote_hash and binding.remote_hash == fingerprint:
+            return True
+        return bool(updated_at and binding.remote_updated_at and updated_at <= binding.remote_updated_at)
+
+    @api.model
+    def _keep_local(self, record, binding, updated_at, cfg):
+        """Resolve a change made on both sides since the last sync.
+
+        Returns True when the Odoo version wins under the conflict policy:
+        the GHL change is then skipped and the record queued for push.
+        ``last_synced_at`` is stamped with the transaction time, like the
+        ``write_date`` of the sync's own writes, so only a later local edit
+        counts as an Odoo change; and only when it changed a synced field,
+        going by the fingerprint of the synced Odoo values stored at the
+        last sync (see ``_bind_local_hashes``).
+        """
+        policy = cfg["conflict_policy"]
+        if policy == "ghl" or cfg["sync_direction"] != "both":
+            return False
+        synced_at = binding.last_synced_at
+        if not synced_at or not record.write_date or record.write_date <= synced_at:
+            return False  # Only GHL changed
+        mapping = PUSH_MAPPINGS[record._name]
+        if binding.local_hash and binding.local_hash == mapping.local_fingerprint(record):
+            return False  # Edited in Odoo, but no synced field
+        if policy == "newest" and updated_at and updated_at > record.write_date:
+            return False
+        return True
+
+    @api.model
+    def _bind_local_hashes(self, model, ghl_ids):
+        """Store the fingerprint of the synced Odoo values of the records
+        just pulled for ``ghl_ids`` (see ``_keep_local``)."""
+        if not ghl_ids:
+            return
+        mapping = PUSH_MAPPINGS[model._name]
+        Binding = self.env["ghl.binding"]
+        res_ids = Binding._get_res_ids(model._name, ghl_ids)
+        records = model.browse(list(res_ids.values()))
+        records.fetch(list(mapping.push_reads))
+        Binding._bind(model._name, [
+            {"res_id": record.id, "ghl_id": ghl_id, "local_hash": mapping.local_fingerprint(record)}
+            for ghl_id, record in zip(res_ids, records)
+        ])
+
+    @api.model
+    def _eval_scope_domain(self, model_name, configured):
+        """Evaluate a configured scope domain of ``model_name``.
+
+        Raises UserError when it is not a valid domain of the model.
+        """
+        try:
+            domain = safe_eval(configured, {"uid": self.env.uid})
+            self.env[model_name].sudo()._search(domain)  # Checks fields and operators
+        except Exception as e:
+            raise UserError(_("Invalid GoHighLevel sync domain for %s: %s") % (model_name, e))
+        return domain
+
+    @api.model
+    def _scope_domain(self, model_name):
+        """Domain of the ``model_name`` records the sync applies to.
+
+        The settings only save valid domains; one that broke since (a
+        field gone with its module) is logged and puts nothing in scope,
+        rather than failing every save or syncing more than configured.
+        """
+        domain = [("ghl_skip_sync", "=", False)] + BASE_SCOPE[model_name]
+        setting = SCOPE_SETTINGS.get(model_name)
+        configured = setting and getattr(self._get_config_snapshot(), setting)
+        if configured and configured.strip() != "[]":
+            try:
+                domain = expression.AND([domain, self._eval_scope_domain(model_name, configured)])
+            except UserError as e:
+                _logger.error("%s. No %s record is synced until it is fixed.", e, model_name)
+                domain = expression.FALSE_DOMAIN
+        return domain
+
+    @api.model
+    def _filter_in_scope(self, records):
+        """The part of ``records`` in the sync scope, resolved in one query."""
+        if not records:
+            return records
+        found = records.sudo().with_context(active_test=False).search(
+            expression.AND([self._scope_domain(records._name), [("id", "in", records.ids)]])
+        )
+        return records & found
+
+    @api.model
+    def _get_sweep_contacts(self, partition=None, after_id=0):
+        """Next bound contacts in scope swept by pull_tasks / pull_notes, in id order.
+
+        ``partition`` is an ``(index, count)`` pair restricting the sweep to
+        the contacts hashing to that partition; ``after_id`` skips the
+        contacts a previous slice already swept. At most ``SWEEP_FETCH_SIZE``
+        bound contacts are fetched: returns ``(contacts, next_after_id)``,
+        the latter being where the sweep continues (None when it is over).
+        """
+        res_ids = self.env["ghl.binding"]._get_partition_res_ids(
+            "res.partner", partition, after_id=after_id, limit=SWEEP_FETCH_SIZE
+        )
+        next_after_id = res_ids[-1] if len(res_ids) == SWEEP_FETCH_SIZE else None
+        return self._filter_in_scope(self.env["res.partner"].sudo().browse(res_ids)), next_after_id
+
+    @api.model
+    def _get_ghl_user_map(self):
+        """Map GHL user id -> mapped Odoo user, loaded in a single query."""
+        mappings = self.env["ghl.user.mapping"].sudo().search(
+            [("odoo_user_id", "!=", False)]
+        )
+        return {m.ghl_user_id: m.odoo_user_id for m in mappings}
+
+    @api.model
+    def _get_done_stage_map(self):
+        """Return ({project id: folded stage id}, fallback folded stage id)."""
+        stages = self.env["project.task.type"].sudo().search([("fold", "=", True)])
+        done_stages = {}
+        for stage in stages:
+            for project in stage.project_ids:
+                done_stages.setdefault(project.id, stage.id)
+        return done_stages, stages[:1].id
+
+    @api.model
     def _save_last_pull(self, contact=None, opportunity=None, task=None, note=None):
-        """Save last pull timestamps to ir.config_parameter"""
-        ICP = self.env["ir.config_parameter"].sudo()
-        
-        if contact:
-            ICP.set_param("odoo_ghl.last_contact_pull", contact)
-        if opportunity:
-            ICP.set_param("odoo_ghl.last_opportunity_pull", opportunity)
-        if task:
-            ICP.set_param("odoo_ghl.last_task_pull", task)
-        if note:
-            ICP.set_param("odoo_ghl.last_note_pull", note)
+        """Move the pull watermarks forward, in the transaction of the pull."""
+        State = self.env["ghl.sync.state"].sudo()
+        for entity, value in (
+            ("contacts", contact), ("opportunities", opportunity), ("tasks", task), ("notes", note)
+        ):
+            if value:
+                State._advance_watermark(entity, self._parse_remote_dt(value))
 
 
     # =================================================================
-    # CONTACTS – PUSH & PULL
+    # BATCH PUSH PLANNER
     # =================================================================
     @api.model
-    def push_contact(self, partner):
-        cfg = self._get_config()
-        if not cfg["sync_contacts"] or partner.ghl_skip_sync:
-            return
-        if cfg["sync_direction"] not in ("odoo_to_ghl", "both"):
-            return
-        
-        # Prevent infinite loop
+    def push_records(self, records, raise_errors=False, enqueue=True):
+        """Push records of any synced model, linking missing parent contacts first.
+
+        ``records`` is a recordset or an iterable of recordsets. Contacts that
+        opportunities, tasks or notes depend on but that are not linked to GHL
+        yet are pushed first, as one parallel batch; the dependents follow in
+        a second parallel batch. Failures are put in the retry queue (unless
+        ``enqueue`` is False) and returned as a list of (record, error); with
+        ``raise_errors`` the first one is raised once the batch is done.
+        """
         if self.env.context.get("ghl_sync_running"):
-            return
+            return []
+        # The cached settings: no watermark is needed, and this runs on saves
+        cfg = dataclasses.asdict(self._get_config_snapshot())
+        if cfg["sync_direction"] not in ("odoo_to_ghl", "both"):
+            return []
+        if isinstance(records, models.BaseModel):
+            records = [records]
 
-        # Tags
-        tags = [t.name for t in partner.category_id]
+        by_model = {name: self.env[name] for name in PUSH_HANDLERS}
+        for recs in records:
+            if cfg[PUSH_HANDLERS[recs._name][0]]:
+                by_model[recs._name] |= self._filter_in_scope(recs)
 
-        # Company Name
-        company_name = partner.parent_id.name if partner.parent_id else (partner.company_name or "")
+        partners = by_model["res.partner"]
+        if cfg["sync_contacts"]:
+            parents = (
+                by_model["crm.lead"].partner_id
+                | by_model["project.task"].partner_id
+                | self._get_note_partners(by_model["mail.message"])
+            )
+            partners |= self._filter_in_scope(parents.filtered(lambda p: not p.ghl_id))
+
+        failures = self._push_batch(list(partners), cfg)
+        dependents = [
+            record
+            for name in ("crm.lead", "project.task", "mail.message")
+            for record in by_model[name]
+        ]
+        failures += self._push_batch(dependents, cfg)
+
+        if failures:
+            # One line for the batch; the errors themselves go to the queue
+            log_summary(
+                "push failures", level=logging.ERROR,
+                failed=len(failures),
+                records=",".join(f"{record._name}:{record.id}" for record, _error in failures[:20]),
+                first_error=redact_text(failures[0][1])[:MAX_LOGGED_BODY],
+            )
+        for record, error in failures:
+            if enqueue:
+                self._enqueue_push(record, error)
+        if failures and raise_errors:
+            raise failures[0][1]
+        return failures
 
-        payload = {
-            "locationId": cfg["location_id"],
-            "firstName": partner.name,
-            "address1": partner.street or "",
-            "city": partner.city or "",
-            "state": partner.state_id and partner.state_id.name or "",
-            "postalCode": partner.zip or "",
-            "tags": tags,
-            "companyName": company_name,
-            "type": "customer",
-            "website": partner.website or "",
-        }
+    @api.model
+    def _get_note_partners(self, notes):
+        """Contacts the given notes are pushed to in GHL."""
+        partner_ids = {n.res_id for n in notes if n.model == "res.partner"}
+        lead_ids = {n.res_id for n in notes if n.model == "crm.lead"}
+        partners = self.env["res.partner"].browse(partner_ids)
+        return partners | self.env["crm.lead"].browse(lead_ids).partner_id
 
-        if partner.email:
-            payload["email"] = partner.email
-        if partner.mobile or partner.phone:
-            payload["phone"] = partner.mobile or partner.phone
+    @api.model
+    def _push_batch(self, records, cfg):
+        """Send the push requests of independent ``records`` in parallel.
+
+        Payloads are built and responses applied in the calling thread; only
+        the HTTP round trips run in the worker threads.
+        """
+        failures = []
+        jobs = []
+        guard = QueryGuard(self, "push")
+        lookups = Lookups(self)
+        self._prefetch_push(records)
+        for record in records:
+            try:
+                request = getattr(self, PUSH_HANDLERS[record._name][1])(record, cfg, lookups)
+            except Exception as e:
+                failures.append((record, e))
+                continue
+            if request:
+                jobs.append((record, *request))
+        if not jobs:
+            return failures
 
-        if partner.country_id and partner.country_id.code:
-            payload["country"] = partner.country_id.code
+        breaker = self.env["ghl.circuit.breaker"]
+        try:
+            breaker._before_call()
+        except GHLCircuitOpenError as e:
+            for record, *_request in jobs:
+                self._enqueue_push(record, e, state="draft")
+            return failures
+
+        self.env["ghl.api.lane"]._acquire()
+        headers = self._base_headers(cfg["api_token"])
+        counter = call_counter()
+        with ThreadPoolExecutor(max_workers=min(PUSH_WORKERS, len(jobs))) as pool:
+            futures = [
+                pool.submit(
+                    _ghl_http, method, _ghl_url(endpoint), headers, payload=payload,
+                    sample_rate=cfg["log_payload_sample_rate"], counter=counter,
+                )
+                for _record, method, endpoint, payload in jobs
+            ]
+            wait(futures)
+
+        pushed = []
+        for (record, method, endpoint, payload), future in zip(jobs, futures):
+            error = future.exception()
+            if not error:
+                breaker._record_success()
+                pushed.append((record, future.result()))
+                continue
+            if isinstance(error, GHLAPIError) and error.is_outage:
+                breaker._record_failure(error)
+            if record._name == "res.partner":
+                try:
+                    data = self._handle_duplicate_contact(record, error, payload, cfg)
+                except Exception as e:
+                    data, error = None, e
+                if data is not None:
+                    pushed.append((record, data))
+                    continue
+            failures.append((record, error))
+        self._apply_push(pushed)
+        guard.check(records=len(jobs))
+        return failures
 
-        # Assignee (User Mapping)
-        if partner.user_id:
-            mapping = self.env["ghl.user.mapping"].search([("odoo_user_id", "=", partner.user_id.id)], limit=1)
+    @api.model
+    def _prefetch_push(self, records):
+        """Read the fields the push mappings need for all ``records`` at once."""
+        ids_by_model = {}
+        for record in records:
+            ids_by_model.setdefault(record._name, []).extend(record.ids)
+        for name, ids in ids_by_model.items():
+            mapping = PUSH_MAPPINGS.get(name)
             if mapping:
-                payload["assignedTo"] = mapping.ghl_user_id
-            else:
-                payload["assignedTo"] = None  # User not mapped, unassign
-        else:
-            payload["assignedTo"] = None  # No user assigned, unassign in GHL
+                self.env[name].browse(ids).fetch(list(mapping.push_reads))
+
+    @api.model
+    def _apply_push(self, pushed):
+        """Store the bindings returned by GHL for the pushed records.
+
+        ``pushed`` is a list of (record, response). Only the bindings are
+        written, in one statement per model: the records are left untouched,
+        so a push does not bump their write_date.
+        """
+        rows = {}
+        for record, data in pushed:
+            _flag, _prepare, key, updated_keys = PUSH_HANDLERS[record._name]
+            remote = data.get(key) or data
+            ghl_id = remote.get("id")
+            if not ghl_id:
+                continue
+            updated_at = self._parse_remote_dt(
+                next((remote[k] for k in updated_keys if remote.get(k)), None)
+            )
+            if not updated_at and record._name == "mail.message":
+                updated_at = fields.Datetime.now()  # GHL does not always return dateAdded
+            mapping = PUSH_MAPPINGS.get(record._name)
+            rows.setdefault(record._name, []).append({
+                "res_id": record.id,
+                "ghl_id": ghl_id,
+                "remote_updated_at": updated_at,
+                "last_synced_at": self.env.cr.now(),
+                # Lets the next pull recognise this version as our own echo
+                "remote_hash": mapping.fingerprint(remote) if mapping else None,
+                "local_hash": mapping.local_fingerprint(record) if mapping else None,
+            })
+        for model, model_rows in rows.items():
+            self.env["ghl.binding"]._bind(model, model_rows)
+
+    # =================================================================
+    # CONTACTS – PUSH & PULL
+    # =================================================================
+    @api.model
+    def push_contact(self, partner):
+        """Push ``partner`` now (see ``push_records``), raising the first failure."""
+        self.push_records(partner, raise_errors=True)
 
-        # Lead Source
-        # if partner.source_id: # Assuming you want to sync Odoo Source -> GHL Source (requires string match or mapping)
-        #     payload["source"] = partner.source_id.name
+    @api.model
+    def _prepare_contact_push(self, partner, cfg, lookups=None):
+        """Return the (method, endpoint, payload) request pushing ``partner``."""
+        payload = {
+            "locationId": cfg["location_id"],
+            **CONTACT_MAPPING.to_payload(partner, lookups or Lookups(self)),
+        }
 
         endpoint = "/contacts/"
         method = "POST"
@@ -242,74 +1142,52 @@ class OdooGHLBackend(models.AbstractModel):
             method = "PUT"
             if "locationId" in payload:
                 del payload["locationId"]
+        return method, endpoint, payload
 
+    @api.model
+    def _handle_duplicate_contact(self, partner, error, payload, cfg):
+        """Link ``partner`` to the GHL contact a duplicate error points at.
+
+        Returns the response of the retried PUT, or None when ``error`` is
+        not a usable duplicate-contact error.
+        """
+        # Handle Duplicate Contact (400)
+        body = getattr(error, "response_body", None) or ""
+        if "This location does not allow duplicated contacts" not in body:
+            return None
+        # The contactId of the existing contact is in the JSON response
         try:
-            data = self._request(method, endpoint, cfg["api_token"], payload=payload)
-        except UserError as e:
-            # Handle Duplicate Contact (400)
-            error_msg = str(e)
-            if "This location does not allow duplicated contacts" in error_msg:
-                # Extract contactId from error message if possible
-                # The error message from GHL is JSON inside the exception string
-                import json
-                import re
-                
-                # Try to find JSON part
-                match = re.search(r'(\{.*\})', error_msg)
-                if match:
-                    try:
-                        err_json = json.loads(match.group(1))
-                        existing_id = err_json.get("meta", {}).get("contactId")
-                        if existing_id:
-                            _logger.info("Found existing GHL contact %s, linking and updating.", existing_id)
-                            partner.with_context(ghl_sync_running=True).write({"ghl_id": existing_id})
-                            # Retry as PUT
-                            endpoint = f"/contacts/{existing_id}"
-                            method = "PUT"
-                            if "locationId" in payload:
-                                del payload["locationId"]
-                            data = self._request(method, endpoint, cfg["api_token"], payload=payload)
-                        else:
-                            raise e
-                    except Exception:
-                        raise e
-                else:
-                    raise e
-            else:
-                self.env["ghl.sync.queue"].create({
-                    "name": partner.name,
-                    "model_name": "res.partner",
-                    "record_id": partner.id,
-                    "action": "push",
-                    "error_message": str(e),
-                    "state": "failed"
-                })
-                raise e
-        except Exception as e:
-            self.env["ghl.sync.queue"].create({
-                "name": partner.name,
-                "model_name": "res.partner",
-                "record_id": partner.id,
-                "action": "push",
-                "error_message": str(e),
-                "state": "failed"
-            })
-            raise e
-        contact = data.get("contact") or data
-        ghl_id = contact.get("id")
-        updated_at = contact.get("dateUpdated") or contact.get("updatedAt")
-
-        if ghl_id:
-            partner.with_context(ghl_sync_running=True).write(
-                {
-                    "ghl_id": ghl_id,
-                    "ghl_remote_updated_at": self._parse_remote_dt(updated_at),
-                    "ghl_last_synced_at": fields.Datetime.now(),
-                }
-            )
+            existing_id = json.loads(body).get("meta", {}).get("contactId")
+        except Exception:
+            return None
+        if not existing_id:
+            return None
+        _logger.debug("Found existing GHL contact %s, linking and updating.", existing_id)
+        already_linked = _(
+            "GoHighLevel contact %s is already linked to another Odoo contact: "
+            "merge the two contacts to sync them."
+        ) % existing_id
+        bound_id = self.env["ghl.binding"]._get_res_ids("res.partner", [existing_id]).get(existing_id)
+        if bound_id and bound_id != partner.id:
+            raise UserError(already_linked)
+        try:
+            # Keep a unique violation from aborting the whole transaction
+            with self.env.cr.savepoint():
+                self.env["ghl.binding"]._bind("res.partner", [{"res_id": partner.id, "ghl_id": existing_id}])
+        except errors.UniqueViolation:
+            raise UserError(already_linked)  # Linked by a concurrent run meanwhile
+        # Retry as PUT
+        payload = dict(payload)
+        payload.pop("locationId", None)
+        return self._request("PUT", f"/contacts/{existing_id}", cfg["api_token"], payload=payload)
 
     @api.model
-    def pull_contacts(self, limit=100):
+    def pull_contacts(self, limit=None):
+        """Pull the contacts changed since the last pull, page by page.
+
+        The page size adapts to GHL's response times (see page_size),
+        unless a fixed ``limit`` is given.
+        """
         cfg = self._get_config()
         if not cfg["sync_contacts"]:
             return
@@ -317,42 +1195,72 @@ class OdooGHLBackend(models.AbstractModel):
             return
 
         Partner = self.env["res.partner"].sudo()
-        latest = cfg["last_contact_pull"] and self._parse_remote_dt(
-            cfg["last_contact_pull"]
-        )
+        Binding = self.env["ghl.binding"]
+        # A reconciliation pass ignores the watermark and keeps its own position
+        reconcile = self.env.context.get("ghl_reconcile")
+        resume_key = self._resume_key("reconcile_contacts" if reconcile else "contacts")
+        latest = None
+        if not reconcile and cfg["last_contact_pull"]:
+            latest = self._parse_remote_dt(cfg["last_contact_pull"])
+        # Continue where the previous cron slice stopped
+        resume = self._get_resume(resume_key)
+        if resume.get("latest"):
+            latest = self._parse_remote_dt(resume["latest"])
 
         # Pagination using nextPageUrl (GHL provides complete URL)
         url = "/contacts/"
         params = {
             "locationId": cfg["location_id"],
-            "limit": limit,
+            "limit": PULL_PAGE_SIZE,
         }
         
-        total_fetched = 0
+        if resume.get("url"):
+            url, params = resume["url"], {}
+
+        total_fetched = resume.get("records", 0)
+        applied = 0  # Records actually created or written
+        cancelled = False
         seen_ids = set()  # Track IDs to detect duplicates
         max_iterations = 1000  # Safety limit
-        iteration = 0
+        lookups = Lookups(self)  # Countries, tags, companies and users, loaded once
+        sizer = self._page_sizer("contacts", limit)
+        pages = self._iter_pages(
+            url, params, cfg["api_token"], ("contacts", "items"), _normalize_contact,
+            prefetch=cfg["pull_prefetch_pages"], sizer=sizer,
+        )
+        # The prefetcher may fetch the next pages while this one is applied
+        guard = QueryGuard(self, "contacts", extra_http=cfg["pull_prefetch_pages"])
         
-        while True:
-            iteration += 1
-            
+        for iteration, (contacts, total, next_url) in enumerate(pages, resume.get("pages", 0) + 1):
+            guard.start()
             # Safety check: prevent infinite loops
             if iteration > max_iterations:
                 _logger.warning(f"Reached maximum iterations ({max_iterations}), stopping contact sync.")
                 break
             
-            _logger.info(f"Fetching contacts page {iteration}...")
-            data = self._request("GET", url, cfg["api_token"], params=params)
-            contacts = data.get("contacts") or data.get("items") or []
-            
             if not contacts:
                 _logger.info(f"No more contacts to fetch. Total fetched: {total_fetched}")
                 break
             
+            # Resolve which contacts of this page already exist in one query
+            bindings = Binding._get_bindings("res.partner", [c["id"] for c in contacts if c.get("id")])
+            page_ids = [b.res_id for b in bindings.values()]
+            # Bound records outside the sync scope are left alone
+            in_scope = set(self._filter_in_scope(Partner.browse(page_ids)).ids)
+            lookups.load_companies([c["companyName"] for c in contacts if c.get("companyName")])
+
             # Safety check: detect if we're getting duplicate contacts
             new_contacts = 0
+            to_write = []
+            to_create = []
             duplicate_contacts = 0
-            
+            unchanged_contacts = 0
+            echoes = 0
+            out_of_scope = 0
+            rebind = []  # Unchanged records: only the binding versions move
+            written = []  # GHL ids of the records in to_write
+            conflicts = []
+
             for c in contacts:
                 ghl_id = c.get("id")
                 if not ghl_id:
@@ -366,154 +1274,125 @@ class OdooGHLBackend(models.AbstractModel):
                 seen_ids.add(ghl_id)
                 new_contacts += 1
 
-                updated_at = self._parse_remote_dt(
-                    c.get("dateUpdated") or c.get("updatedAt")
-                )
+                updated_at = c["updated_at"]
                 
                 # Check if this contact already exists in Odoo
-                partner = Partner.search([("ghl_id", "=", ghl_id)], limit=1)
+                binding = bindings.get(ghl_id)
+                partner = Partner.browse(binding.res_id).with_prefetch(page_ids) if binding else None
                 
                 # Skip if not updated since last pull (only if contact already exists)
-                # This allows initial sync of all contacts, but prevents re-syncing unchanged contacts
-                if partner and latest and updated_at and updated_at <= latest:
+                # This allows initial sync of all contacts, but prevents re-syncing unchanged contacts.
+                # A reconciliation checks every record, only skipping echoes (see _is_echo)
+                if partner and latest and not reconcile and updated_at and updated_at <= latest:
                     continue
                 
                 if latest is None or (updated_at and updated_at > latest):
                     latest = updated_at
 
-                vals = {
-                    "name": c.get("contactName")
-                    or c.get("firstName")
-                    or c.get("fullNameLowerCase")
-                    or "Unknown",
-                    "email": c.get("email"),
-                    "phone": c.get("phone"),
-                    "street": c.get("address1"),
-                    "city": c.get("city"),
-                    "zip": c.get("postalCode"),
-                }
+                # GET /contacts/ cannot filter on tags: only the search endpoint
+                # can, with its own pagination, so the tags are matched here
+                wanted = not cfg["contact_tags"] or cfg["contact_tags"].intersection(c.get("tags") or [])
+                if not wanted or (partner and partner.id not in in_scope):
+                    out_of_scope += 1
+                    continue
 
-                # Country
-                country_code = c.get("country")
-                if country_code:
-                    country = self.env["res.country"].sudo().search(
-                        [("code", "=", country_code)], limit=1
-                    )
-                    if country:
-                        vals["country_id"] = country.id
-
-                # Tags
-                ghl_tags = c.get("tags") or []
-                if ghl_tags:
-                    tag_ids = []
-                    for tag_name in ghl_tags:
-                        tag = self.env["res.partner.category"].sudo().search([("name", "=", tag_name)], limit=1)
-                        if not tag:
-                            tag = self.env["res.partner.category"].sudo().create({"name": tag_name})
-                        tag_ids.append(tag.id)
-                    vals["category_id"] = [(6, 0, tag_ids)]
-
-                # Company (Try to link to existing company by name)
-                ghl_company = c.get("companyName")
-                if ghl_company:
-                    company_partner = self.env["res.partner"].sudo().search(
-                        [("name", "=", ghl_company), ("is_company", "=", True)], limit=1
-                    )
-                    if company_partner:
-                        vals["parent_id"] = company_partner.id
-                    # Optional: Create company if not found? For now, we only link if exists to avoid duplicates.
-
-                # Map GHL assigned user to Odoo user
-                ghl_assigned_to = c.get("assignedTo")
-                if ghl_assigned_to:
-                    user_mapping = self.env["ghl.user.mapping"].sudo().search([
-                        ("ghl_user_id", "=", ghl_assigned_to)
-                    ], limit=1)
-                    if user_mapping and user_mapping.odoo_user_id:
-                        vals["user_id"] = user_mapping.odoo_user_id.id
-                    else:
-                        vals["user_id"] = False  # User not mapped, unassign
-                else:
-                    vals["user_id"] = False  # No user assigned in GHL, unassign in Odoo
+                fingerprint = CONTACT_MAPPING.fingerprint(c)
+                if partner:
+                    if self._is_echo(binding, updated_at, fingerprint):
+                        echoes += 1
+                        continue
+                    if self._keep_local(partner, binding, updated_at, cfg):
+                        conflicts.append(partner)
+                        continue
+
+                vals = CONTACT_MAPPING.to_vals(c, lookups, partner)
+                versions = {
+                    "ghl_remote_updated_at": updated_at,
+                    "ghl_last_synced_at": self.env.cr.now(),
+                    "ghl_remote_hash": fingerprint,
+                }
 
                 if partner:
-                    partner.with_context(ghl_sync_running=True).write(vals)
-                else:
-                    vals.update(
-                        {
+                    vals = self._changed_vals(partner, vals)
+                    if not vals:
+                        unchanged_contacts += 1
+                        rebind.append({
+                            "res_id": partner.id,
                             "ghl_id": ghl_id,
-                            "ghl_remote_updated_at": updated_at,
-                            "ghl_last_synced_at": fields.Datetime.now(),
-                        }
-                    )
-                    Partner.with_context(ghl_sync_running=True).create(vals)
-
+                            "remote_updated_at": updated_at,
+                            "last_synced_at": versions["ghl_last_synced_at"],
+                            "remote_hash": fingerprint,
+                            "local_hash": CONTACT_MAPPING.local_fingerprint(partner),
+                        })
+                        continue
+                    to_write.append((partner, {**vals, **versions}))
+                    written.append(ghl_id)
+                else:
+                    to_create.append({**vals, **versions, "ghl_id": ghl_id})
+
+            applied += self._apply_pulled(Partner, to_write, to_create)
+            Binding._bind("res.partner", rebind)
+            self._bind_local_hashes(Partner, written + [vals["ghl_id"] for vals in to_create])
+            self._enqueue_push(
+                Partner.browse([record.id for record in conflicts]),
+                _("Changed in both Odoo and GoHighLevel, Odoo version kept"), state="draft",
+            )
+            guard.check(records=len(to_write) + len(to_create) + len(conflicts))
             total_fetched += new_contacts
-            _logger.info(f"Page {iteration}: {new_contacts} new, {duplicate_contacts} duplicates (total unique: {total_fetched})")
+            log_summary(
+                "contacts page", page=iteration, new=new_contacts, duplicates=duplicate_contacts,
+                unchanged=unchanged_contacts, echoes=echoes, out_of_scope=out_of_scope,
+                conflicts=len(conflicts), total=total_fetched,
+            )
             
             # Safety check: if all contacts were duplicates, stop
             if new_contacts == 0 and duplicate_contacts > 0:
                 _logger.warning(f"All contacts on this page were duplicates, stopping to prevent infinite loop.")
                 break
 
-            # Check for next page using nextPageUrl
-            meta = data.get("meta", {})
-            next_page_url = meta.get("nextPageUrl")
-            
-            if not next_page_url:
-                _logger.info(f"No more pages. Total unique contacts fetched: {total_fetched}")
-                break
-            
-            # Use the complete URL provided by GHL (already has all params)
-            url = next_page_url
-            params = {}  # Clear params - nextPageUrl already contains everything
-
-        if latest:
+            if self._sync_checkpoint(pages=iteration, records=total_fetched, total=total):
+                if not self._budget_exhausted():
+                    _logger.info("Sync run cancelled, stopping contact sync.")
+                    cancelled = True
+                    break
+                if next_url:
+                    self._set_resume(resume_key, {
+                        "url": next_url,
+                        "pages": iteration,
+                        "records": total_fetched,
+                        "latest": latest and latest.isoformat(),
+                    })
+                    _logger.info("Time budget used up, contact sync continues in the next slice.")
+                    resume = None
+                    cancelled = True
+                    break
+
+        pages.close()  # Stop the prefetch thread if we broke out early
+        self._save_page_size("contacts", sizer)
+        if resume:
+            self._set_resume(resume_key)  # The interrupted sweep is over
+
+        # A cancelled run has not seen every record: keep the old watermark
+        if latest and not cancelled and not reconcile:
             self._save_last_pull(contact=latest.isoformat())
+        return applied
 
     # =================================================================
     # OPPORTUNITIES – PUSH & PULL (SKELETON)
     # =================================================================
     @api.model
     def push_opportunity(self, lead):
-        cfg = self._get_config()
-        if not cfg["sync_opportunities"] or lead.ghl_skip_sync:
-            return
-        if cfg["sync_direction"] not in ("odoo_to_ghl", "both"):
-            return
+        """Push ``lead`` now (see ``push_records``), raising the first failure."""
+        self.push_records(lead, raise_errors=True)
 
+    @api.model
+    def _prepare_opportunity_push(self, lead, cfg, lookups=None):
+        """Return the (method, endpoint, payload) request pushing ``lead``."""
         payload = {
             "locationId": cfg["location_id"],
-            "name": lead.name,
-            "monetaryValue": lead.expected_revenue or 0.0,
-            "status": "open" if lead.active else "closed",
-            "status": "open" if lead.active else "closed",
-            "contactId": lead.partner_id and lead.partner_id.ghl_id or None,
+            **OPPORTUNITY_MAPPING.to_payload(lead, lookups or Lookups(self)),
         }
 
-        # Assignee
-        if lead.user_id:
-            mapping = self.env["ghl.user.mapping"].search([("odoo_user_id", "=", lead.user_id.id)], limit=1)
-            if mapping:
-                payload["assignedTo"] = mapping.ghl_user_id
-            else:
-                payload["assignedTo"] = None  # User not mapped, unassign
-        else:
-            payload["assignedTo"] = None  # No user assigned, unassign in GHL
-
-        # Pipeline & Stage
-        if lead.stage_id:
-            stage_mapping = self.env["ghl.pipeline.mapping"].search([("odoo_stage_id", "=", lead.stage_id.id)], limit=1)
-            if stage_mapping:
-                payload["pipelineId"] = stage_mapping.ghl_pipeline_id
-                payload["pipelineStageId"] = stage_mapping.ghl_stage_id  # Use pipelineStageId not stageId
-            else:
-                # Raise error if mapping is missing, otherwise GHL will reject with 422
-                raise UserError(_(
-                    "GoHighLevel Sync Error: No Pipeline Mapping found for Odoo Stage '%s'. "
-                    "Please go to GoHighLevel > Configuration > Pipeline Mapping and configure it."
-                ) % lead.stage_id.name)
-
         endpoint = "/opportunities/"  # TODO: confirm in your GHL docs
         method = "POST"
         if lead.ghl_id:
@@ -522,33 +1401,15 @@ class OdooGHLBackend(models.AbstractModel):
             # Remove locationId for PUT requests (GHL rejects it)
             payload.pop("locationId", None)
 
-        try:
-            data = self._request(method, endpoint, cfg["api_token"], payload=payload)
-        except Exception as e:
-            self.env["ghl.sync.queue"].create({
-                "name": lead.name,
-                "model_name": "crm.lead",
-                "record_id": lead.id,
-                "action": "push",
-                "error_message": str(e),
-                "state": "failed"
-            })
-            raise e
-        opp = data.get("opportunity") or data
-        ghl_id = opp.get("id")
-        updated_at = opp.get("updatedAt")
-
-        if ghl_id:
-            lead.with_context(ghl_sync_running=True).write(
-                {
-                    "ghl_id": ghl_id,
-                    "ghl_remote_updated_at": self._parse_remote_dt(updated_at),
-                    "ghl_last_synced_at": fields.Datetime.now(),
-                }
-            )
+        return method, endpoint, payload
 
     @api.model
-    def pull_opportunities(self, limit=100):
+    def pull_opportunities(self, limit=None):
+        """Pull the opportunities changed since the last pull, page by page.
+
+        The page size adapts to GHL's response times (see page_size),
+        unless a fixed ``limit`` is given.
+        """
         cfg = self._get_config()
         if not cfg["sync_opportunities"]:
             return
@@ -556,42 +1417,74 @@ class OdooGHLBackend(models.AbstractModel):
             return
 
         Lead = self.env["crm.lead"].sudo()
-        latest = cfg["last_opportunity_pull"] and self._parse_remote_dt(
-            cfg["last_opportunity_pull"]
-        )
+        Binding = self.env["ghl.binding"]
+        # A reconciliation pass ignores the watermark and keeps its own position
+        reconcile = self.env.context.get("ghl_reconcile")
+        resume_key = self._resume_key("reconcile_opportunities" if reconcile else "opportunities")
+        latest = None
+        if not reconcile and cfg["last_opportunity_pull"]:
+            latest = self._parse_remote_dt(cfg["last_opportunity_pull"])
+        # Continue where the previous cron slice stopped
+        resume = self._get_resume(resume_key)
+        if resume.get("latest"):
+            latest = self._parse_remote_dt(resume["latest"])
 
         # Pagination using nextPageUrl (GHL provides complete URL)
         url = "/opportunities/search"
         params = {
             "location_id": cfg["location_id"],
-            "limit": limit,
+            "limit": PULL_PAGE_SIZE,
         }
+        if len(cfg["pipeline_ids"]) == 1:
+            # A single pipeline is filtered by GHL, several on our side
+            params["pipeline_id"] = next(iter(cfg["pipeline_ids"]))
         
-        total_fetched = 0
+        if resume.get("url"):
+            url, params = resume["url"], {}
+
+        total_fetched = resume.get("records", 0)
+        applied = 0  # Records actually created or written
+        cancelled = False
         seen_ids = set()  # Track IDs to detect duplicates
         max_iterations = 1000  # Safety limit
-        iteration = 0
+        lookups = Lookups(self)  # Stage and user mappings, loaded once
+        sizer = self._page_sizer("opportunities", limit)
+        pages = self._iter_pages(
+            url, params, cfg["api_token"], ("opportunities", "items"), _normalize_opportunity,
+            prefetch=cfg["pull_prefetch_pages"], sizer=sizer,
+        )
+        # The prefetcher may fetch the next pages while this one is applied
+        guard = QueryGuard(self, "opportunities", extra_http=cfg["pull_prefetch_pages"])
         
-        while True:
-            iteration += 1
-            
+        for iteration, (opportunities, total, next_url) in enumerate(pages, resume.get("pages", 0) + 1):
+            guard.start()
             # Safety check: prevent infinite loops
             if iteration > max_iterations:
                 _logger.warning(f"Reached maximum iterations ({max_iterations}), stopping opportunity sync.")
                 break
             
-            _logger.info(f"Fetching opportunities page {iteration}...")
-            # Use /opportunities/search to list opportunities
-            data = self._request("GET", url, cfg["api_token"], params=params)
-            opportunities = data.get("opportunities") or data.get("items") or []
-            
             if not opportunities:
                 _logger.info(f"No more opportunities to fetch. Total fetched: {total_fetched}")
                 break
             
+            # Resolve existing leads and linked contacts of this page in one query each
+            bindings = Binding._get_bindings("crm.lead", [o["id"] for o in opportunities if o.get("id")])
+            page_ids = [b.res_id for b in bindings.values()]
+            # Bound records outside the sync scope are left alone
+            in_scope = set(self._filter_in_scope(Lead.browse(page_ids)).ids)
+            lookups.load_contacts([o["contactId"] for o in opportunities if o.get("contactId")])
+
             # Safety check: detect if we're getting duplicate opportunities
             new_opportunities = 0
+            to_write = []
+            to_create = []
             duplicate_opportunities = 0
+            unchanged_opportunities = 0
+            echoes = 0
+            out_of_scope = 0
+            rebind = []  # Unchanged records: only the binding versions move
+            written = []  # GHL ids of the records in to_write
+            conflicts = []
 
             for o in opportunities:
                 ghl_id = o.get("id")
@@ -606,92 +1499,106 @@ class OdooGHLBackend(models.AbstractModel):
                 seen_ids.add(ghl_id)
                 new_opportunities += 1
 
-                updated_at = self._parse_remote_dt(o.get("updatedAt"))
+                updated_at = o["updated_at"]
                 
                 # Check if this opportunity already exists in Odoo
-                lead = Lead.search([("ghl_id", "=", ghl_id)], limit=1)
+                binding = bindings.get(ghl_id)
+                lead = Lead.browse(binding.res_id).with_prefetch(page_ids) if binding else None
                 
                 # Skip if not updated since last pull (only if opportunity already exists)
-                # This allows initial sync of all opportunities, but prevents re-syncing unchanged ones
-                if lead and latest and updated_at and updated_at <= latest:
+                # This allows initial sync of all opportunities, but prevents re-syncing unchanged ones.
+                # A reconciliation checks every record, only skipping echoes (see _is_echo)
+                if lead and latest and not reconcile and updated_at and updated_at <= latest:
                     continue
                 
                 if latest is None or (updated_at and updated_at > latest):
                     latest = updated_at
 
-                vals = {
-                    "name": o.get("name"),
-                    "expected_revenue": o.get("monetaryValue") or 0.0,
-                    "type": "opportunity",
-                    "active": o.get("status") != "closed",
-                }
+                wanted = not cfg["pipeline_ids"] or o.get("pipelineId") in cfg["pipeline_ids"]
+                if not wanted or (lead and lead.id not in in_scope):
+                    out_of_scope += 1
+                    continue
 
-                contact_id = o.get("contactId")
-                if contact_id:
-                    partner = self.env["res.partner"].sudo().search(
-                        [("ghl_id", "=", contact_id)], limit=1
-                    )
-                    if partner:
-                        vals["partner_id"] = partner.id
-
-                # Map GHL stage to Odoo stage
-                ghl_pipeline_id = o.get("pipelineId")
-                ghl_stage_id = o.get("pipelineStageId")
-                if ghl_pipeline_id and ghl_stage_id:
-                    stage_mapping = self.env["ghl.pipeline.mapping"].sudo().search([
-                        ("ghl_pipeline_id", "=", ghl_pipeline_id),
-                        ("ghl_stage_id", "=", ghl_stage_id)
-                    ], limit=1)
-                    if stage_mapping and stage_mapping.odoo_stage_id:
-                        vals["stage_id"] = stage_mapping.odoo_stage_id.id
-
-                # Map GHL assigned user to Odoo user
-                ghl_assigned_to = o.get("assignedTo")
-                if ghl_assigned_to:
-                    user_mapping = self.env["ghl.user.mapping"].sudo().search([
-                        ("ghl_user_id", "=", ghl_assigned_to)
-                    ], limit=1)
-                    if user_mapping and user_mapping.odoo_user_id:
-                        vals["user_id"] = user_mapping.odoo_user_id.id
-                    else:
-                        vals["user_id"] = False  # User not mapped, unassign
-                else:
-                    vals["user_id"] = False  # No user assigned in GHL, unassign in Odoo
+                fingerprint = OPPORTUNITY_MAPPING.fingerprint(o)
+                if lead:
+                    if self._is_echo(binding, updated_at, fingerprint):
+                        echoes += 1
+                        continue
+                    if self._keep_local(lead, binding, updated_at, cfg):
+                        conflicts.append(lead)
+                        continue
+
+                vals = OPPORTUNITY_MAPPING.to_vals(o, lookups, lead)
+                versions = {
+                    "ghl_remote_updated_at": updated_at,
+                    "ghl_last_synced_at": self.env.cr.now(),
+                    "ghl_remote_hash": fingerprint,
+                }
 
                 if lead:
-                    lead.with_context(ghl_sync_running=True).write(vals)
-                else:
-                    vals.update(
-                        {
+                    vals = self._changed_vals(lead, vals)
+                    if not vals:
+                        unchanged_opportunities += 1
+                        rebind.append({
+                            "res_id": lead.id,
                             "ghl_id": ghl_id,
-                            "ghl_remote_updated_at": updated_at,
-                            "ghl_last_synced_at": fields.Datetime.now(),
-                        }
-                    )
-                    Lead.with_context(ghl_sync_running=True).create(vals)
-
+                            "remote_updated_at": updated_at,
+                            "last_synced_at": versions["ghl_last_synced_at"],
+                            "remote_hash": fingerprint,
+                            "local_hash": OPPORTUNITY_MAPPING.local_fingerprint(lead),
+                        })
+                        continue
+                    to_write.append((lead, {**vals, **versions}))
+                    written.append(ghl_id)
+                else:
+                    to_create.append({**vals, **versions, "ghl_id": ghl_id})
+
+            applied += self._apply_pulled(Lead, to_write, to_create)
+            Binding._bind("crm.lead", rebind)
+            self._bind_local_hashes(Lead, written + [vals["ghl_id"] for vals in to_create])
+            self._enqueue_push(
+                Lead.browse([record.id for record in conflicts]),
+                _("Changed in both Odoo and GoHighLevel, Odoo version kept"), state="draft",
+            )
+            guard.check(records=len(to_write) + len(to_create) + len(conflicts))
             total_fetched += new_opportunities
-            _logger.info(f"Page {iteration}: {new_opportunities} new, {duplicate_opportunities} duplicates (total unique: {total_fetched})")
+            log_summary(
+                "opportunities page", page=iteration, new=new_opportunities, duplicates=duplicate_opportunities,
+                unchanged=unchanged_opportunities, echoes=echoes, out_of_scope=out_of_scope,
+                conflicts=len(conflicts), total=total_fetched,
+            )
             
             # Safety check: if all opportunities were duplicates, stop
             if new_opportunities == 0 and duplicate_opportunities > 0:
                 _logger.warning(f"All opportunities on this page were duplicates, stopping to prevent infinite loop.")
                 break
 
-            # Check for next page using nextPageUrl
-            meta = data.get("meta", {})
-            next_page_url = meta.get("nextPageUrl")
-            
-            if not next_page_url:
-                _logger.info(f"No more pages. Total unique opportunities fetched: {total_fetched}")
-                break
-            
-            # Use the complete URL provided by GHL (already has all params)
-            url = next_page_url
-            params = {}  # Clear params - nextPageUrl already contains everything
-
-        if latest:
+            if self._sync_checkpoint(pages=iteration, records=total_fetched, total=total):
+                if not self._budget_exhausted():
+                    _logger.info("Sync run cancelled, stopping opportunity sync.")
+                    cancelled = True
+                    break
+                if next_url:
+                    self._set_resume(resume_key, {
+                        "url": next_url,
+                        "pages": iteration,
+                        "records": total_fetched,
+                        "latest": latest and latest.isoformat(),
+                    })
+                    _logger.info("Time budget used up, opportunity sync continues in the next slice.")
+                    resume = None
+                    cancelled = True
+                    break
+
+        pages.close()  # Stop the prefetch thread if we broke out early
+        self._save_page_size("opportunities", sizer)
+        if resume:
+            self._set_resume(resume_key)  # The interrupted sweep is over
+
+        # A cancelled run has not seen every record: keep the old watermark
+        if latest and not cancelled and not reconcile:
             self._save_last_pull(opportunity=latest.isoformat())
+        return applied
 
     # =================================================================
     # PIPELINES – FETCH
@@ -714,37 +1621,23 @@ class OdooGHLBackend(models.AbstractModel):
         return data.get("users", [])
     @api.model
     def push_task(self, task):
-        cfg = self._get_config()
-        if not cfg["sync_tasks"] or task.ghl_skip_sync:
-            return
-        if cfg["sync_direction"] not in ("odoo_to_ghl", "both"):
-            return
+        """Push ``task`` now (see ``push_records``), raising the first failure."""
+        self.push_records(task, raise_errors=True)
 
-        payload = {
-            "title": task.name,
-            "body": task.description or "",
-            "dueDate": task.date_deadline.isoformat() if task.date_deadline else None,
-            "completed": task.stage_id.fold if task.stage_id else False,
-        }
-        
-        # Assignee (use first user if multiple)
-        if task.user_ids:
-            user = task.user_ids[0]
-            mapping = self.env["ghl.user.mapping"].search([("odoo_user_id", "=", user.id)], limit=1)
-            if mapping:
-                payload["assignedTo"] = mapping.ghl_user_id
-            else:
-                payload["assignedTo"] = None  # User not mapped
-        else:
-            payload["assignedTo"] = None  # No user assigned
-        
+    @api.model
+    def _prepare_task_push(self, task, cfg, lookups=None):
+        """Return the (method, endpoint, payload) request pushing ``task``.
+
+        Returns None when the task cannot be pushed (no linked contact).
+        """
         # Related Contact (REQUIRED for GHL tasks)
         if not (task.partner_id and task.partner_id.ghl_id):
             # GHL tasks require a contact - skip if no contact linked
-            _logger.warning(f"Task '{task.name}' skipped: no contact linked (GHL tasks require contactId)")
-            return
+            _logger.debug("Task %s skipped: no contact linked (GHL tasks require contactId)", task.id)
+            return None
         
         contact_id = task.partner_id.ghl_id
+        payload = TASK_MAPPING.to_payload(task, lookups or Lookups(self))
 
         endpoint = f"/contacts/{contact_id}/tasks"
         method = "POST"
@@ -752,127 +1645,274 @@ class OdooGHLBackend(models.AbstractModel):
             endpoint = f"/contacts/{contact_id}/tasks/{task.ghl_id}"
             method = "PUT"
 
-        try:
-            data = self._request(method, endpoint, cfg["api_token"], payload=payload)
-        except Exception as e:
-            self.env["ghl.sync.queue"].create({
-                "name": task.name,
-                "model_name": "project.task",
-                "record_id": task.id,
-                "action": "push",
-                "error_message": str(e),
-                "state": "failed"
-            })
-            raise e
-        
-        t = data.get("task") or data
-        ghl_id = t.get("id")
-        updated_at = t.get("updatedAt")
-        if ghl_id:
-            task.with_context(ghl_sync_running=True).write({
-                "ghl_id": ghl_id,
-                "ghl_remote_updated_at": self._parse_remote_dt(updated_at),
-                "ghl_last_synced_at": fields.Datetime.now(),
-            })
+        return method, endpoint, payload
 
     @api.model
-    def pull_tasks(self):
+    def pull_tasks(self, partition=None):
         cfg = self._get_config()
         if not cfg["sync_tasks"]:
             return
         if cfg["sync_direction"] not in ("ghl_to_odoo", "both"):
             return
 
-        Task = self.env["project.task"].sudo()
+        # Partition workers only exist for the per-contact sweep
+        if cfg["task_pull_mode"] == "search" and not partition:
+            applied = self._search_tasks(cfg)
+            if applied is not None:
+                return applied
+        return self._sweep_tasks(cfg, partition)
+
+    @api.model
+    def _search_tasks(self, cfg):
+        """Pull the tasks of the whole location through the task search.
+
+        One request per page of tasks instead of one per linked contact;
+        the contacts are resolved locally from ``contactId``, and tasks not
+        updated since the last pull are skipped before any database work.
+        Returns None, before anything was pulled, when the location cannot
+        use the search endpoint, so the caller falls back to the sweep.
+        """
         Partner = self.env["res.partner"].sudo()
-        
-        # GHL tasks are contact-specific, so we need to fetch from each contact
-        # Get all contacts with ghl_id
-        contacts = Partner.search([("ghl_id", "!=", False)])
-        
-        latest = None
-        all_tasks = []
+        Binding = self.env["ghl.binding"]
+        resume_key = self._resume_key("tasks")
+        resume = self._get_resume(resume_key)
+        since = self._parse_remote_dt(cfg["last_task_pull"]) if cfg["last_task_pull"] else None
+        latest = self._parse_remote_dt(resume.get("latest")) or since
+        skip = resume.get("skip", 0)
+        total_fetched = resume.get("records", 0)
+        first_page = resume.get("pages", 0) + 1
+
+        endpoint = f"/locations/{cfg['location_id']}/tasks/search"
+        lookups = Lookups(self)  # Resolved once per run instead of once per task
+        guard = QueryGuard(self, "task_search")
+        applied = 0  # Records actually created or written
+        cancelled = False
+        max_iterations = 1000  # Safety limit
+        iteration = first_page
+        for iteration in range(first_page, first_page + max_iterations):
+            guard.start()
+            payload = {"limit": PULL_PAGE_SIZE, "skip": skip}
+            try:
+                data = self._request("POST", endpoint, cfg["api_token"], payload=payload)
+            except GHLAPIError as e:
+                if iteration == first_page and e.status_code in TASK_SEARCH_UNAVAILABLE:
+                    _logger.warning(
+                        "GHL task search unavailable (HTTP %s), pulling tasks contact by contact.",
+                        e.status_code,
+                    )
+                    return None
+                raise
+            page = data.get("tasks", [])
+            skip += len(page)
+
+            # Only tasks changed since the last pull cost database work
+            changed = []
+            for t in page:
+                t = {**t, "id": t.get("id") or t.get("_id")}
+                if not t["id"]:
+                    continue
+                updated_at = self._parse_remote_dt(t.get("updatedAt"))
+                if updated_at and (latest is None or updated_at > latest):
+                    latest = updated_at
+                if not (since and updated_at and updated_at <= since):
+                    changed.append(t)
+            total_fetched += len(page)
 
-        # Fetch tasks for each contact
-        for contact in contacts:
+            # Resolve the contacts of the page in one query, keeping those in scope
+            partner_ids = Binding._get_res_ids(
+                "res.partner", {t["contactId"] for t in changed if t.get("contactId")}
+            )
+            in_scope = set(self._filter_in_scope(Partner.browse(partner_ids.values())).ids)
+            pulled = [
+                (t, partner_ids[t.get("contactId")])
+                for t in changed
+                if partner_ids.get(t.get("contactId")) in in_scope
+            ]
+            changes, page_applied = self._apply_pulled_tasks(pulled, lookups)
+            applied += page_applied
+            guard.check(records=changes)
+            log_summary(
+                "tasks search page", page=iteration, fetched=len(page), changed=len(changed),
+                linked=len(pulled), applied=page_applied, total=total_fetched,
+            )
+
+            if len(page) < PULL_PAGE_SIZE:
+                break  # Last page
+            if self._sync_checkpoint(pages=iteration, records=total_fetched):
+                if self._budget_exhausted():
+                    self._set_resume(resume_key, {
+                        "skip": skip,
+                        "pages": iteration,
+                        "records": total_fetched,
+                        "latest": latest and latest.isoformat(),
+                    })
+                    _logger.info("Time budget used up, task sync continues in the next slice.")
+                    resume = None
+                else:
+                    _logger.info("Sync run cancelled, stopping task sync.")
+                cancelled = True
+                break
+        else:
+            _logger.warning(f"Reached maximum iterations ({max_iterations}), stopping task sync.")
+
+        if resume:
+            self._set_resume(resume_key)  # The interrupted search is over
+        if not cancelled:
+            self._sync_checkpoint(pages=iteration, records=total_fetched, total=total_fetched)
+            if latest:
+                self._save_last_pull(task=latest.isoformat())
+        return applied
+
+    @api.model
+    def _sweep_tasks(self, cfg, partition=None):
+        """Pull the tasks contact by contact (``GET /contacts/{id}/tasks``)."""
+        # Get the next contacts with ghl_id (or those of one partition), after
+        # those a previous cron slice already swept
+        resume_key = self._resume_key("tasks", partition)
+        resume = self._get_resume(resume_key)
+        contacts, next_after_id = self._get_sweep_contacts(partition, after_id=resume.get("after_id", 0))
+        done = resume.get("records", 0)
+        swept = done + len(contacts)
+        
+        # Lookups resolved once per run instead of once per task
+        lookups = Lookups(self)
+
+        latest = self._parse_remote_dt(resume.get("latest")) or None
+
+        # Fetch tasks for each contact, applied one batch of contacts at a time
+        applied = 0  # Records actually created or written
+        changes = 0  # Records sent to _apply_pulled in the current batch
+        pulled = []  # (GHL task, contact id) of the current batch
+        cancelled = False
+        guard = QueryGuard(self, "tasks")
+        failed = []  # Contacts whose tasks could not be fetched
+        for index, contact in enumerate(contacts):
+            if index and index % CONTACT_SWEEP_BATCH == 0:
+                changes, batch_applied = self._apply_pulled_tasks(pulled, lookups)
+                applied += batch_applied
+                pulled = []
+                guard.check(records=changes, units=CONTACT_SWEEP_BATCH)
+                changes = 0
+            if index and index % CONTACT_SWEEP_BATCH == 0 and self._sync_checkpoint(
+                pages=(done + index) // CONTACT_SWEEP_BATCH, records=done + index, total=swept
+            ):
+                if self._budget_exhausted():
+                    self._set_resume(resume_key, {
+                        "after_id": contacts[index - 1].id,
+                        "records": done + index,
+                        "latest": latest and latest.isoformat(),
+                    })
+                    _logger.info("Time budget used up, task sync continues in the next slice.")
+                    resume = None
+                else:
+                    _logger.info("Sync run cancelled, stopping task sync.")
+                cancelled = True
+                break
             try:
                 endpoint = f"/contacts/{contact.ghl_id}/tasks"
                 data = self._request("GET", endpoint, cfg["api_token"])
-                tasks = data.get("tasks", [])
-                
+                tasks = [t for t in data.get("tasks", []) if t.get("id")]
                 for t in tasks:
-                    ghl_id = t.get("id")
-                    if not ghl_id:
-                        continue
-
                     updated_at = self._parse_remote_dt(t.get("updatedAt"))
                     if latest is None or (updated_at and updated_at > latest):
                         latest = updated_at
 
-                    task = Task.search([("ghl_id", "=", ghl_id)], limit=1)
-
-                    vals = {
-                        "name": t.get("title") or "Untitled Task",
-                        "description": t.get("body"),
-                        "partner_id": contact.id,  # Link to the contact we're fetching from
-                    }
-                    
-                    # Parse due date
-                    due_date_str = t.get("dueDate")
-                    if due_date_str:
-                        due_date = self._parse_remote_dt(due_date_str)
-                        if due_date:
-                            vals["date_deadline"] = due_date
-                        else:
-                            _logger.warning(f"Failed to parse dueDate: {due_date_str}")
-                    else:
-                        _logger.debug(f"Task {t.get('title')} has no dueDate")
-
-                    # Map assigned user
-                    ghl_assigned_to = t.get("assignedTo")
-                    if ghl_assigned_to:
-                        user_mapping = self.env["ghl.user.mapping"].sudo().search([
-                            ("ghl_user_id", "=", ghl_assigned_to)
-                        ], limit=1)
-                        if user_mapping and user_mapping.odoo_user_id:
-                            vals["user_ids"] = [(6, 0, [user_mapping.odoo_user_id.id])]
-                        else:
-                            vals["user_ids"] = [(5, 0, 0)]  # Clear all users
-                    else:
-                        vals["user_ids"] = [(5, 0, 0)]  # Clear all users
-
-                    # Completion status (map to folded stage)
-                    if t.get("completed"):
-                        done_stage = self.env["project.task.type"].sudo().search([
-                            ("fold", "=", True)
-                        ], limit=1)
-                        if done_stage:
-                            vals["stage_id"] = done_stage.id
-                    
-                    if task:
-                        task.with_context(ghl_sync_running=True).write(vals)
-                    else:
-                        vals.update({
-                            "ghl_id": ghl_id,
-                            "ghl_remote_updated_at": updated_at,
-                            "ghl_last_synced_at": fields.Datetime.now(),
-                        })
-                        Task.with_context(ghl_sync_running=True).create(vals)
+                # Link to the contact we're fetching from
+                pulled.extend((t, contact.id) for t in tasks)
+            except GHLCircuitOpenError:
+                raise  # GHL is down: no point trying the remaining contacts
             except Exception as e:
-                _logger.error(f"Error fetching tasks for contact {contact.name}: {str(e)}")
+                failed.append(contact.id)
+                _logger.debug("Error fetching tasks for contact %s: %s", contact.id, redact_text(e))
+                continue
+        if not cancelled:
+            changes, batch_applied = self._apply_pulled_tasks(pulled, lookups)
+            applied += batch_applied
+
+        log_summary(
+            "tasks sweep", level=logging.WARNING if failed else logging.INFO,
+            partition=partition and partition[0], contacts=len(contacts), applied=applied,
+            failed=len(failed), failed_contacts=",".join(map(str, failed[:20])),
+        )
+        if next_after_id and not cancelled:
+            # More contacts than one call fetches: continue after them
+            self._set_resume(resume_key, {
+                "after_id": next_after_id,
+                "records": swept,
+                "latest": latest and latest.isoformat(),
+            })
+        elif resume:
+            self._set_resume(resume_key)  # The interrupted sweep is over
+        if not cancelled:
+            if contacts:
+                guard.check(records=changes, units=(len(contacts) - 1) % CONTACT_SWEEP_BATCH + 1)
+            self._sync_checkpoint(
+                pages=(swept + CONTACT_SWEEP_BATCH - 1) // CONTACT_SWEEP_BATCH,
+                records=swept,
+                total=swept,
+            )
+        if latest and not cancelled and not next_after_id:
+            if partition:
+                # The watermark moves once every partition is swept
+                self.env["ghl.sync.partition"].sudo()._record_latest("tasks", partition[0], latest)
+            else:
+                self._save_last_pull(task=latest.isoformat())
+        return applied
+
+    @api.model
+    def _apply_pulled_tasks(self, pulled, lookups):
+        """Create or update tasks from (GHL task, Odoo contact id) pairs.
+
+        Returns the number of records sent to ``_apply_pulled`` and the
+        number actually applied.
+        """
+        if not pulled:
+            return 0, 0
+        Task = self.env["project.task"].sudo()
+        # Resolve existing tasks for the whole page in one query
+        existing = {
+            ghl_id: Task.browse(res_id)
+            for ghl_id, res_id in self.env["ghl.binding"]._get_res_ids(
+                "project.task", [t["id"] for t, _partner_id in pulled]
+            ).items()
+        }
+        # Bound tasks outside the sync scope are left alone
+        in_scope = self._filter_in_scope(Task.browse([task.id for task in existing.values()]))
+
+        to_write = []
+        to_create = []
+        for t, partner_id in pulled:
+            task = existing.get(t["id"])
+            if task and task not in in_scope:
                 continue
 
-        if latest:
-            self._save_last_pull(task=latest.isoformat())
+            vals = TASK_MAPPING.to_vals(t, lookups, task)
+            vals["partner_id"] = partner_id
+            versions = {
+                "ghl_remote_updated_at": self._parse_remote_dt(t.get("updatedAt")),
+                "ghl_last_synced_at": self.env.cr.now(),
+            }
+
+            if task:
+                vals = self._changed_vals(task, vals)
+                if vals:
+                    to_write.append((task, {**vals, **versions}))
+            else:
+                to_create.append({**vals, **versions, "ghl_id": t["id"]})
+        return len(to_write) + len(to_create), self._apply_pulled(Task, to_write, to_create)
 
     @api.model
     def push_note(self, note):
-        cfg = self._get_config()
-        if not cfg["sync_notes"] or note.ghl_skip_sync:
-            return
-        if cfg["sync_direction"] not in ("odoo_to_ghl", "both"):
-            return
+        """Push ``note`` now (see ``push_records``); failures are only queued."""
+        self.push_records(note)
+
+    @api.model
+    def _prepare_note_push(self, note, cfg, lookups=None):
+        """Return the (method, endpoint, payload) request pushing ``note``.
 
+        Returns None when there is nothing to push (no linked GHL contact or
+        an empty body).
+        """
         # Identify Contact ID from the note's related record
         contact_id = None
         if note.model == 'res.partner':
@@ -885,14 +1925,14 @@ class OdooGHLBackend(models.AbstractModel):
                 contact_id = lead.partner_id.ghl_id
         
         if not contact_id:
-            return # Skip if no linked GHL contact found
+            return None # Skip if no linked GHL contact found
 
         # Clean HTML from body (GHL notes are text-based)
         clean_body = re.sub('<[^<]+?>', '', note.body or "")
         clean_body = clean_body.strip()
         
         if not clean_body:
-            return
+            return None
 
         payload = {
             "body": clean_body,
@@ -900,10 +1940,10 @@ class OdooGHLBackend(models.AbstractModel):
         
         # Map User (Author)
         if note.author_id and note.author_id.user_ids:
-            odoo_user = note.author_id.user_ids[0]
-            mapping = self.env["ghl.user.mapping"].search([("odoo_user_id", "=", odoo_user.id)], limit=1)
-            if mapping:
-                payload["userId"] = mapping.ghl_user_id
+            lookups = lookups or Lookups(self)
+            ghl_user_id = lookups.ghl_by_user.get(note.author_id.user_ids[0].id)
+            if ghl_user_id:
+                payload["userId"] = ghl_user_id
 
         endpoint = f"/contacts/{contact_id}/notes"
         method = "POST"
@@ -911,144 +1951,346 @@ class OdooGHLBackend(models.AbstractModel):
             endpoint = f"/contacts/{contact_id}/notes/{note.ghl_id}"
             method = "PUT"
 
-        try:
-            data = self._request(method, endpoint, cfg["api_token"], payload=payload)
-            n = data.get("note") or data
-            ghl_id = n.get("id")
-            updated_at = n.get("dateAdded") # GHL returns dateAdded for notes usually
-            
-            if ghl_id:
-                note.with_context(ghl_sync_running=True).write(
-                    {
-                        "ghl_id": ghl_id,
-                        "ghl_remote_updated_at": self._parse_remote_dt(updated_at) if updated_at else fields.Datetime.now(),
-                        "ghl_last_synced_at": fields.Datetime.now(),
-                    }
-                )
-        except Exception as e:
-            _logger.error(f"Error pushing note {note.id}: {str(e)}")
+        return method, endpoint, payload
 
     @api.model
-    def pull_notes(self):
+    def pull_notes(self, partition=None):
         cfg = self._get_config()
         if not cfg["sync_notes"]:
             return
         if cfg["sync_direction"] not in ("ghl_to_odoo", "both"):
             return
             
-        Partner = self.env["res.partner"].sudo()
         MailMessage = self.env["mail.message"].sudo()
+        Binding = self.env["ghl.binding"]
         
-        # Get all contacts with ghl_id
-        contacts = Partner.search([("ghl_id", "!=", False)])
+        # Get the next contacts with ghl_id (or those of one partition), after
+        # those a previous cron slice already swept
+        resume_key = self._resume_key("notes", partition)
+        resume = self._get_resume(resume_key)
+        contacts, next_after_id = self._get_sweep_contacts(partition, after_id=resume.get("after_id", 0))
+        done = resume.get("records", 0)
+        swept = done + len(contacts)
         
-        latest = None
+        # Lookups resolved once per run instead of once per note
+        user_map = self._get_ghl_user_map()
+        note_subtype_id = self.env.ref("mail.mt_note").id
+        opportunity_map = None  # Built lazily, only if a new note shows up
+
+        latest = self._parse_remote_dt(resume.get("latest")) or None
         
-        for contact in contacts:
+        applied = 0  # Records actually created or written
+        changes = 0  # Records sent to _apply_pulled in the current batch
+        cancelled = False
+        guard = QueryGuard(self, "notes")
+        failed = []  # Contacts whose notes could not be fetched or applied
+        for index, contact in enumerate(contacts):
+            if index and index % CONTACT_SWEEP_BATCH == 0:
+                guard.check(records=changes, units=CONTACT_SWEEP_BATCH)
+                changes = 0
+            if index and index % CONTACT_SWEEP_BATCH == 0 and self._sync_checkpoint(
+                pages=(done + index) // CONTACT_SWEEP_BATCH, records=done + index, total=swept
+            ):
+                if self._budget_exhausted():
+                    self._set_resume(resume_key, {
+                        "after_id": contacts[index - 1].id,
+                        "records": done + index,
+                        "latest": latest and latest.isoformat(),
+                    })
+                    _logger.info("Time budget used up, note sync continues in the next slice.")
+                    resume = None
+                else:
+                    _logger.info("Sync run cancelled, stopping note sync.")
+                cancelled = True
+                break
             try:
                 endpoint = f"/contacts/{contact.ghl_id}/notes"
                 data = self._request("GET", endpoint, cfg["api_token"])
-                notes = data.get("notes", [])
-                
-                for n in notes:
-                    ghl_id = n.get("id")
-                    body = n.get("body", "")
-                    date_added = n.get("dateAdded")
-                    user_id = n.get("userId")
-                    
-                    if not ghl_id:
-                        continue
-                        
-                    # Check if exists
-                    existing = MailMessage.search([("ghl_id", "=", ghl_id)], limit=1)
-                    if existing:
-                        continue # Skip updates for now, notes are usually immutable or append-only in this context
-                    
-                    # Map Author
-                    author_id = None
-                    if user_id:
-                        mapping = self.env["ghl.user.mapping"].search([("ghl_user_id", "=", user_id)], limit=1)
-                        if mapping and mapping.odoo_user_id:
-                            author_id = mapping.odoo_user_id.partner_id.id
-                            
-                    # Check for active opportunity
-                    opportunity = self.env["crm.lead"].search([
-                        ("partner_id", "=", contact.id),
-                        ("type", "=", "opportunity"),
-                        ("stage_id.is_won", "=", False), # Not Won
-                        ("active", "=", True), # Not Archived
-                        ("probability", "<", 100), # Not Won (double check)
-                        ("probability", ">", 0), # Not Lost (usually)
-                    ], order="write_date desc", limit=1)
-
-                    # Create Note in Odoo
+                notes = [n for n in data.get("notes", []) if n.get("id")]
+                if not notes:
+                    continue
+
+                # Check which notes already exist in a single query
+                existing_ids = set(Binding._get_res_ids("mail.message", [n["id"] for n in notes]))
+                new_notes = [n for n in notes if n["id"] not in existing_ids]
+                if not new_notes:
+                    continue # Skip updates for now, notes are usually immutable or append-only in this context
+
+                if opportunity_map is None:
+                    opportunity_map = self._get_active_opportunity_map(contacts)
+                opportunity_id = opportunity_map.get(contact.id)
+
+                vals_list = []
+                for n in new_notes:
+                    date_added = self._parse_remote_dt(n.get("dateAdded"))
                     vals = {
                         "model": "res.partner",
                         "res_id": contact.id,
                         "message_type": "comment",
-                        "subtype_id": self.env.ref("mail.mt_note").id,
-                        "body": f"<p>{body}</p>", # Wrap in p tag
-                        "ghl_id": ghl_id,
-                        "ghl_remote_updated_at": self._parse_remote_dt(date_added),
-                        "ghl_last_synced_at": fields.Datetime.now(),
+                        "subtype_id": note_subtype_id,
+                        "body": f"<p>{n.get('body', '')}</p>", # Wrap in p tag
+                        "ghl_id": n["id"],
+                        "ghl_remote_updated_at": date_added,
+                        "ghl_last_synced_at": self.env.cr.now(),
                     }
-                    
-                    if opportunity:
+                    if opportunity_id:
                         vals["model"] = "crm.lead"
-                        vals["res_id"] = opportunity.id
-                        
-                    if author_id:
-                        vals["author_id"] = author_id
-                        
-                    MailMessage.with_context(ghl_sync_running=True).create(vals)
-                    
+                        vals["res_id"] = opportunity_id
+
+                    # Map Author
+                    user = user_map.get(n.get("userId"))
+                    if user:
+                        vals["author_id"] = user.partner_id.id
+                    vals_list.append(vals)
+
                     # Track latest for timestamp
-                    dt = self._parse_remote_dt(date_added)
-                    if dt and (latest is None or dt > latest):
-                        latest = dt
+                    if date_added and (latest is None or date_added > latest):
+                        latest = date_added
+
+                changes += len(vals_list)
+                applied += self._apply_pulled(MailMessage, [], vals_list)
                         
+            except GHLCircuitOpenError:
+                raise  # GHL is down: no point trying the remaining contacts
             except Exception as e:
-                _logger.error(f"Error fetching notes for contact {contact.name}: {str(e)}")
+                failed.append(contact.id)
+                _logger.debug("Error fetching notes for contact %s: %s", contact.id, redact_text(e))
                 continue
 
-        if latest:
-            self._save_last_pull(note=latest.isoformat())
+        log_summary(
+            "notes sweep", level=logging.WARNING if failed else logging.INFO,
+            partition=partition and partition[0], contacts=len(contacts), applied=applied,
+            failed=len(failed), failed_contacts=",".join(map(str, failed[:20])),
+        )
+        if next_after_id and not cancelled:
+            # More contacts than one call fetches: continue after them
+            self._set_resume(resume_key, {
+                "after_id": next_after_id,
+                "records": swept,
+                "latest": latest and latest.isoformat(),
+            })
+        elif resume:
+            self._set_resume(resume_key)  # The interrupted sweep is over
+        if not cancelled:
+            if contacts:
+                guard.check(records=changes, units=(len(contacts) - 1) % CONTACT_SWEEP_BATCH + 1)
+            self._sync_checkpoint(
+                pages=(swept + CONTACT_SWEEP_BATCH - 1) // CONTACT_SWEEP_BATCH,
+                records=swept,
+                total=swept,
+            )
+        if latest and not cancelled and not next_after_id:
+            if partition:
+                # The watermark moves once every partition is swept
+                self.env["ghl.sync.partition"].sudo()._record_latest("notes", partition[0], latest)
+            else:
+                self._save_last_pull(note=latest.isoformat())
+        return applied
+
+    @api.model
+    def _get_active_opportunity_map(self, partners):
+        """Map partner id -> id of its most recently updated open opportunity."""
+        leads = self.env["crm.lead"].search([
+            ("partner_id", "in", partners.ids),
+            ("type", "=", "opportunity"),
+            ("stage_id.is_won", "=", False), # Not Won
+            ("active", "=", True), # Not Archived
+            ("probability", "<", 100), # Not Won (double check)
+            ("probability", ">", 0), # Not Lost (usually)
+        ], order="write_date desc")
+        opportunity_map = {}
+        for lead in leads:
+            opportunity_map.setdefault(lead.partner_id.id, lead.id)
+        return opportunity_map
 
     # =================================================================
     # CRONS + MANUAL SYNC BUTTON
     # =================================================================
     @api.model
-    def cron_poll_changes(self):
-        """Called by cron: incremental polling GHL → Odoo."""
+    def _get_cron_interval(self, cfg):
+        """Minutes between cron wake-ups: the fastest allowed poll rate."""
+        if cfg["adaptive_polling"]:
+            return max(cfg["poll_min_minutes"], 1)
+        return max(cfg["poll_interval_minutes"], 1)
+
+    @api.model
+    def _is_poll_due(self, entity, cfg, now):
+        if not cfg["adaptive_polling"]:
+            return True
+        next_poll = self.env["ghl.sync.state"].sudo()._get(entity).get("next_poll")
+        return not next_poll or next_poll <= now
+
+    @api.model
+    def _reschedule_poll(self, entity, changes, cfg, now):
+        """Adapt the entity's poll interval to the change rate just observed.
+
+        Busy feeds (at least ADAPTIVE_BUSY_CHANGES changes) halve the
+        interval, empty feeds grow it by half, anything in between keeps
+        it; the result always stays within the configured min/max bounds.
+        The poll itself is recorded either way.
+        """
+        State = self.env["ghl.sync.state"].sudo()
+        if not cfg["adaptive_polling"]:
+            State._set(entity, last_run_at=now, last_changes=changes)
+            return
+        low, high = cfg["poll_min_minutes"], max(cfg["poll_max_minutes"], cfg["poll_min_minutes"])
+        interval = State._get(entity).get("poll_interval") or low
+        if changes >= ADAPTIVE_BUSY_CHANGES:
+            interval /= 2
+        elif not changes:
+            interval *= 1.5
+        interval = min(max(interval, low), high)
+        State._set(
+            entity,
+            poll_interval=round(interval, 2),
+            next_poll=now + timedelta(minutes=interval),
+            last_run_at=now,
+            last_changes=changes,
+        )
+        _logger.info(f"GHL {entity}: {changes} changes, next poll in {interval:.1f} minutes")
+
+    @api.model
+    def _sync_worker_active(self):
+        """Whether a dedicated sync worker process runs the sync loop.
+
+        The worker holds an advisory lock on its own connection, released
+        by Postgres when the process dies, so the crons take over again.
+        """
+        if self.env.context.get("ghl_sync_worker_process"):
+            return False  # Called by the worker itself
+        cr = self.env.cr
+        cr.execute("SELECT pg_try_advisory_lock(%s)", (SYNC_WORKER_LOCK,))
+        if not cr.fetchone()[0]:
+            return True
+        cr.execute("SELECT pg_advisory_unlock(%s)", (SYNC_WORKER_LOCK,))
+        return False
+
+    @api.model
+    def cron_poll_changes(self, force=False):
+        """Called by cron: incremental polling GHL → Odoo.
+
+        With adaptive polling only entities whose next poll is due are
+        pulled, unless ``force`` is set. The work is bounded by the cron
+        time budget: a pull that runs out of time records where it stopped,
+        and the cron re-triggers itself to continue in a fresh slice.
+        Does nothing while the dedicated sync worker is running.
+        """
+        if self._sync_worker_active():
+            return
+        self = self._with_budget()._with_lane("poll")
         cfg = self._get_config()
         
-        # Update cron interval dynamically from settings
+        # Keep the cron interval in line with the settings
         try:
+            interval = self._get_cron_interval(cfg)
             cron = self.env.ref('odoo_gohighlevel_connector.ir_cron_odoo_ghl_poll_changes', raise_if_not_found=False)
-            if cron and cron.interval_number != cfg.get("poll_interval_minutes", 10):
+            if cron and cron.interval_number != interval:
                 cron.sudo().write({
-                    'interval_number': cfg.get("poll_interval_minutes", 10)
+                    'interval_number': interval
                 })
-                _logger.info(f"Cron interval updated to {cfg.get('poll_interval_minutes', 10)} minutes")
+                _logger.info(f"Cron interval updated to {interval} minutes")
         except Exception as e:
             _logger.warning(f"Could not update cron interval: {str(e)}")
         
-        if cfg["sync_contacts"]:
-            self.pull_contacts()
-        if cfg["sync_opportunities"]:
-            self.pull_opportunities()
-        if cfg["sync_tasks"]:
-            self.pull_tasks()
-        if cfg["sync_notes"]:
-            self.pull_notes()
+        now = fields.Datetime.now()
+        Partition = self.env["ghl.sync.partition"].sudo()
+        partitioned = set()
+        if Partition._get_settings()["count"] > 1:
+            partitioned = {entity for entity, _label in PARTITIONED_ENTITIES}
+            if cfg["task_pull_mode"] == "search":
+                partitioned.discard("tasks")  # One search, nothing to split
+        sliced = False
+        try:
+            for entity, method in ENTITY_PULLS.items():
+                if not cfg[f"sync_{entity}"]:
+                    continue
+                resuming = bool(self._get_resume(self._resume_key(entity)))
+                if not (force or resuming or self._is_poll_due(entity, cfg, now)):
+                    continue
+                if self._budget_exhausted():
+                    sliced = True  # Still due: picked up by the next slice
+                    break
+                if entity in partitioned:
+                    # Swept by the partition worker crons, reporting the
+                    # changes of their previous round
+                    changes = Partition._schedule(entity)
+                else:
+                    changes = getattr(self, method)() or 0
+                    if self._get_resume(self._resume_key(entity)):
+                        sliced = True
+                        break
+                self._reschedule_poll(entity, changes, cfg, now)
+        except GHLCircuitOpenError:
+            _logger.info("GHL circuit breaker is open, skipping this poll.")
+            return
+        if sliced:
+            self.env.ref("odoo_gohighlevel_connector.ir_cron_odoo_ghl_poll_changes").sudo()._trigger()
 
     @api.model
     def cron_nightly_reconciliation(self):
-        """Called nightly to reset timestamps and re-poll."""
-        self.env["res.config.settings"]._reset_last_pull()
-        self.cron_poll_changes()
+        """Called nightly to reset timestamps and re-poll.
+
+        Interrupted sweeps restart from scratch, and every entity is made
+        due so slices continued by the poll cron still cover all of them.
+        With more than one reconciliation slice, a rolling pass runs instead.
+        Both run in the bulk lane, behind interactive pushes and polls.
+        """
+        self = self._with_lane("bulk")
+        cfg = self._get_config()
+        if cfg["reconcile_slices"] > 1:
+            self._rolling_reconciliation(cfg)
+            return
+        self.env["ghl.sync.state"].sudo()._reset(ENTITY_PULLS)
+        self.cron_poll_changes(force=True)
+
+    @api.model
+    def _rolling_reconciliation(self, cfg):
+        """Re-scan 1/N of the contacts and opportunities, without watermark.
+
+        Each night continues the full scan of every entity where the
+        previous night stopped, for about 1/N of its bound records, so the
+        whole dataset is verified every N nights. The night is also capped
+        by its own time budget and GHL call budget: whatever they cut off
+        is picked up the next night.
+        """
+        slices = cfg["reconcile_slices"]
+        context = {"ghl_reconcile": True}
+        if cfg["reconcile_time_budget_seconds"] > 0:
+            context["ghl_deadline"] = time.monotonic() + cfg["reconcile_time_budget_seconds"]
+        max_calls = cfg["reconcile_max_calls"]
+        call_limit = http_call_count() + max_calls if max_calls > 0 else None
+        self = self.with_context(**context)
+        Binding = self.env["ghl.binding"].sudo()
+        for entity in ROLLING_RECONCILE_ENTITIES:
+            if not cfg[f"sync_{entity}"]:
+                continue
+            if self._budget_exhausted() or (call_limit and http_call_count() >= call_limit):
+                _logger.warning("GHL reconciliation budget used up before %s, it lags behind.", entity)
+                break
+            method = ENTITY_PULLS[entity]
+            bound = Binding.search_count([("model", "=", PULL_MODELS[entity])])
+            # One call per page: this night's share of the pages, at the
+            # page size the entity's pulls settled on
+            page_size = self.env["ghl.sync.state"].sudo()._get(entity).get("page_size") or DEFAULT_PAGE_SIZE
+            pages = math.ceil(bound / page_size / slices) + 1
+            limit = http_call_count() + pages
+            if call_limit:
+                limit = min(limit, call_limit)
+            try:
+                getattr(self.with_context(ghl_call_limit=limit), method)()
+            except GHLCircuitOpenError:
+                _logger.info("GHL circuit breaker is open, skipping tonight's reconciliation.")
+                return
+            position = self._get_resume(self._resume_key(f"reconcile_{entity}"))
+            _logger.info(
+                "GHL %s reconciliation: %s",
+                entity,
+                f"continues from page {position.get('pages', 0) + 1} next night" if position else "full pass done",
+            )
 
     @api.model
     def manual_sync_now(self):
-        """Called from Settings 'Sync Now' button."""
-        self.cron_poll_changes()
+        """Queue a background run of every enabled entity and return it."""
+        run = self.env["ghl.sync.run"].create({})
+        run.action_start()
+        return run
@@ -0,0 +1,183 @@
+# odoo_gohighlevel_connector/models/circuit_breaker.py
+import logging
+import time
+
+from odoo import _, api, fields, models
+from odoo.exceptions import UserError
+
+from .request_log import redact_text
+
+_logger = logging.getLogger(__name__)
+
+# Per-process copy of the breaker row, refreshed every CACHE_TTL seconds so
+# the closed (normal) path does not cost a query per API call.
+# {dbname: (fetched_at, state, failure_count)}
+_breaker_cache = {}
+CACHE_TTL = 5
+
+# Whether the cooldown (both parameters, in seconds) lets a probe through
+PROBE_DUE = """
+    ((state = 'open' AND opened_at <= (now() at time zone 'UTC') - make_interval(secs => %s))
+     OR (state = 'half_open' AND probe_at <= (now() at time zone 'UTC') - make_interval(secs => %s)))
+"""
+
+
+class GHLCircuitOpenError(UserError):
+    """Raised instead of calling GHL while the circuit breaker is open."""
+
+
+class GHLCircuitBreaker(models.Model):
+    """Circuit breaker around the GoHighLevel API, shared by all workers.
+
+    The state is a single row updated through a separate cursor, so a
+    failure is recorded even when the transaction that hit it rolls back.
+    """
+
+    _name = "ghl.circuit.breaker"
+    _description = "GoHighLevel Circuit Breaker"
+
+    state = fields.Selection([
+        ('closed', 'Closed'),
+        ('open', 'Open'),
+        ('half_open', 'Half-Open (probing)'),
+    ], string="State", default='closed', required=True)
+    failure_count = fields.Integer(string="Consecutive Failures")
+    opened_at = fields.Datetime(string="Opened At")
+    probe_at = fields.Datetime(string="Last Probe At")
+    last_failure_at = fields.Datetime(string="Last Failure At")
+    last_error = fields.Text(string="Last Error")
+
+    @api.model
+    def _get_settings(self):
+        ICP = self.env["ir.config_parameter"].sudo()
+        return {
+            "failure_threshold": int(ICP.get_param("odoo_ghl.circuit_failure_threshold", default="5")),
+            "cooldown": int(ICP.get_param("odoo_ghl.circuit_cooldown_seconds", default="60")),
+            "slow_call": float(ICP.get_param("odoo_ghl.circuit_slow_call_seconds", default="10")),
+        }
+
+    @api.model
+    def _get_breaker_id(self):
+        return self.env.ref("odoo_gohighlevel_connector.ghl_circuit_breaker_main").id
+
+    @api.model
+    def _execute(self, query, params):
+        """Run ``query`` on its own committed cursor and refresh the cache."""
+        with self.env.registry.cursor() as cr:
+            cr.execute(query, params)
+            row = cr.fetchone()
+        if row:
+            _breaker_cache[self.env.cr.dbname] = (time.monotonic(), row[0], row[1])
+        return row
+
+    @api.model
+    def _get_cached_state(self):
+        cached = _breaker_cache.get(self.env.cr.dbname)
+        if cached and time.monotonic() - cached[0] < CACHE_TTL:
+            return cached[1], cached[2]
+        self.env.cr.execute(
+            "SELECT state, failure_count FROM ghl_circuit_breaker WHERE id = %s",
+            (self._get_breaker_id(),),
+        )
+        state, failure_count = self.env.cr.fetchone() or ("closed", 0)
+        _breaker_cache[self.env.cr.dbname] = (time.monotonic(), state, failure_count)
+        return state, failure_count
+
+    @api.model
+    def _is_available(self):
+        """True unless the breaker is open and still cooling down.
+
+        Past the cooldown (of the opening, or of a half-open probe that
+        never reported back) callers may go ahead: ``_before_call`` lets
+        exactly one of them through as the probe.
+        """
+        state, _failures = self._get_cached_state()
+        if state == "closed":
+            return True
+        cooldown = self._get_settings()["cooldown"]
+        self.env.cr.execute(
+            f"SELECT 1 FROM ghl_circuit_breaker WHERE id = %s AND {PROBE_DUE}",
+            (self._get_breaker_id(), cooldown, cooldown),
+        )
+        return bool(self.env.cr.fetchone())
+
+    @api.model
+    def _before_call(self):
+        """Let a call through, or raise GHLCircuitOpenError to fast-fail.
+
+        Once the cooldown has elapsed, exactly one caller (across all
+        workers) wins the transition to half-open and is used as the probe.
+        """
+        state, _failures = self._get_cached_state()
+        if state == "closed":
+            return
+        cooldown = self._get_settings()["cooldown"]
+        row = self._execute(
+            f"""
+            UPDATE ghl_circuit_breaker
+               SET state = 'half_open', probe_at = (now() at time zone 'UTC')
+             WHERE id = %s AND {PROBE_DUE}
+            RETURNING state, failure_count
+            """,
+            (self._get_breaker_id(), cooldown, cooldown),
+        )
+        if row:
+            _logger.info("GHL circuit breaker half-open, probing the API")
+            return
+        raise GHLCircuitOpenError(_(
+            "GoHighLevel is currently unavailable (circuit breaker open). "
+            "The request was not sent and will be retried later."
+        ))
+
+    @api.model
+    def _record_success(self):
+        state, failure_count = self._get_cached_state()
+        if state == "closed" and not failure_count:
+            return  # Nothing to reset: keep the happy path write-free
+        row = self._execute(
+            """
+            UPDATE ghl_circuit_breaker
+               SET state = 'closed', failure_count = 0, opened_at = NULL
+             WHERE id = %s
+            RETURNING state, failure_count
+            """,
+            (self._get_breaker_id(),),
+        )
+        if state != "closed":
+            _logger.info("GHL circuit breaker closed, API is reachable again")
+        return row
+
+    @api.model
+    def _record_failure(self, error):
+        threshold = self._get_settings()["failure_threshold"]
+        error = redact_text(error)[:2000]
+        row = self._execute(
+            """
+            UPDATE ghl_circuit_breaker
+               SET failure_count = failure_count + 1,
+                   last_failure_at = (now() at time zone 'UTC'),
+                   last_error = %s,
+                   opened_at = CASE WHEN state = 'half_open' OR failure_count + 1 >= %s
+                                    THEN (now() at time zone 'UTC') ELSE opened_at END,
+                   state = CASE WHEN state = 'half_open' OR failure_count + 1 >= %s
+                                THEN 'open' ELSE state END
+             WHERE id = %s
+            RETURNING state, failure_count
+            """,
+            (error, threshold, threshold, self._get_breaker_id()),
+        )
+        if row and row[0] == "open":
+            _logger.warning("GHL circuit breaker open after %s failures: %s", row[1], error)
+        return row
+
+    @api.model
+    def action_reset(self):
+        self._execute(
+            """
+            UPDATE ghl_circuit_breaker
+               SET state = 'closed', failure_count = 0, opened_at = NULL
+             WHERE id = %s
+            RETURNING state, failure_count
+            """,
+            (self._get_breaker_id(),),
+        )
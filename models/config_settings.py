@@ -33,6 +33,18 @@ class ResConfigSettings(models.TransientModel):
         string="Sync Direction",
         default="both",
     )
+    ghl_conflict_policy = fields.Selection(
+        [
+            ("ghl", "GoHighLevel Wins"),
+            ("odoo", "Odoo Wins"),
+            ("newest", "Most Recent Change Wins"),
+        ],
+        string="Conflict Policy",
+        default="ghl",
+        help="Bi-directional sync: which side wins when a record was changed in both "
+        "Odoo and GoHighLevel since it was last synced. A losing GHL change is "
+        "skipped and the Odoo version is queued for push.",
+    )
 
     # Models to sync
     ghl_sync_contacts = fields.Boolean(string="Sync Contacts", default=True)
@@ -40,6 +52,34 @@ class ResConfigSettings(models.TransientModel):
     ghl_sync_tasks = fields.Boolean(string="Sync Tasks", default=False)
     ghl_sync_notes = fields.Boolean(string="Sync Notes", default=False)
 
+    # Sync scope
+    ghl_contact_domain = fields.Char(
+        string="Contacts In Scope",
+        default="[]",
+        help="Only contacts matching this domain are pushed, updated by pulls and "
+        "swept for tasks and notes.",
+    )
+    ghl_opportunity_domain = fields.Char(
+        string="Opportunities In Scope",
+        default="[]",
+        help="Only opportunities matching this domain are pushed and updated by pulls.",
+    )
+    ghl_task_domain = fields.Char(
+        string="Tasks In Scope",
+        default="[]",
+        help="Only tasks matching this domain are pushed and updated by pulls.",
+    )
+    ghl_contact_tags = fields.Char(
+        string="GHL Contact Tags",
+        help="Comma-separated GHL tags: only GHL contacts with at least one of them "
+        "are pulled. Empty pulls every contact.",
+    )
+    ghl_pipeline_ids = fields.Char(
+        string="GHL Pipelines",
+        help="Comma-separated GHL pipeline ids: only opportunities of these pipelines "
+        "are pulled. Empty pulls every pipeline.",
+    )
+
     # Cron interval
     ghl_poll_interval_minutes = fields.Integer(
         string="Polling Interval (minutes)",
@@ -47,6 +87,119 @@ class ResConfigSettings(models.TransientModel):
         help="How often cron should poll GoHighLevel for changes (GHL → Odoo).",
     )
 
+    ghl_adaptive_polling = fields.Boolean(
+        string="Adaptive Polling",
+        default=True,
+        help="Poll each record type more often while it changes a lot and back off "
+        "when it is idle, within the min/max bounds below.",
+    )
+    ghl_poll_min_minutes = fields.Integer(
+        string="Min Interval (minutes)",
+        default=5,
+        help="Fastest polling rate used for busy record types.",
+    )
+    ghl_poll_max_minutes = fields.Integer(
+        string="Max Interval (minutes)",
+        default=60,
+        help="Slowest polling rate used for idle record types.",
+    )
+
+    # Performance
+    ghl_pull_prefetch_pages = fields.Integer(
+        string="Prefetch Pages",
+        default=1,
+        help="Number of pages fetched ahead in the background while the current "
+        "page is applied during contact/opportunity pulls. 0 disables prefetching.",
+    )
+
+    ghl_cron_time_budget_seconds = fields.Integer(
+        string="Cron Time Budget (seconds)",
+        default=90,
+        help="Sync crons stop at the next checkpoint once this much time is used, "
+        "then re-trigger themselves to continue in a new slice. Keep it below the "
+        "server's limit_time_real. 0 disables slicing.",
+    )
+
+    # Task / note sweep sharding
+    ghl_sweep_partitions = fields.Integer(
+        string="Sweep Partitions",
+        default=1,
+        help="Split the per-contact task and note sweeps into this many partitions, "
+        "swept in parallel by the sweep worker crons. 1 sweeps inline while polling.",
+    )
+    ghl_partition_lease_seconds = fields.Integer(
+        string="Partition Lease (seconds)",
+        default=600,
+        help="How long a worker holds a partition without reporting progress before "
+        "another worker may take it over.",
+    )
+
+    # Nightly reconciliation
+    ghl_reconcile_slices = fields.Integer(
+        string="Reconciliation Nights",
+        default=1,
+        help="Spread the nightly re-scan of contacts and opportunities over this many "
+        "nights, each covering its share of the records. 1 re-pulls everything every night.",
+    )
+    ghl_reconcile_time_budget_seconds = fields.Integer(
+        string="Reconciliation Time Budget (seconds)",
+        default=1800,
+        help="Hard limit on the duration of one night's rolling reconciliation. 0 = unlimited.",
+    )
+    ghl_reconcile_max_calls = fields.Integer(
+        string="Reconciliation Call Budget",
+        default=0,
+        help="Maximum GHL API calls made by one night's rolling reconciliation. 0 = unlimited.",
+    )
+
+    ghl_task_pull_mode = fields.Selection(
+        [
+            ("search", "Location-wide Search"),
+            ("contacts", "Per Contact"),
+        ],
+        string="Task Discovery",
+        default="search",
+        help="How GHL tasks are pulled: a paginated search over the whole location, or "
+        "one request per linked contact. The search falls back to per contact requests "
+        "when the location's API access does not offer it.",
+    )
+
+    # Request logging
+    ghl_log_payload_sample_rate = fields.Float(
+        string="Logged Payload Share",
+        default=0.0,
+        digits=(3, 2),
+        help="Share of the GHL calls (0 to 1) whose parameters and payload are logged, "
+        "with personal data and credentials masked. 0 = never.",
+    )
+
+    # Circuit breaker
+    ghl_circuit_failure_threshold = fields.Integer(
+        string="Failures Before Opening",
+        default=5,
+        help="Consecutive failed or slow GoHighLevel calls that open the circuit breaker.",
+    )
+    ghl_circuit_cooldown_seconds = fields.Integer(
+        string="Open Cooldown (seconds)",
+        default=60,
+        help="How long calls fast-fail before a single probe request is let through.",
+    )
+    ghl_circuit_slow_call_seconds = fields.Float(
+        string="Slow Call Threshold (seconds)",
+        default=10,
+        help="Successful calls slower than this count as failures.",
+    )
+    ghl_circuit_state = fields.Selection(
+        [
+            ("closed", "Closed"),
+            ("open", "Open"),
+            ("half_open", "Half-Open (probing)"),
+        ],
+        string="Circuit State",
+        readonly=True,
+    )
+    ghl_circuit_last_error = fields.Text(string="Last API Error", readonly=True)
+
     # Timestamps (read-only in UI)
     ghl_last_contact_pull = fields.Datetime(string="Last Contacts Pull", readonly=True)
     ghl_last_opportunity_pull = fields.Datetime(string="Last Opportunities Pull", readonly=True)
@@ -66,6 +219,12 @@ class ResConfigSettings(models.TransientModel):
             ghl_location_id=ICP.get_param("odoo_ghl.location_id", default=""),
             ghl_sync_on=ICP.get_param("odoo_ghl.sync_on", default="create_update"),
             ghl_sync_direction=ICP.get_param("odoo_ghl.sync_direction", default="both"),
+            ghl_conflict_policy=ICP.get_param("odoo_ghl.conflict_policy", default="ghl"),
+            ghl_contact_domain=ICP.get_param("odoo_ghl.contact_domain", default="[]"),
+            ghl_opportunity_domain=ICP.get_param("odoo_ghl.opportunity_domain", default="[]"),
+            ghl_task_domain=ICP.get_param("odoo_ghl.task_domain", default="[]"),
+            ghl_contact_tags=ICP.get_param("odoo_ghl.contact_tags", default=""),
+            ghl_pipeline_ids=ICP.get_param("odoo_ghl.pipeline_ids", default=""),
             ghl_sync_contacts=ICP.get_param("odoo_ghl.sync_contacts", default="True") == "True",
             ghl_sync_opportunities=ICP.get_param("odoo_ghl.sync_opportunities", default="True")
             == "True",
@@ -74,34 +233,74 @@ class ResConfigSettings(models.TransientModel):
             ghl_poll_interval_minutes=int(
                 ICP.get_param("odoo_ghl.poll_interval_minutes", default="10")
             ),
+            ghl_adaptive_polling=ICP.get_param("odoo_ghl.adaptive_polling", default="True")
+            == "True",
+            ghl_poll_min_minutes=int(ICP.get_param("odoo_ghl.poll_min_minutes", default="5")),
+            ghl_poll_max_minutes=int(ICP.get_param("odoo_ghl.poll_max_minutes", default="60")),
+            ghl_pull_prefetch_pages=int(
+                ICP.get_param("odoo_ghl.pull_prefetch_pages", default="1")
+            ),
+            ghl_cron_time_budget_seconds=int(
+                ICP.get_param("odoo_ghl.cron_time_budget_seconds", default="90")
+            ),
+            ghl_sweep_partitions=int(ICP.get_param("odoo_ghl.sweep_partitions", default="1")),
+            ghl_reconcile_slices=int(ICP.get_param("odoo_ghl.reconcile_slices", default="1")),
+            ghl_reconcile_time_budget_seconds=int(
+                ICP.get_param("odoo_ghl.reconcile_time_budget_seconds", default="1800")
+            ),
+            ghl_reconcile_max_calls=int(ICP.get_param("odoo_ghl.reconcile_max_calls", default="0")),
+            ghl_task_pull_mode=ICP.get_param("odoo_ghl.task_pull_mode", default="search"),
+            ghl_log_payload_sample_rate=float(
+                ICP.get_param("odoo_ghl.log_payload_sample_rate", default="0")
+            ),
+            ghl_partition_lease_seconds=int(
+                ICP.get_param("odoo_ghl.partition_lease_seconds", default="600")
+            ),
+            ghl_circuit_failure_threshold=int(
+                ICP.get_param("odoo_ghl.circuit_failure_threshold", default="5")
+            ),
+            ghl_circuit_cooldown_seconds=int(
+                ICP.get_param("odoo_ghl.circuit_cooldown_seconds", default="60")
+            ),
+            ghl_circuit_slow_call_seconds=float(
+                ICP.get_param("odoo_ghl.circuit_slow_call_seconds", default="10")
+            ),
         )
+
+        breaker = self.env.ref(
+            "odoo_gohighlevel_connector.ghl_circuit_breaker_main", raise_if_not_found=False
+        )
+        if breaker:
+            res.update(
+                ghl_circuit_state=breaker.sudo().state,
+                ghl_circuit_last_error=breaker.sudo().last_error or False,
+            )
         
-        # Parse datetime fields safely (remove microseconds if present)
-        for field_name, param_name in [
-            ("ghl_last_contact_pull", "odoo_ghl.last_contact_pull"),
-            ("ghl_last_opportunity_pull", "odoo_ghl.last_opportunity_pull"),
-            ("ghl_last_task_pull", "odoo_ghl.last_task_pull"),
-            ("ghl_last_note_pull", "odoo_ghl.last_note_pull"),
-        ]:
-            value = ICP.get_param(param_name)
-            if value:
-                try:
-                    # Parse and remove microseconds
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(value.replace('T', ' ').replace('Z', ''))
-                    dt = dt.replace(microsecond=0)
-                    res[field_name] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    res[field_name] = False
-            else:
-                res[field_name] = False
-        
+        watermarks = self.env["ghl.sync.state"].sudo()._get_watermarks(
+            ["contacts", "opportunities", "tasks", "notes"]
+        )
+        res.update(
+            ghl_last_contact_pull=watermarks.get("contacts", False),
+            ghl_last_opportunity_pull=watermarks.get("opportunities", False),
+            ghl_last_task_pull=watermarks.get("tasks", False),
+            ghl_last_note_pull=watermarks.get("notes", False),
+        )
         return res
 
     # ---------------------------------------------------------------
     # Save into ir.config_parameter
     # ---------------------------------------------------------------
     def set_values(self):
+        # Refuse invalid scope domains here, not in every create/write hook
+        backend = self.env["odoo.ghl.backend"]
+        for model_name, domain in (
+            ("res.partner", self.ghl_contact_domain),
+            ("crm.lead", self.ghl_opportunity_domain),
+            ("project.task", self.ghl_task_domain),
+        ):
+            if domain:
+                backend._eval_scope_domain(model_name, domain)
+
         super().set_values()
         ICP = self.env["ir.config_parameter"].sudo()
 
@@ -109,6 +308,12 @@ class ResConfigSettings(models.TransientModel):
         ICP.set_param("odoo_ghl.location_id", self.ghl_location_id or "")
         ICP.set_param("odoo_ghl.sync_on", self.ghl_sync_on or "create_update")
         ICP.set_param("odoo_ghl.sync_direction", self.ghl_sync_direction or "both")
+        ICP.set_param("odoo_ghl.conflict_policy", self.ghl_conflict_policy or "ghl")
+        ICP.set_param("odoo_ghl.contact_domain", self.ghl_contact_domain or "[]")
+        ICP.set_param("odoo_ghl.opportunity_domain", self.ghl_opportunity_domain or "[]")
+        ICP.set_param("odoo_ghl.task_domain", self.ghl_task_domain or "[]")
+        ICP.set_param("odoo_ghl.contact_tags", self.ghl_contact_tags or "")
+        ICP.set_param("odoo_ghl.pipeline_ids", self.ghl_pipeline_ids or "")
         ICP.set_param("odoo_ghl.sync_contacts", "True" if self.ghl_sync_contacts else "False")
         ICP.set_param(
             "odoo_ghl.sync_opportunities",
@@ -120,12 +325,55 @@ class ResConfigSettings(models.TransientModel):
             "odoo_ghl.poll_interval_minutes",
             str(self.ghl_poll_interval_minutes or 10),
         )
+        ICP.set_param("odoo_ghl.adaptive_polling", "True" if self.ghl_adaptive_polling else "False")
+        ICP.set_param("odoo_ghl.poll_min_minutes", str(self.ghl_poll_min_minutes or 5))
+        ICP.set_param("odoo_ghl.poll_max_minutes", str(self.ghl_poll_max_minutes or 60))
+        ICP.set_param(
+            "odoo_ghl.pull_prefetch_pages",
+            str(max(self.ghl_pull_prefetch_pages, 0)),
+        )
+        ICP.set_param(
+            "odoo_ghl.cron_time_budget_seconds",
+            str(max(self.ghl_cron_time_budget_seconds, 0)),
+        )
+        ICP.set_param("odoo_ghl.sweep_partitions", str(max(self.ghl_sweep_partitions, 1)))
+        ICP.set_param("odoo_ghl.reconcile_slices", str(max(self.ghl_reconcile_slices, 1)))
+        ICP.set_param(
+            "odoo_ghl.reconcile_time_budget_seconds",
+            str(max(self.ghl_reconcile_time_budget_seconds, 0)),
+        )
+        ICP.set_param("odoo_ghl.reconcile_max_calls", str(max(self.ghl_reconcile_max_calls, 0)))
+        ICP.set_param("odoo_ghl.task_pull_mode", self.ghl_task_pull_mode or "search")
+        ICP.set_param(
+            "odoo_ghl.log_payload_sample_rate",
+            str(min(max(self.ghl_log_payload_sample_rate, 0.0), 1.0)),
+        )
+        ICP.set_param(
+            "odoo_ghl.partition_lease_seconds",
+            str(self.ghl_partition_lease_seconds or 600),
+        )
+        ICP.set_param(
+            "odoo_ghl.circuit_failure_threshold",
+            str(self.ghl_circuit_failure_threshold or 5),
+        )
+        ICP.set_param(
+            "odoo_ghl.circuit_cooldown_seconds",
+            str(self.ghl_circuit_cooldown_seconds or 60),
+        )
+        ICP.set_param(
+            "odoo_ghl.circuit_slow_call_seconds",
+            str(self.ghl_circuit_slow_call_seconds or 10),
+        )
         
+        # Drop the cached settings snapshot used by the sync hooks
+        self.env.registry.clear_cache()
+
         # Update cron interval immediately when settings are saved
         try:
             cron = self.env.ref('odoo_gohighlevel_connector.ir_cron_odoo_ghl_poll_changes', raise_if_not_found=False)
             if cron:
-                new_interval = self.ghl_poll_interval_minutes or 10
+                backend = self.env["odoo.ghl.backend"]
+                new_interval = backend._get_cron_interval(backend._get_config())
                 if cron.interval_number != new_interval:
                     cron.sudo().write({
                         'interval_number': new_interval
@@ -136,35 +384,14 @@ class ResConfigSettings(models.TransientModel):
             _logger = logging.getLogger(__name__)
             _logger.warning(f"Could not update cron interval: {str(e)}")
 
-
-    # small helpers so backend can update timestamps
-    @api.model
-    def _set_last_pull(self, contact=None, opportunity=None, task=None, note=None):
-        ICP = self.env["ir.config_parameter"].sudo()
-        if contact is not None:
-            ICP.set_param("odoo_ghl.last_contact_pull", contact or "")
-        if opportunity is not None:
-            ICP.set_param("odoo_ghl.last_opportunity_pull", opportunity or "")
-        if task is not None:
-            ICP.set_param("odoo_ghl.last_task_pull", task or "")
-        if note is not None:
-            ICP.set_param("odoo_ghl.last_note_pull", note or "")
-    @api.model
-    def _reset_last_pull(self):
-        self._set_last_pull(contact="", opportunity="", task="", note="")
-
     def action_ghl_manual_sync(self):
-        """Trigger manual sync from Settings view."""
-        self.env["odoo.ghl.backend"].manual_sync_now()
+        """Open a new background sync run so the user can pick what to sync."""
         return {
-            "type": "ir.actions.client",
-            "tag": "display_notification",
-            "params": {
-                "title": "Sync Started",
-                "message": "Manual sync has been triggered in the background.",
-                "type": "success",
-                "sticky": False,
-            },
+            "type": "ir.actions.act_window",
+            "name": "Sync Now",
+            "res_model": "ghl.sync.run",
+            "view_mode": "form",
+            "target": "new",
         }
 
     def action_ghl_test_connection(self):
@@ -182,6 +409,14 @@ class ResConfigSettings(models.TransientModel):
             },
         }
 
+    def action_ghl_reset_circuit(self):
+        """Close the circuit breaker by hand once GHL is known to be back."""
+        self.env["ghl.circuit.breaker"].action_reset()
+        return {
+            "type": "ir.actions.client",
+            "tag": "reload",
+        }
+
     def action_fetch_pipelines(self):
         """Button action to fetch pipelines from GHL."""
         return self.env["ghl.pipeline.mapping"].fetch_pipelines_from_ghl()
@@ -12,23 +12,14 @@ class ResPartner(models.Model):
             return super().create(vals_list)
         partners = super().create(vals_list)
         backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
-        if (
-            cfg["sync_contacts"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for partner in partners:
-                if not partner.ghl_skip_sync and not partner.is_company:
-                    backend.push_contact(partner)
+        if backend._get_config_snapshot().push_on_save("sync_contacts"):
+            backend.push_records(partners, raise_errors=True)
         return partners
 
     def write(self, vals):
         if self.env.context.get("ghl_sync_running"):
             return super().write(vals)
         res = super().write(vals)
-        backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
         # Define fields that should trigger a sync
         synced_fields = {
             "name", "email", "phone", "mobile", "street", "street2", "city",
@@ -40,12 +31,7 @@ class ResPartner(models.Model):
         if not any(field in vals for field in synced_fields):
             return res
 
-        if (
-            cfg["sync_contacts"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for partner in self:
-                if not partner.ghl_skip_sync and not partner.is_company:
-                    backend.push_contact(partner)
+        backend = self.env["odoo.ghl.backend"]
+        if backend._get_config_snapshot().push_on_save("sync_contacts"):
+            backend.push_records(self, raise_errors=True)
         return res
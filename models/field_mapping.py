@@ -0,0 +1,329 @@
+# odoo_gohighlevel_connector/models/field_mapping.py
+"""Declarative Odoo <-> GoHighLevel field mappings.
+
+Each synced entity is described once as a list of ``FieldMap`` entries,
+compiled at import time into a ``Mapping`` that turns Odoo records into
+GHL payloads (push) and GHL rows into Odoo vals (pull). Anything that needs
+the database goes through a ``Lookups`` object, which loads each table with
+one query and shares it across the records of a batch or page.
+"""
+import hashlib
+import json
+
+from odoo import _
+from odoo.exceptions import UserError
+
+# Returned by a transform to leave the key (push) or field (pull) out
+SKIP = object()
+
+
+class FieldMap:
+    """One mapped field: Odoo ``field`` <-> GHL ``key``.
+
+    ``push(record, lookups)`` and ``pull(row, lookups, record)`` override
+    the default straight copies (``record[field]`` / ``row.get(key)``);
+    ``record`` is None on pull when the row creates a new record. Set
+    ``to_ghl`` / ``to_odoo`` to False for one-way fields. ``reads`` lists
+    the Odoo fields the push reads (read upfront for the whole batch) and
+    ``keys`` the GHL keys the pull reads (kept by the page normalizer).
+    A tuple ``key`` spreads the tuple returned by ``push`` over its keys.
+    """
+
+    __slots__ = ("field", "key", "push", "pull", "to_ghl", "to_odoo", "reads", "keys")
+
+    def __init__(self, field, key, push=None, pull=None, to_ghl=True, to_odoo=True, reads=None, keys=None):
+        self.field = field
+        self.key = key
+        self.push = push
+        self.pull = pull
+        self.to_ghl = to_ghl and key is not None
+        self.to_odoo = to_odoo and field is not None
+        self.reads = reads if reads is not None else ((field,) if field else ())
+        self.keys = keys if keys is not None else ((key,) if key else ())
+
+
+class Mapping:
+    """A compiled list of ``FieldMap``."""
+
+    def __init__(self, spec):
+        self._push = [
+            (m.key, m.push or (lambda record, lookups, f=m.field: record[f]))
+            for m in spec if m.to_ghl
+        ]
+        self._pull = [
+            (m.field, m.pull or (lambda row, lookups, record, k=m.key: row.get(k)))
+            for m in spec if m.to_odoo
+        ]
+        self.push_reads = tuple(sorted({f for m in spec if m.to_ghl for f in m.reads}))
+        self.pull_keys = tuple(dict.fromkeys(k for m in spec if m.to_odoo for k in m.keys))
+
+    def to_payload(self, record, lookups):
+        payload = {}
+        for key, transform in self._push:
+            value = transform(record, lookups)
+            if value is SKIP:
+                continue
+            if isinstance(key, tuple):
+                payload.update(zip(key, value))
+            else:
+                payload[key] = value
+        return payload
+
+    def fingerprint(self, row):
+        """Stable hash of the GHL values this mapping pulls from ``row``."""
+        values = json.dumps([row.get(k) for k in self.pull_keys], default=str)
+        return hashlib.sha1(values.encode()).hexdigest()
+
+    def local_fingerprint(self, record):
+        """Stable hash of the Odoo values this mapping pushes from ``record``."""
+        values = [
+            record[f].ids if record._fields[f].relational else record[f]
+            for f in self.push_reads
+        ]
+        return hashlib.sha1(json.dumps(values, default=str).encode()).hexdigest()
+
+    def to_vals(self, row, lookups, record=None):
+        vals = {}
+        for field, transform in self._pull:
+            value = transform(row, lookups, record)
+            if value is not SKIP:
+                vals[field] = value
+        return vals
+
+
+class Lookups:
+    """Lookup tables used by the mappings, loaded once per batch or page."""
+
+    def __init__(self, backend):
+        self.env = backend.env
+        self.backend = backend
+        self._tables = {}
+        self._contacts = {}
+        self._tags = {}
+        self._companies = {}
+
+    def _table(self, name, loader):
+        if name not in self._tables:
+            self._tables[name] = loader()
+        return self._tables[name]
+
+    @property
+    def user_by_ghl(self):
+        """GHL user id -> mapped Odoo user id."""
+        return self._table("user_by_ghl", lambda: {
+            ghl_id: user.id for ghl_id, user in self.backend._get_ghl_user_map().items()
+        })
+
+    @property
+    def ghl_by_user(self):
+        """Odoo user id -> GHL user id (first mapping wins)."""
+        def load():
+            ghl_by_user = {}
+            for ghl_id, user in self.backend._get_ghl_user_map().items():
+                ghl_by_user.setdefault(user.id, ghl_id)
+            return ghl_by_user
+        return self._table("ghl_by_user", load)
+
+    @property
+    def stage_mappings(self):
+        return self._table("stage_mappings", lambda: self.env["ghl.pipeline.mapping"].sudo().search([]))
+
+    @property
+    def stage_by_ghl(self):
+        """(GHL pipeline id, GHL stage id) -> Odoo stage id."""
+        def load():
+            stages = {}
+            for m in self.stage_mappings.filtered("odoo_stage_id"):
+                stages.setdefault((m.ghl_pipeline_id, m.ghl_stage_id), m.odoo_stage_id.id)
+            return stages
+        return self._table("stage_by_ghl", load)
+
+    @property
+    def ghl_by_stage(self):
+        """Odoo stage id -> (GHL pipeline id, GHL stage id)."""
+        def load():
+            stages = {}
+            for m in self.stage_mappings.filtered("odoo_stage_id"):
+                stages.setdefault(m.odoo_stage_id.id, (m.ghl_pipeline_id, m.ghl_stage_id))
+            return stages
+        return self._table("ghl_by_stage", load)
+
+    @property
+    def country_by_code(self):
+        return self._table("country_by_code", lambda: {
+            c.code: c.id for c in self.env["res.country"].sudo().search([])
+        })
+
+    @property
+    def done_stages(self):
+        """({project id: folded stage id}, fallback folded stage id)."""
+        return self._table("done_stages", self.backend._get_done_stage_map)
+
+    def load_contacts(self, ghl_ids):
+        """Resolve the Odoo partners bound to ``ghl_ids`` in one query."""
+        missing = [g for g in ghl_ids if g and g not in self._contacts]
+        if missing:
+            self._contacts.update(dict.fromkeys(missing))
+            self._contacts.update(self.env["ghl.binding"]._get_res_ids("res.partner", missing))
+
+    def contact_id(self, ghl_id):
+        if ghl_id not in self._contacts:
+            self.load_contacts([ghl_id])
+        return self._contacts.get(ghl_id)
+
+    def tag_ids(self, names):
+        """Partner tag ids for ``names``, creating the missing tags."""
+        Tag = self.env["res.partner.category"].sudo()
+        missing = [n for n in names if n not in self._tags]
+        if missing:
+            for tag in Tag.search([("name", "in", missing)]):
+                self._tags.setdefault(tag.name, tag.id)
+            for name in missing:
+                if name not in self._tags:
+                    self._tags[name] = Tag.create({"name": name}).id
+        return [self._tags[n] for n in names]
+
+    def load_companies(self, names):
+        """Resolve the existing company partners called ``names`` in one query."""
+        missing = [n for n in names if n and n not in self._companies]
+        if missing:
+            self._companies.update(dict.fromkeys(missing, False))
+            companies = self.env["res.partner"].sudo().search_read(
+                [("name", "in", missing), ("is_company", "=", True)], ["name"]
+            )
+            for company in reversed(companies):
+                self._companies[company["name"]] = company["id"]  # First match wins
+
+    def company_id(self, name):
+        """Existing company partner called ``name`` (never created)."""
+        if name not in self._companies:
+            self.load_companies([name])
+        return self._companies[name]
+
+
+# ---------------------------------------------------------------------
+# Transforms
+# ---------------------------------------------------------------------
+def _or_empty(field):
+    return lambda record, lookups: record[field] or ""
+
+
+def _if_set(value):
+    return value if value else SKIP
+
+
+def _const(value):
+    return lambda *args: value
+
+
+def _ghl_user(field):
+    """Push the GHL user mapped to a user field (None unassigns in GHL)."""
+    def push(record, lookups):
+        users = record[field]
+        return lookups.ghl_by_user.get(users[:1].id) if users else None
+    return push
+
+
+def _pull_user(row, lookups, record):
+    # Unmapped or missing GHL user: unassign in Odoo
+    return lookups.user_by_ghl.get(row.get("assignedTo"), False)
+
+
+def _pull_contact_name(row, lookups, record):
+    return row.get("contactName") or row.get("firstName") or row.get("fullNameLowerCase") or "Unknown"
+
+
+def _pull_tags(row, lookups, record):
+    tags = row.get("tags") or []
+    return [(6, 0, lookups.tag_ids(tags))] if tags else SKIP
+
+
+def _pull_company(row, lookups, record):
+    # Only link an existing company, creating one could make duplicates
+    name = row.get("companyName")
+    return name and lookups.company_id(name) or SKIP
+
+
+def _push_stage(record, lookups):
+    if not record.stage_id:
+        return SKIP
+    ghl_stage = lookups.ghl_by_stage.get(record.stage_id.id)
+    if not ghl_stage:
+        # Raise error if mapping is missing, otherwise GHL will reject with 422
+        raise UserError(_(
+            "GoHighLevel Sync Error: No Pipeline Mapping found for Odoo Stage '%s'. "
+            "Please go to GoHighLevel > Configuration > Pipeline Mapping and configure it."
+        ) % record.stage_id.name)
+    return ghl_stage
+
+
+def _pull_task_stage(row, lookups, record):
+    # Completion status maps to the project's folded stage
+    if not row.get("completed"):
+        return SKIP
+    done_stages, default_done_stage = lookups.done_stages
+    project_id = record.project_id.id if record else False
+    return done_stages.get(project_id, default_done_stage) or SKIP
+
+
+def _pull_task_deadline(row, lookups, record):
+    due_date = lookups.backend._parse_remote_dt(row.get("dueDate"))
+    return due_date or SKIP
+
+
+def _pull_task_users(row, lookups, record):
+    user_id = lookups.user_by_ghl.get(row.get("assignedTo"))
+    return [(6, 0, [user_id])] if user_id else [(5, 0, 0)]
+
+
+# ---------------------------------------------------------------------
+# Entity specs
+# ---------------------------------------------------------------------
+CONTACT_MAPPING = Mapping([
+    FieldMap("name", "firstName", pull=_pull_contact_name,
+             keys=("contactName", "firstName", "fullNameLowerCase")),
+    FieldMap("email", "email", push=lambda r, lk: _if_set(r.email)),
+    FieldMap("phone", "phone", push=lambda r, lk: _if_set(r.mobile or r.phone),
+             reads=("mobile", "phone")),
+    FieldMap("street", "address1", push=_or_empty("street")),
+    FieldMap("city", "city", push=_or_empty("city")),
+    FieldMap("state_id", "state", push=lambda r, lk: r.state_id.name or "", to_odoo=False),
+    FieldMap("zip", "postalCode", push=_or_empty("zip")),
+    FieldMap("country_id", "country", push=lambda r, lk: _if_set(r.country_id.code),
+             pull=lambda row, lk, rec: lk.country_by_code.get(row.get("country")) or SKIP),
+    FieldMap("category_id", "tags", push=lambda r, lk: r.category_id.mapped("name"), pull=_pull_tags),
+    FieldMap("parent_id", "companyName",
+             push=lambda r, lk: r.parent_id.name if r.parent_id else (r.company_name or ""),
+             pull=_pull_company, reads=("parent_id", "company_name")),
+    FieldMap(None, "type", push=_const("customer")),
+    FieldMap("website", "website", push=_or_empty("website"), to_odoo=False),
+    FieldMap("user_id", "assignedTo", push=_ghl_user("user_id"), pull=_pull_user),
+])
+
+OPPORTUNITY_MAPPING = Mapping([
+    FieldMap("name", "name"),
+    FieldMap("expected_revenue", "monetaryValue", push=lambda r, lk: r.expected_revenue or 0.0,
+             pull=lambda row, lk, rec: row.get("monetaryValue") or 0.0),
+    FieldMap("type", None, pull=_const("opportunity")),
+    FieldMap("active", "status", push=lambda r, lk: "open" if r.active else "closed",
+             pull=lambda row, lk, rec: row.get("status") != "closed"),
+    FieldMap("partner_id", "contactId", push=lambda r, lk: r.partner_id.ghl_id or None,
+             pull=lambda row, lk, rec: lk.contact_id(row.get("contactId")) or SKIP),
+    FieldMap("user_id", "assignedTo", push=_ghl_user("user_id"), pull=_pull_user),
+    FieldMap("stage_id", ("pipelineId", "pipelineStageId"), push=_push_stage,
+             pull=lambda row, lk, rec: lk.stage_by_ghl.get(
+                 (row.get("pipelineId"), row.get("pipelineStageId"))
+             ) or SKIP,
+             keys=("pipelineId", "pipelineStageId")),
+])
+
+TASK_MAPPING = Mapping([
+    FieldMap("name", "title", pull=lambda row, lk, rec: row.get("title") or "Untitled Task"),
+    FieldMap("description", "body", push=_or_empty("description")),
+    FieldMap("date_deadline", "dueDate",
+             push=lambda r, lk: r.date_deadline.isoformat() if r.date_deadline else None,
+             pull=_pull_task_deadline),
+    FieldMap("stage_id", "completed", push=lambda r, lk: r.stage_id.fold if r.stage_id else False,
+             pull=_pull_task_stage),
+    FieldMap("user_ids", "assignedTo", push=_ghl_user("user_ids"), pull=_pull_task_users),
+])
@@ -0,0 +1,132 @@
+# odoo_gohighlevel_connector/models/ghl_binding.py
+from odoo import api, fields, models
+
+
+class GHLBinding(models.Model):
+    """Link between an Odoo record and its GoHighLevel counterpart.
+
+    Kept in its own narrow table so the business tables (and especially
+    ``mail_message``) do not carry sync columns, and so lookups by GHL id
+    only touch a small, uniquely indexed table.
+    """
+
+    _name = "ghl.binding"
+    _description = "GoHighLevel Binding"
+    _log_access = False
+
+    model = fields.Char(string="Model", required=True)
+    res_id = fields.Integer(string="Record ID", required=True)
+    ghl_id = fields.Char(string="GoHighLevel ID", required=True)
+    remote_updated_at = fields.Datetime(string="GHL Remote Updated At")
+    last_synced_at = fields.Datetime(string="GHL Last Synced At")
+    remote_hash = fields.Char(
+        string="GHL Fingerprint",
+        help="Hash of the mapped GHL values last pulled or returned by a push",
+    )
+    local_hash = fields.Char(
+        string="Odoo Fingerprint",
+        help="Hash of the synced Odoo values at the last sync, telling edits "
+             "of synced fields from edits of other fields",
+    )
+
+    _sql_constraints = [
+        ('model_res_uniq', 'unique(model, res_id)', 'A record can only be linked to one GoHighLevel record!'),
+        ('model_ghl_uniq', 'unique(model, ghl_id)', 'A GoHighLevel record can only be linked to one Odoo record!'),
+    ]
+
+    @api.model
+    def _get_ghl_ids(self, model, res_ids=None):
+        """Return {res_id: ghl_id} for ``res_ids`` (all bound records if None)."""
+        domain = [("model", "=", model)]
+        if res_ids is not None:
+            domain.append(("res_id", "in", list(res_ids)))
+        return {b.res_id: b.ghl_id for b in self.sudo().search_fetch(domain, ["res_id", "ghl_id"])}
+
+    @api.model
+    def _get_partition_res_ids(self, model, partition=None, after_id=0, limit=None):
+        """Ids of the records of ``model`` bound after ``after_id``, in id order.
+
+        ``partition`` is an ``(index, count)`` pair keeping only the records
+        hashing to that partition (``res_id % count == index``).
+        """
+        self.flush_model()
+        query = "SELECT res_id FROM ghl_binding WHERE model = %s AND res_id > %s"
+        params = [model, after_id]
+        if partition:
+            query += " AND res_id %% %s = %s"
+            params += [partition[1], partition[0]]
+        query += " ORDER BY res_id"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+        self.env.cr.execute(query, params)
+        return [res_id for res_id, in self.env.cr.fetchall()]
+
+    @api.model
+    def _get_res_ids(self, model, ghl_ids):
+        """Return {ghl_id: res_id} for the given GHL ids, in one query."""
+        domain = [("model", "=", model), ("ghl_id", "in", list(ghl_ids))]
+        return {b.ghl_id: b.res_id for b in self.sudo().search_fetch(domain, ["res_id", "ghl_id"])}
+
+    @api.model
+    def _get_bindings(self, model, ghl_ids):
+        """Return {ghl_id: binding} with the sync versions, in one query."""
+        domain = [("model", "=", model), ("ghl_id", "in", list(ghl_ids))]
+        fnames = ["res_id", "ghl_id", "remote_updated_at", "last_synced_at", "remote_hash", "local_hash"]
+        return {b.ghl_id: b for b in self.sudo().search_fetch(domain, fnames)}
+
+    @api.model
+    def _bind(self, model, rows):
+        """Create or update bindings for ``model`` in a single statement.
+
+        ``rows`` is a list of dicts with ``res_id``, ``ghl_id`` and optionally
+        ``remote_updated_at`` / ``last_synced_at`` / ``remote_hash`` /
+        ``local_hash``. Linking a GHL id that is already bound to another
+        record of the same model violates the unique index, so concurrent
+        runs cannot create duplicate bindings.
+        """
+        if not rows:
+            return
+        self.flush_model()
+        # Through the Odoo cursor, so the upsert counts in the query guard
+        values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(rows))
+        self.env.cr.execute(
+            f"""
+            INSERT INTO ghl_binding (model, res_id, ghl_id, remote_updated_at, last_synced_at, remote_hash, local_hash)
+            VALUES {values}
+            ON CONFLICT (model, res_id) DO UPDATE SET
+                ghl_id = EXCLUDED.ghl_id,
+                remote_updated_at = COALESCE(EXCLUDED.remote_updated_at, ghl_binding.remote_updated_at),
+                last_synced_at = COALESCE(EXCLUDED.last_synced_at, ghl_binding.last_synced_at),
+                remote_hash = COALESCE(EXCLUDED.remote_hash, ghl_binding.remote_hash),
+                local_hash = COALESCE(EXCLUDED.local_hash, ghl_binding.local_hash)
+            """,
+            [
+                value
+                for row in rows
+                for value in (
+                    model,
+                    row["res_id"],
+                    row["ghl_id"],
+                    row.get("remote_updated_at") or None,
+                    row.get("last_synced_at") or None,
+                    row.get("remote_hash") or None,
+                    row.get("local_hash") or None,
+                )
+            ],
+        )
+        self.invalidate_model()
+        self.env[model].invalidate_model(
+            ["ghl_id", "ghl_remote_updated_at", "ghl_last_synced_at", "ghl_remote_hash"]
+        )
+
+    @api.model
+    def _unbind(self, model, res_ids):
+        if not res_ids:
+            return
+        self.flush_model()
+        self.env.cr.execute(
+            "DELETE FROM ghl_binding WHERE model = %s AND res_id IN %s",
+            (model, tuple(res_ids)),
+        )
+        self.invalidate_model()
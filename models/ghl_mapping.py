@@ -1,4 +1,6 @@
 # odoo_gohighlevel_connector/models/ghl_mapping.py
+import json
+
 from odoo import api, fields, models
 
 class GHLUserMapping(models.Model):
@@ -112,12 +114,13 @@ class GHLSyncQueue(models.Model):
 
     name = fields.Char(string="Record Name", required=True)
     model_name = fields.Char(string="Model", required=True)
-    record_id = fields.Integer(string="Record ID", required=True)
+    record_id = fields.Integer(string="Record ID", required=True, index=True)
     action = fields.Selection([
         ('push', 'Push to GHL'),
         ('pull', 'Pull from GHL')
     ], string="Action", required=True)
     error_message = fields.Text(string="Error Message")
+    payload = fields.Text(string="Payload", help="Values of a pulled change that could not be applied (JSON)")
     retry_count = fields.Integer(string="Retry Count", default=0)
     state = fields.Selection([
         ('draft', 'Draft'),
@@ -130,29 +133,44 @@ class GHLSyncQueue(models.Model):
         backend = self.env["odoo.ghl.backend"]
         for rec in self:
             try:
-                record = self.env[rec.model_name].browse(rec.record_id)
-                if not record.exists():
-                    rec.state = 'done' # Record deleted, skip
-                    continue
-                
-                if rec.action == 'push':
-                    if rec.model_name == 'res.partner':
-                        backend.push_contact(record)
-                    elif rec.model_name == 'crm.lead':
-                        backend.push_opportunity(record)
-                    elif rec.model_name == 'project.task':
-                        backend.push_task(record)
-                    elif rec.model_name == 'mail.message':
-                        backend.push_note(record)
-                
-                rec.state = 'done'
+                with self.env.cr.savepoint():
+                    if rec.action == 'pull' and rec.payload:
+                        backend._apply_queued_pull(rec.model_name, rec.record_id, json.loads(rec.payload))
+                        rec.state = 'done'
+                        continue
+
+                    record = self.env[rec.model_name].browse(rec.record_id)
+                    if not record.exists():
+                        rec.state = 'done' # Record deleted, skip
+                        continue
+
+                    if rec.action == 'push':
+                        # The planner also links a missing parent contact first
+                        backend.push_records(record, raise_errors=True, enqueue=False)
+
+                    rec.state = 'done'
             except Exception as e:
                 rec.retry_count += 1
                 rec.error_message = str(e)
                 rec.state = 'failed'
 
+    @api.model
+    def _process_pending(self, limit=50):
+        """Send the deferred pushes (e.g. held back while GHL was down)."""
+        if not self.env["ghl.circuit.breaker"]._is_available():
+            return
+        pending = self.search([('state', '=', 'draft'), ('action', '=', 'push')], limit=limit)
+        pending.with_context(ghl_lane="poll").action_retry()
+
     @api.model
     def cron_retry_failed_syncs(self):
-        """Cron job to retry failed syncs"""
+        """Cron job to retry failed syncs and send the deferred pushes.
+
+        Left to the dedicated sync worker while it is running.
+        """
+        if self.env["odoo.ghl.backend"]._sync_worker_active():
+            return
+        if not self.env["ghl.circuit.breaker"]._is_available():
+            return  # GHL is down, retries would only fast-fail
         records = self.search([('state', 'in', ['draft', 'failed']), ('retry_count', '<', 5)], limit=50)
-        records.action_retry()
+        records.with_context(ghl_lane="poll").action_retry()
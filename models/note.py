@@ -1,8 +1,8 @@
 # odoo_gohighlevel_connector/models/note.py
 from odoo import api, models
 
-# odoo_gohighlevel_connector/models/note.py
-from odoo import api, models
+# Only chatter comments on these models are synced as GHL notes
+GHL_NOTE_MODELS = ('res.partner', 'crm.lead')
 
 
 class MailMessage(models.Model):
@@ -11,29 +11,23 @@ class MailMessage(models.Model):
 
     @api.model_create_multi
     def create(self, vals_list):
-        if self.env.context.get("ghl_sync_running"):
-            return super().create(vals_list)
         messages = super().create(vals_list)
+        if self.env.context.get("ghl_sync_running"):
+            return messages
+        # Every email, chatter post and notification comes through here: bail
+        # out on the cached settings and the raw vals before touching records
         backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
-        if (
-            cfg["sync_notes"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for msg in messages:
-                if msg.model not in ('res.partner', 'crm.lead'):
-                    continue
-                if msg.message_type == "comment" and not msg.ghl_skip_sync:
-                    backend.push_note(msg)
+        if not backend._get_config_snapshot().push_on_save("sync_notes"):
+            return messages
+        if not any(vals.get("model") in GHL_NOTE_MODELS for vals in vals_list):
+            return messages
+        backend.push_records(messages)
         return messages
 
     def write(self, vals):
         if self.env.context.get("ghl_sync_running"):
             return super().write(vals)
         res = super().write(vals)
-        backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
         
         # Define fields that should trigger a sync
         synced_fields = {
@@ -44,14 +38,7 @@ class MailMessage(models.Model):
         if not any(field in vals for field in synced_fields):
             return res
 
-        if (
-            cfg["sync_notes"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for msg in self:
-                if msg.model not in ('res.partner', 'crm.lead'):
-                    continue
-                if msg.message_type == "comment" and not msg.ghl_skip_sync:
-                    backend.push_note(msg)
+        backend = self.env["odoo.ghl.backend"]
+        if backend._get_config_snapshot().push_on_save("sync_notes"):
+            backend.push_records(self)
         return res
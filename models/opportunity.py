@@ -15,23 +15,15 @@ class CrmLead(models.Model):
             return super().create(vals_list)
         leads = super().create(vals_list)
         backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
-        if (
-            cfg["sync_opportunities"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for lead in leads:
-                if not lead.ghl_skip_sync and lead.type == "opportunity":
-                    backend.push_opportunity(lead)
+        if backend._get_config_snapshot().push_on_save("sync_opportunities"):
+            # Unlinked customers are pushed first so contactId is never empty
+            backend.push_records(leads, raise_errors=True)
         return leads
 
     def write(self, vals):
         if self.env.context.get("ghl_sync_running"):
             return super().write(vals)
         res = super().write(vals)
-        backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
         # Define fields that should trigger a sync
         synced_fields = {
             "name", "expected_revenue", "active",
@@ -42,12 +34,8 @@ class CrmLead(models.Model):
         if not any(field in vals for field in synced_fields):
             return res
 
-        if (
-            cfg["sync_opportunities"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for lead in self:
-                if not lead.ghl_skip_sync and lead.type == "opportunity":
-                    backend.push_opportunity(lead)
+        backend = self.env["odoo.ghl.backend"]
+        if backend._get_config_snapshot().push_on_save("sync_opportunities"):
+            # Unlinked customers are pushed first so contactId is never empty
+            backend.push_records(self, raise_errors=True)
         return res
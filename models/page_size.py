@@ -0,0 +1,96 @@
+# odoo_gohighlevel_connector/models/page_size.py
+"""Adaptive page size of the paginated GHL pulls.
+
+The contact and opportunity pulls follow ``meta.nextPageUrl``, whose
+cursor (``startAfter`` / ``startAfterId``) does not depend on the page
+size, so the ``limit`` of each request can change between pages. A
+``PageSizer`` picks it from the latency per record of the pages so far,
+and the pull remembers the size it settled on for its next run.
+ORM-free, like ``_ghl_http``: the page prefetch thread drives it.
+"""
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Page sizes accepted by the GHL list / search endpoints
+MIN_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+# First size of an adaptive pull without a remembered size: GHL's maximum,
+# the fewest requests for a backfill; timeouts and 5xx shrink it
+DEFAULT_PAGE_SIZE = MAX_PAGE_SIZE
+GROWTH_FACTOR = 1.5
+# A bigger page must cut the latency per record by this share to be kept
+MIN_GAIN = 0.1
+# Full pages in a row without failure after which a shrunk size may grow again
+RECOVERY_PAGES = 5
+
+
+def with_limit(url, limit):
+    """``url`` with its ``limit`` query parameter set to ``limit``."""
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "limit"]
+    query.append(("limit", str(limit)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class PageSizer:
+    """Page size of one pull, adapted page by page.
+
+    While a bigger page lowers the latency per record, the next page
+    grows; when it does not, the size steps back and stays there for the
+    run. A timeout or 5xx halves the size and caps it below the size that
+    failed, until ``RECOVERY_PAGES`` full pages in a row went through:
+    the cap is then lifted and the size grows again. A ``fixed`` sizer
+    never changes.
+    """
+
+    def __init__(self, size, fixed=False):
+        self.initial = self.size = min(max(size, MIN_PAGE_SIZE), MAX_PAGE_SIZE)
+        self.fixed = fixed
+        self.low = self.high = self.size
+        if not fixed:
+            self.low, self.high = MIN_PAGE_SIZE, MAX_PAGE_SIZE
+        self._growing = not fixed
+        self._last = None  # (size, seconds per record) of the previous full page
+        self._healthy = 0  # Full pages since the last failure
+
+    def apply(self, url, params):
+        """The (url, params) of the next request, at the current size."""
+        if params:
+            return url, {**params, "limit": self.size}
+        return with_limit(url, self.size), params
+
+    def observe(self, elapsed, records):
+        """Adapt the size to a page of ``records`` fetched in ``elapsed`` seconds."""
+        if self.fixed or records < self.size:
+            return  # Fixed, or the last (short) page
+        if self.high < MAX_PAGE_SIZE:
+            self._healthy += 1
+            if self._healthy < RECOVERY_PAGES:
+                return
+            # GHL recovered: grow again from this page on
+            self.high = MAX_PAGE_SIZE
+            self._growing = True
+            self._last = None
+        if not self._growing:
+            return  # Settled
+        rate = elapsed / records
+        last = self._last
+        self._last = (self.size, rate)
+        if last and last[0] < self.size and rate > last[1] * (1 - MIN_GAIN):
+            self.size = last[0]  # Growing did not pay off
+            self._growing = False
+        elif self.size < self.high:
+            self.size = min(round(self.size * GROWTH_FACTOR), self.high)
+        else:
+            self._growing = False
+
+    def failed(self, error):
+        """Shrink after a timeout or 5xx; False when ``error`` is not one or
+        the size cannot shrink any more (the caller then raises it)."""
+        status = getattr(error, "status_code", 0)
+        if not (status is None or status >= 500) or self.size <= self.low:
+            return False
+        self.high = self.size - 1
+        self.size = max(self.size // 2, self.low)
+        self._growing = False
+        self._healthy = 0
+        return True
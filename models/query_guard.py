@@ -0,0 +1,124 @@
+# odoo_gohighlevel_connector/models/query_guard.py
+"""Query-count guard for the sync hot paths.
+
+Each pull page, sweep batch and push batch declares how many SQL queries
+and GHL calls it may make: a fixed amount per page (or per swept contact),
+whatever the page size. Reads, writes, creates and binding upserts are all
+batched per page, so no SQL is allowed per record: a change that adds a
+query per record shows up as soon as it runs. Only the push makes GHL calls
+per record, one per record sent.
+
+The ``odoo_ghl.query_guard`` system parameter selects what happens when a
+budget is exceeded: ``warn`` (default) logs it, ``strict`` raises (for
+staging / CI databases) and ``off`` skips the measurement.
+"""
+import dataclasses
+import logging
+import threading
+
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+# GHL call counter of each thread, see call_counter()
+_local = threading.local()
+
+
+class CallCounter:
+    """GHL calls made on behalf of one thread.
+
+    The page prefetcher and the push pool are handed the counter of the
+    thread that started them, so their calls count towards its run and not
+    towards whatever else the process is doing at the same time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def add(self):
+        with self._lock:
+            self.count += 1
+
+
+def call_counter():
+    """The GHL call counter of the current thread."""
+    counter = getattr(_local, "counter", None)
+    if counter is None:
+        counter = _local.counter = CallCounter()
+    return counter
+
+
+def http_call_count():
+    """GHL calls made by the current thread (and its helpers) so far."""
+    return call_counter().count
+
+
+@dataclasses.dataclass(frozen=True)
+class QueryBudget:
+    """Allowed SQL queries / GHL calls per unit and per written record."""
+
+    sql: int
+    http: int
+    sql_per_record: int = 0
+    http_per_record: int = 0
+
+
+QUERY_BUDGETS = {
+    # One page of contacts / opportunities: bindings, record reads, lookups
+    # and the batched writes
+    "contacts": QueryBudget(sql=30, http=1),
+    "opportunities": QueryBudget(sql=30, http=1),
+    # Per swept contact: its fetch, plus binding / scope queries and one savepoint
+    "tasks": QueryBudget(sql=8, http=1),
+    "notes": QueryBudget(sql=6, http=1),
+    # One page of the location-wide task search
+    "task_search": QueryBudget(sql=30, http=1),
+    # One push batch; a duplicate contact costs a second call
+    "push": QueryBudget(sql=20, http=0, http_per_record=2),
+}
+
+
+class GHLQueryBudgetError(UserError):
+    """Raised in strict mode when a sync unit exceeds its query budget."""
+
+
+class QueryGuard:
+    """Measure the queries and calls of consecutive units of sync work.
+
+    ``extra_http`` allows calls made ahead of time by the page prefetcher.
+    """
+
+    def __init__(self, backend, name, extra_http=0):
+        self.cr = backend.env.cr
+        self.counter = call_counter()
+        self.name = name
+        self.budget = QUERY_BUDGETS[name]
+        self.mode = backend._get_config_snapshot().query_guard
+        self.extra_http = extra_http
+        self.start()
+
+    def start(self):
+        self._sql = self.cr.sql_log_count
+        self._http = self.counter.count
+
+    def check(self, records=0, units=1):
+        """Compare the usage since ``start`` with the budget, then restart."""
+        if self.mode == "off":
+            return
+        sql = self.cr.sql_log_count - self._sql
+        http = self.counter.count - self._http
+        budget = self.budget
+        max_sql = budget.sql * units + budget.sql_per_record * records
+        max_http = budget.http * units + budget.http_per_record * records + self.extra_http
+        self.start()
+        if sql <= max_sql and http <= max_http:
+            return
+        message = (
+            f"GHL {self.name} sync exceeded its query budget: {sql} SQL queries "
+            f"(max {max_sql}) and {http} GHL calls (max {max_http}) for {units} "
+            f"unit(s) and {records} written record(s)"
+        )
+        if self.mode == "strict":
+            raise GHLQueryBudgetError(message)
+        _logger.warning(message)
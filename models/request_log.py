@@ -0,0 +1,126 @@
+# odoo_gohighlevel_connector/models/request_log.py
+"""Structured, redacted logging of the GHL API calls.
+
+Every call logs one summary line (endpoint template, status, latency,
+bytes) carrying the same fields as ``extra={"ghl_call": {...}}`` for JSON
+log formatters. Payloads are only logged for a configurable sample of the
+calls, and anything logged goes through ``redact`` first: contact data
+(PII) and credentials never reach the logs. ORM-free, like ``_ghl_http``.
+"""
+import json
+import logging
+import random
+import re
+
+_logger = logging.getLogger(__name__)
+
+# Keys whose values are personal data or credentials (compared lowercased)
+REDACTED_KEYS = {
+    "authorization", "token", "api_token", "apikey", "access_token", "refresh_token",
+    "email", "phone", "firstname", "lastname", "name", "fullnamelowercase", "contactname",
+    "address1", "city", "state", "postalcode", "companyname", "website", "dateofbirth",
+    "body", "title", "tags",
+}
+MASK = "***"
+
+# Path segments that are record ids: GHL ids and numbers
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[A-Za-z0-9]{12,}$|^\d+$")
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_PHONE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+_BEARER = re.compile(r"Bearer\s+\S+", re.IGNORECASE)
+
+# Longest error body logged, after redaction
+MAX_LOGGED_BODY = 500
+
+
+def endpoint_template(url):
+    """``https://…/contacts/abc123…/tasks?x=1`` -> ``/contacts/{id}/tasks``."""
+    path = re.sub(r"^https?://[^/]+", "", url).split("?", 1)[0]
+    return "/".join("{id}" if _ID_SEGMENT.match(seg) else seg for seg in path.split("/"))
+
+
+def redact(value):
+    """Copy of a JSON-like ``value`` with personal data and credentials masked."""
+    if isinstance(value, dict):
+        return {
+            k: MASK if str(k).lower() in REDACTED_KEYS and v not in (None, "", []) else redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v) for v in value]
+    if isinstance(value, str):
+        return redact_text(value)
+    return value
+
+
+def redact_text(text):
+    """Mask e-mails, phone numbers and bearer tokens in free text (or JSON text).
+
+    JSON text is masked by key, like ``redact``. In free text only values
+    with a recognisable shape are found: names, addresses and other
+    personal data in prose go through untouched, so raw GHL response
+    bodies are kept out of exception messages (see ``GHLAPIError``).
+    """
+    text = str(text)
+    try:
+        decoded = json.loads(text)
+    except ValueError:
+        decoded = None
+    if isinstance(decoded, (dict, list)):
+        return json.dumps(redact(decoded))
+    text = _BEARER.sub("Bearer " + MASK, text)
+    text = _EMAIL.sub(MASK, text)
+    return _PHONE.sub(MASK, text)
+
+
+def log_call(method, url, status, elapsed, size, params=None, payload=None, body=None, sample_rate=0.0):
+    """Log the summary line of one GHL call.
+
+    Failed calls also log their redacted, truncated response ``body``; the
+    redacted ``params`` / ``payload`` are logged for a ``sample_rate``
+    share of the calls (0 = never, 1 = always).
+    """
+    summary = {
+        "method": method,
+        "endpoint": endpoint_template(url),
+        "status": status,
+        "latency_ms": round(elapsed * 1000),
+        "bytes": size,
+    }
+    if sample_rate > 0 and random.random() < sample_rate:
+        summary["params"] = redact(params or {})
+        summary["payload"] = redact(payload)
+    failed = status is None or status >= 400
+    if failed and body:
+        summary["error"] = redact_text(body)[:MAX_LOGGED_BODY]
+    _logger.log(
+        logging.WARNING if failed else logging.INFO,
+        "GHL %s",
+        " ".join(f"{key}={json.dumps(value) if isinstance(value, (dict, list)) else value}"
+                 for key, value in summary.items()),
+        extra={"ghl_call": summary},
+    )
+
+
+def log_error(logger, message, error, *args):
+    """Log ``error`` on ``logger`` as one redacted ERROR line.
+
+    The traceback, whose last line repeats the unredacted error, is only
+    logged at DEBUG level.
+    """
+    logger.error(message + ": %s", *args, redact_text(error))
+    logger.debug("Traceback of the error above:", exc_info=error)
+
+
+def log_summary(what, level=logging.INFO, **fields):
+    """Log one ``key=value`` summary record for a page, batch or run.
+
+    The fields are also passed as ``extra={"ghl_summary": {...}}``.
+    """
+    _logger.log(
+        level,
+        "GHL %s: %s",
+        what,
+        " ".join(f"{key}={value}" for key, value in fields.items()),
+        extra={"ghl_summary": {"what": what, **fields}},
+    )
@@ -1,5 +1,5 @@
 # odoo_gohighlevel_connector/models/sync_mixin.py
-from odoo import models, fields
+from odoo import api, models, fields
 
 
 class GHLSyncMixin(models.AbstractModel):
@@ -7,23 +7,101 @@ class GHLSyncMixin(models.AbstractModel):
     _description = "GoHighLevel Sync Mixin"
     _abstract = True
 
+    # Binding state lives in ghl.binding; these fields are views on it
     ghl_id = fields.Char(
         string="GoHighLevel ID",
-        index=True,
+        compute="_compute_ghl_id",
+        inverse="_inverse_ghl_binding",
+        search="_search_ghl_id",
         copy=False,
         help="Record ID in GoHighLevel",
     )
     ghl_remote_updated_at = fields.Datetime(
         string="GHL Remote Updated At",
+        compute="_compute_ghl_remote_updated_at",
+        inverse="_inverse_ghl_binding",
         copy=False,
         help="Last updatedAt from GoHighLevel applied to this record",
     )
     ghl_last_synced_at = fields.Datetime(
         string="GHL Last Synced At",
+        compute="_compute_ghl_last_synced_at",
+        inverse="_inverse_ghl_binding",
         copy=False,
         help="Last time this record was synced with GoHighLevel",
     )
+    ghl_remote_hash = fields.Char(
+        string="GHL Fingerprint",
+        compute="_compute_ghl_remote_hash",
+        inverse="_inverse_ghl_binding",
+        copy=False,
+        help="Hash of the GHL values last synced, used to recognise our own echoes",
+    )
     ghl_skip_sync = fields.Boolean(
         string="Skip GHL Sync",
         help="If enabled, this record will not be synced with GoHighLevel",
     )
+
+    def _get_ghl_bindings(self):
+        return {
+            b.res_id: b
+            for b in self.env["ghl.binding"].sudo().search_fetch(
+                [("model", "=", self._name), ("res_id", "in", self._origin.ids)],
+                ["res_id", "ghl_id", "remote_updated_at", "last_synced_at", "remote_hash"],
+            )
+        }
+
+    # One compute per field: a shared compute would overwrite the cached
+    # values of sibling fields while they are being written
+    def _compute_ghl_id(self):
+        bindings = self._get_ghl_bindings()
+        no_binding = self.env["ghl.binding"]
+        for rec in self:
+            rec.ghl_id = bindings.get(rec._origin.id, no_binding).ghl_id
+
+    def _compute_ghl_remote_updated_at(self):
+        bindings = self._get_ghl_bindings()
+        no_binding = self.env["ghl.binding"]
+        for rec in self:
+            rec.ghl_remote_updated_at = bindings.get(rec._origin.id, no_binding).remote_updated_at
+
+    def _compute_ghl_last_synced_at(self):
+        bindings = self._get_ghl_bindings()
+        no_binding = self.env["ghl.binding"]
+        for rec in self:
+            rec.ghl_last_synced_at = bindings.get(rec._origin.id, no_binding).last_synced_at
+
+    def _compute_ghl_remote_hash(self):
+        bindings = self._get_ghl_bindings()
+        no_binding = self.env["ghl.binding"]
+        for rec in self:
+            rec.ghl_remote_hash = bindings.get(rec._origin.id, no_binding).remote_hash
+
+    def _inverse_ghl_binding(self):
+        Binding = self.env["ghl.binding"].sudo()
+        bound = self.filtered("ghl_id")
+        Binding._bind(self._name, [
+            {
+                "res_id": rec.id,
+                "ghl_id": rec.ghl_id,
+                "remote_updated_at": rec.ghl_remote_updated_at,
+                "last_synced_at": rec.ghl_last_synced_at,
+                "remote_hash": rec.ghl_remote_hash,
+            }
+            for rec in bound
+        ])
+        Binding._unbind(self._name, (self - bound).ids)
+
+    @api.model
+    def _search_ghl_id(self, operator, value):
+        # Subqueries on ghl_binding: the bound ids never go through Python
+        Binding = self.env["ghl.binding"].sudo()
+        if operator in ("=", "!=") and not value:
+            bound = Binding._search([("model", "=", self._name)])
+            return [("id", "in" if operator == "!=" else "not in", bound.subselect("res_id"))]
+        matching = Binding._search([("model", "=", self._name), ("ghl_id", operator, value)])
+        return [("id", "in", matching.subselect("res_id"))]
+
+    def unlink(self):
+        self.env["ghl.binding"].sudo()._unbind(self._name, self.ids)
+        return super().unlink()
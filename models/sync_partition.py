@@ -0,0 +1,262 @@
+# odoo_gohighlevel_connector/models/sync_partition.py
+import logging
+import os
+import socket
+import threading
+
+from psycopg2 import errors
+
+from odoo import api, fields, models
+
+from .circuit_breaker import GHLCircuitOpenError
+from .request_log import log_error, redact_text
+from .sync_run import ENTITY_PULLS
+
+_logger = logging.getLogger(__name__)
+
+# Entities whose pull is a per-contact sweep that can be split across workers
+PARTITIONED_ENTITIES = [
+    ('tasks', 'Tasks'),
+    ('notes', 'Notes'),
+]
+
+# Leases the oldest-swept partition that is pending, or whose lease expired
+# with an owner still set (its worker died mid-sweep)
+CLAIM_QUERY = """
+    UPDATE ghl_sync_partition
+       SET owner = %s,
+           lease_until = (now() at time zone 'UTC') + make_interval(secs => %s),
+           pending = false
+     WHERE id = (
+        SELECT id FROM ghl_sync_partition
+         WHERE (pending OR owner IS NOT NULL)
+           AND (lease_until IS NULL OR lease_until < (now() at time zone 'UTC'))
+         ORDER BY last_done_at NULLS FIRST, id
+         LIMIT 1
+         FOR UPDATE SKIP LOCKED
+     )
+    RETURNING id, entity, partition
+"""
+
+# Takes the latest updates the partitions of an entity pulled, once none of
+# them is pending, leased or failed: the round is complete
+ROUND_DONE_QUERY = """
+    WITH done AS (
+        SELECT id, latest FROM ghl_sync_partition
+         WHERE entity = %s AND latest IS NOT NULL
+           AND NOT EXISTS (
+               SELECT 1 FROM ghl_sync_partition
+                WHERE entity = %s AND (pending OR owner IS NOT NULL OR last_error IS NOT NULL)
+           )
+           FOR UPDATE
+    )
+    UPDATE ghl_sync_partition SET latest = NULL
+      FROM done
+     WHERE ghl_sync_partition.id = done.id
+    RETURNING done.latest
+"""
+
+
+class GHLSyncPartition(models.Model):
+    """One hash partition of the per-contact task / note sweep.
+
+    Polling only marks the partitions of an entity as pending; the sweep
+    worker crons claim them through a time-limited lease, so several workers
+    (on any node) sweep in parallel. A partition whose lease ran out because
+    its worker died is claimed again by the next worker.
+    """
+
+    _name = "ghl.sync.partition"
+    _description = "GoHighLevel Sweep Partition"
+    _order = "entity, partition"
+    _log_access = False
+
+    entity = fields.Selection(PARTITIONED_ENTITIES, string="Record Type", required=True, readonly=True)
+    partition = fields.Integer(string="Partition", required=True, readonly=True)
+    pending = fields.Boolean(string="Pending", readonly=True)
+    owner = fields.Char(string="Leased By", readonly=True)
+    lease_until = fields.Datetime(string="Lease Expires", readonly=True)
+    last_done_at = fields.Datetime(string="Last Sweep", readonly=True)
+    last_changes = fields.Integer(string="Last Changes", readonly=True)
+    latest = fields.Datetime(
+        string="Latest Update", readonly=True,
+        help="Latest GHL update pulled this round, until the watermark moves past it",
+    )
+    last_error = fields.Text(string="Last Error", readonly=True)
+
+    _sql_constraints = [
+        ('entity_partition_uniq', 'unique(entity, partition)', 'Each partition can only exist once per record type.'),
+    ]
+
+    @api.model
+    def _get_settings(self):
+        ICP = self.env["ir.config_parameter"].sudo()
+        return {
+            "count": max(int(ICP.get_param("odoo_ghl.sweep_partitions", default="1") or 1), 1),
+            "lease": max(int(ICP.get_param("odoo_ghl.partition_lease_seconds", default="600") or 600), 30),
+        }
+
+    @api.model
+    def _worker_id(self):
+        return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+    @api.model
+    def _execute(self, query, params):
+        """Run ``query`` on its own committed cursor, visible to all workers."""
+        with self.env.registry.cursor() as cr:
+            cr.execute(query, params)
+            return cr.fetchone()
+
+    @api.model
+    def _schedule(self, entity):
+        """Mark every partition of ``entity`` pending and wake the workers.
+
+        Returns the number of changes applied by the previous round, which
+        stands in for the pull result in adaptive polling.
+        """
+        count = self._get_settings()["count"]
+        cr = self.env.cr
+        cr.execute(
+            "DELETE FROM ghl_sync_partition WHERE entity = %s AND partition >= %s",
+            (entity, count),
+        )
+        cr.execute(
+            "SELECT COALESCE(SUM(last_changes), 0) FROM ghl_sync_partition WHERE entity = %s",
+            (entity,),
+        )
+        changes = cr.fetchone()[0]
+        cr.execute(
+            """
+            INSERT INTO ghl_sync_partition (entity, partition, pending)
+            SELECT %s, p, true FROM generate_series(0, %s - 1) AS p
+            ON CONFLICT (entity, partition) DO UPDATE SET pending = true
+            """,
+            (entity, count),
+        )
+        self.invalidate_model()
+        self._trigger_workers()
+        return changes
+
+    @api.model
+    def _trigger_workers(self):
+        crons = self.env["ir.cron"].sudo().search([("model_id.model", "=", self._name)])
+        for cron in crons:
+            cron._trigger()
+
+    @api.model
+    def _claim(self, worker):
+        """Lease the next pending (or abandoned) partition to ``worker``.
+
+        Returns ``(id, entity, partition)``, or None when there is nothing
+        left to sweep.
+        """
+        for _attempt in range(3):
+            try:
+                return self._execute(CLAIM_QUERY, (worker, self._get_settings()["lease"]))
+            except errors.SerializationFailure:
+                continue  # Another worker claimed the same row concurrently
+        return None
+
+    def _renew(self, worker):
+        """Extend the lease; False when it expired and was taken over."""
+        self.ensure_one()
+        row = self._execute(
+            """
+            UPDATE ghl_sync_partition
+               SET lease_until = (now() at time zone 'UTC') + make_interval(secs => %s)
+             WHERE id = %s AND owner = %s
+            RETURNING id
+            """,
+            (self._get_settings()["lease"], self.id, worker),
+        )
+        return bool(row)
+
+    def _release(self, worker, changes=0, error=None, retry=False):
+        self.ensure_one()
+        self._execute(
+            """
+            UPDATE ghl_sync_partition
+               SET owner = NULL,
+                   lease_until = NULL,
+                   pending = pending OR %s,
+                   last_done_at = (now() at time zone 'UTC'),
+                   last_changes = %s,
+                   last_error = %s
+             WHERE id = %s AND owner = %s
+            RETURNING id
+            """,
+            (retry, changes, error and redact_text(error)[:2000], self.id, worker),
+        )
+
+    @api.model
+    def _record_latest(self, entity, partition, latest):
+        """Keep the latest update the sweep of a partition pulled.
+
+        Runs in the transaction of the sweep; the watermark only moves once
+        the whole round is done (see ``_complete_round``).
+        """
+        self.env.cr.execute(
+            """
+            UPDATE ghl_sync_partition
+               SET latest = GREATEST(latest, %s)
+             WHERE entity = %s AND partition = %s
+            """,
+            (latest, entity, partition),
+        )
+        self.invalidate_model(["latest"])
+
+    @api.model
+    def _complete_round(self, entity):
+        """Advance the watermark of ``entity`` once all its partitions are swept.
+
+        Until then a partition still sweeping (or failed) could miss updates
+        older than what the others pulled.
+        """
+        self.env.cr.execute(ROUND_DONE_QUERY, (entity, entity))
+        latest = max((row[0] for row in self.env.cr.fetchall()), default=None)
+        if latest:
+            self.env["ghl.sync.state"].sudo()._advance_watermark(entity, latest)
+        self.invalidate_model(["latest"])
+
+    @api.model
+    def cron_sweep_partitions(self):
+        """Called by the sweep worker crons: claim and sweep until none are left.
+
+        Stops when the cron time budget is used up; a partition interrupted
+        mid-sweep stays pending and continues where it stopped in the next
+        slice.
+        """
+        backend = self.env["odoo.ghl.backend"]._with_budget()._with_lane("poll")
+        count = self._get_settings()["count"]
+        worker = self._worker_id()
+        while True:
+            if backend._budget_exhausted():
+                self._trigger_workers()
+                return
+            claimed = self._claim(worker)
+            if not claimed:
+                return
+            part_id, entity, index = claimed
+            part = self.browse(part_id)
+            pull = getattr(
+                backend.with_context(ghl_sync_partition_id=part_id, ghl_sync_worker=worker),
+                ENTITY_PULLS[entity],
+            )
+            try:
+                changes = pull(partition=(index, count)) or 0
+                self.env.cr.commit()
+            except GHLCircuitOpenError as e:
+                self.env.cr.rollback()
+                part._release(worker, error=e, retry=True)
+                _logger.info("GHL circuit breaker is open, leaving %s partition %s pending.", entity, index)
+                return
+            except Exception as e:
+                self.env.cr.rollback()
+                log_error(_logger, "GHL %s sweep of partition %s failed", e, entity, index)
+                part._release(worker, error=e)
+                continue
+            sliced = bool(backend._get_resume(backend._resume_key(entity, (index, count))))
+            part._release(worker, changes=changes, retry=sliced)
+            if not sliced:
+                self._complete_round(entity)
+                self.env.cr.commit()
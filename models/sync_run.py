@@ -0,0 +1,208 @@
+# odoo_gohighlevel_connector/models/sync_run.py
+import logging
+
+from odoo import _, api, fields, models
+from odoo.exceptions import UserError
+
+from .request_log import log_error, redact_text
+
+_logger = logging.getLogger(__name__)
+
+SYNC_ENTITIES = [
+    ('contacts', 'Contacts'),
+    ('opportunities', 'Opportunities'),
+    ('tasks', 'Tasks'),
+    ('notes', 'Notes'),
+]
+
+# Backend pull method per entity, in the order they are run
+ENTITY_PULLS = {
+    'contacts': 'pull_contacts',
+    'opportunities': 'pull_opportunities',
+    'tasks': 'pull_tasks',
+    'notes': 'pull_notes',
+}
+
+
+class GHLSyncRun(models.Model):
+    """A sync job processed in the background by the run processor cron.
+
+    Pull methods report progress into the run's lines and commit at page
+    boundaries, so progress is visible while the run is going and a
+    cancellation takes effect at the next page.
+    """
+
+    _name = "ghl.sync.run"
+    _description = "GoHighLevel Sync Run"
+    _order = "id desc"
+
+    name = fields.Char(string="Name", required=True, default=lambda self: _("Manual Sync"))
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('cancelled', 'Cancelled'),
+        ('failed', 'Failed'),
+    ], string="State", default='draft', required=True)
+    sync_contacts = fields.Boolean(string="Contacts", default=lambda self: self._default_entity("sync_contacts"))
+    sync_opportunities = fields.Boolean(string="Opportunities", default=lambda self: self._default_entity("sync_opportunities"))
+    sync_tasks = fields.Boolean(string="Tasks", default=lambda self: self._default_entity("sync_tasks"))
+    sync_notes = fields.Boolean(string="Notes", default=lambda self: self._default_entity("sync_notes"))
+    cancel_requested = fields.Boolean(string="Cancel Requested")
+    started_at = fields.Datetime(string="Started At", readonly=True)
+    finished_at = fields.Datetime(string="Finished At", readonly=True)
+    error_message = fields.Text(string="Error Message", readonly=True)
+    line_ids = fields.One2many("ghl.sync.run.line", "run_id", string="Progress")
+
+    @api.model
+    def _default_entity(self, key):
+        return self.env["odoo.ghl.backend"]._get_config()[key]
+
+    def action_start(self):
+        cron = self.env.ref("odoo_gohighlevel_connector.ir_cron_odoo_ghl_process_sync_runs")
+        for run in self:
+            if run.state != 'draft':
+                continue
+            entities = [e for e, _label in SYNC_ENTITIES if run[f"sync_{e}"]]
+            if not entities:
+                raise UserError(_("Select at least one record type to sync."))
+            run.write({
+                'state': 'queued',
+                'line_ids': [(0, 0, {'entity': e, 'sequence': i}) for i, e in enumerate(entities)],
+            })
+        cron.sudo()._trigger()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self[:1].id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+    def action_cancel(self):
+        waiting = self.filtered(lambda r: r.state in ('draft', 'queued'))
+        waiting.write({
+            'state': 'cancelled',
+            'finished_at': fields.Datetime.now(),
+        })
+        for run in waiting:
+            run._drop_resume()  # A queued run may have been sliced
+        self.filtered(lambda r: r.state == 'running').write({'cancel_requested': True})
+
+    def _is_cancel_requested(self):
+        self.invalidate_recordset(["cancel_requested"])
+        return self.cancel_requested
+
+    @api.model
+    def cron_process_runs(self):
+        """Process queued runs one at a time, committing as it goes.
+
+        Runs within the cron time budget: a run whose current pull ran out
+        of time goes back to the queue and the cron re-triggers itself to
+        continue it in a fresh slice. Left to the dedicated sync worker
+        while it is running.
+        """
+        if self.env["odoo.ghl.backend"]._sync_worker_active():
+            return
+        # Backfills: the bulk lane yields to interactive pushes and polls
+        self = self.with_env(self.env["odoo.ghl.backend"]._with_budget()._with_lane("bulk").env)
+        cron = self.env.ref("odoo_gohighlevel_connector.ir_cron_odoo_ghl_process_sync_runs").sudo()
+        while True:
+            if self.env["odoo.ghl.backend"]._budget_exhausted():
+                cron._trigger()
+                return
+            self.env.cr.execute("""
+                SELECT id FROM ghl_sync_run
+                WHERE state = 'queued'
+                ORDER BY id
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            """)
+            row = self.env.cr.fetchone()
+            if not row:
+                return
+            if self.browse(row[0])._process():
+                cron._trigger()
+                return
+
+    def _process(self):
+        """Run the run's remaining lines; True when it was sliced off early."""
+        self.ensure_one()
+        # Resume cursors of its own, apart from those of the poll cron
+        backend = self.env["odoo.ghl.backend"].with_context(ghl_sync_run_id=self.id)
+        self.write({'state': 'running', 'started_at': self.started_at or fields.Datetime.now()})
+        self.env.cr.commit()
+        try:
+            for line in self.line_ids.filtered(lambda l: l.state in ('pending', 'running')).sorted("sequence"):
+                if self._is_cancel_requested():
+                    break
+                line.write({'state': 'running', 'started_at': line.started_at or fields.Datetime.now()})
+                self.env.cr.commit()
+                pull = getattr(backend.with_context(ghl_sync_run_line_id=line.id), ENTITY_PULLS[line.entity])
+                pull()
+                if backend._get_resume(backend._resume_key(line.entity)) and not self._is_cancel_requested():
+                    # Out of time: the line continues in the next slice
+                    self.write({'state': 'queued'})
+                    self.env.cr.commit()
+                    return True
+                line.write({
+                    'state': 'cancelled' if self._is_cancel_requested() else 'done',
+                    'finished_at': fields.Datetime.now(),
+                })
+                self.env.cr.commit()
+        except Exception as e:
+            self.env.cr.rollback()
+            log_error(_logger, "GHL sync run %s failed", e, self.id)
+            self.line_ids.filtered(lambda l: l.state == 'running').write({'state': 'failed'})
+            self.write({'state': 'failed', 'error_message': redact_text(e), 'finished_at': fields.Datetime.now()})
+            self._drop_resume()
+            self.env.cr.commit()
+            return False
+        cancelled = self._is_cancel_requested()
+        self.line_ids.filtered(lambda l: l.state in ('pending', 'running')).write({
+            'state': 'cancelled' if cancelled else 'done',
+        })
+        self.write({'state': 'cancelled' if cancelled else 'done', 'finished_at': fields.Datetime.now()})
+        self._drop_resume()
+        self.env.cr.commit()
+        return False
+
+    def _drop_resume(self):
+        """Forget where the lines of this finished run stopped."""
+        self.ensure_one()
+        self.env["ghl.sync.state"].sudo()._drop(f"run:{self.id}:")
+
+
+class GHLSyncRunLine(models.Model):
+    _name = "ghl.sync.run.line"
+    _description = "GoHighLevel Sync Run Progress"
+    _order = "sequence, id"
+
+    run_id = fields.Many2one("ghl.sync.run", string="Run", required=True, ondelete="cascade")
+    sequence = fields.Integer(string="Sequence")
+    entity = fields.Selection(SYNC_ENTITIES, string="Record Type", required=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('cancelled', 'Cancelled'),
+        ('failed', 'Failed'),
+    ], string="State", default='pending', required=True)
+    pages = fields.Integer(string="Pages")
+    records = fields.Integer(string="Processed", help="Records (or contacts, for tasks and notes) processed so far")
+    total = fields.Integer(string="Total", help="Total reported by GoHighLevel, when known")
+    started_at = fields.Datetime(string="Started At")
+    finished_at = fields.Datetime(string="Finished At")
+    eta = fields.Char(string="ETA", compute="_compute_eta")
+
+    @api.depends("records", "total", "started_at", "state")
+    def _compute_eta(self):
+        now = fields.Datetime.now()
+        for line in self:
+            line.eta = False
+            if line.state != 'running' or not (line.records and line.total and line.started_at):
+                continue
+            elapsed = (now - line.started_at).total_seconds()
+            remaining = max(line.total - line.records, 0) * elapsed / line.records
+            line.eta = _("~%s min") % max(round(remaining / 60), 1)
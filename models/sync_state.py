@@ -0,0 +1,135 @@
+# odoo_gohighlevel_connector/models/sync_state.py
+import json
+
+from odoo import api, fields, models
+
+# Columns _set may write, and the watermark, which only ever moves forward
+STATE_COLUMNS = ("cursor", "next_poll", "poll_interval", "last_run_at", "last_changes", "page_size")
+
+
+class GHLSyncState(models.Model):
+    """Sync position of one GHL location, per entity or sweep.
+
+    Holds what used to live in ``ir.config_parameter``: the pull
+    watermarks, the resume cursors of sliced pulls (``contacts``,
+    ``reconcile_contacts``, ``tasks_0_of_4``…), the adaptive poll
+    schedule and the page size of the adaptive pulls. Writing a system
+    parameter clears the registry caches and signals every worker; these
+    rows are upserted on the cursor of the
+    pull instead, so they commit together with the records they describe
+    and invalidate nothing but themselves.
+    """
+
+    _name = "ghl.sync.state"
+    _description = "GoHighLevel Sync State"
+    _order = "location_id, key"
+    _log_access = False
+
+    location_id = fields.Char(string="Location ID", required=True, readonly=True)
+    key = fields.Char(string="Key", required=True, readonly=True)
+    watermark = fields.Datetime(
+        string="Watermark", readonly=True,
+        help="Latest GHL update pulled: the next incremental pull starts there",
+    )
+    cursor = fields.Json(string="Resume Cursor", readonly=True)
+    next_poll = fields.Datetime(string="Next Poll", readonly=True)
+    poll_interval = fields.Float(string="Poll Interval (minutes)", readonly=True)
+    last_run_at = fields.Datetime(string="Last Run", readonly=True)
+    last_changes = fields.Integer(string="Last Changes", readonly=True)
+    page_size = fields.Integer(
+        string="Page Size", readonly=True,
+        help="Page size the adaptive pulls settled on, used by the next run",
+    )
+
+    _sql_constraints = [
+        ('location_key_uniq', 'unique(location_id, key)', 'Each sync state can only exist once per location.'),
+    ]
+
+    @api.model
+    def _location(self):
+        return self.env["odoo.ghl.backend"]._get_config_snapshot().location_id or "-"
+
+    @api.model
+    def _get(self, key):
+        """The state row of ``key`` as a dict ({} when there is none)."""
+        self.flush_model()
+        self.env.cr.execute(
+            f"SELECT watermark, {', '.join(STATE_COLUMNS)} FROM ghl_sync_state WHERE location_id = %s AND key = %s",
+            (self._location(), key),
+        )
+        row = self.env.cr.dictfetchone()
+        return row or {}
+
+    @api.model
+    def _get_watermarks(self, keys):
+        """Return {key: watermark} for the given keys, in one query."""
+        self.flush_model()
+        self.env.cr.execute(
+            "SELECT key, watermark FROM ghl_sync_state WHERE location_id = %s AND key IN %s",
+            (self._location(), tuple(keys)),
+        )
+        return {key: watermark for key, watermark in self.env.cr.fetchall() if watermark}
+
+    @api.model
+    def _set(self, key, **values):
+        """Upsert the given ``STATE_COLUMNS`` of ``key``; None clears a column.
+
+        A single INSERT … ON CONFLICT, so concurrent runs creating the same
+        row cannot fail on the unique index.
+        """
+        columns = [column for column in STATE_COLUMNS if column in values]
+        params = [
+            json.dumps(values[column]) if column == "cursor" and values[column] is not None else values[column]
+            for column in columns
+        ]
+        self._upsert(key, columns, params)
+
+    @api.model
+    def _advance_watermark(self, key, watermark):
+        """Move the watermark of ``key`` forward to ``watermark``.
+
+        Never moves it back, so a slower concurrent pull finishing last
+        cannot undo the progress of a faster one.
+        """
+        self._upsert(key, ["watermark"], [watermark], "GREATEST(ghl_sync_state.watermark, EXCLUDED.watermark)")
+
+    @api.model
+    def _reset(self, keys=None):
+        """Clear the watermarks, cursors and poll schedules (of ``keys``)."""
+        self.flush_model()
+        query = "UPDATE ghl_sync_state SET watermark = NULL, cursor = NULL, next_poll = NULL WHERE location_id = %s"
+        params = [self._location()]
+        if keys is not None:
+            query += " AND key IN %s"
+            params.append(tuple(keys))
+        self.env.cr.execute(query, params)
+        self.invalidate_model()
+
+    @api.model
+    def _drop(self, prefix):
+        """Delete the state rows whose key starts with ``prefix``."""
+        self.flush_model()
+        self.env.cr.execute(
+            "DELETE FROM ghl_sync_state WHERE location_id = %s AND key LIKE %s",
+            (self._location(), prefix.replace("%", r"\%").replace("_", r"\_") + "%"),
+        )
+        self.invalidate_model()
+
+    def _upsert(self, key, columns, params, watermark_update=None):
+        if not columns:
+            return
+        updates = [
+            f"{column} = {watermark_update}" if column == "watermark" and watermark_update
+            else f"{column} = EXCLUDED.{column}"
+            for column in columns
+        ]
+        self.flush_model()
+        self.env.cr.execute(
+            f"""
+            INSERT INTO ghl_sync_state (location_id, key, {', '.join(columns)})
+            VALUES (%s, %s, {', '.join(['%s'] * len(columns))})
+            ON CONFLICT (location_id, key) DO UPDATE SET {', '.join(updates)}
+            """,
+            [self._location(), key, *params],
+        )
+        self.invalidate_model()
@@ -12,23 +12,14 @@ class ProjectTask(models.Model):
             return super().create(vals_list)
         tasks = super().create(vals_list)
         backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
-        if (
-            cfg["sync_tasks"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for t in tasks:
-                if not t.ghl_skip_sync:
-                    backend.push_task(t)
+        if backend._get_config_snapshot().push_on_save("sync_tasks"):
+            backend.push_records(tasks, raise_errors=True)
         return tasks
 
     def write(self, vals):
         if self.env.context.get("ghl_sync_running"):
             return super().write(vals)
         res = super().write(vals)
-        backend = self.env["odoo.ghl.backend"]
-        cfg = backend._get_config()
         # Define fields that should trigger a sync
         synced_fields = {
             "name", "description", "date_deadline", "user_ids",
@@ -39,12 +30,7 @@ class ProjectTask(models.Model):
         if not any(field in vals for field in synced_fields):
             return res
 
-        if (
-            cfg["sync_tasks"]
-            and cfg["sync_direction"] in ("odoo_to_ghl", "both")
-            and cfg["sync_on"] == "create_update"
-        ):
-            for t in self:
-                if not t.ghl_skip_sync:
-                    backend.push_task(t)
+        backend = self.env["odoo.ghl.backend"]
+        if backend._get_config_snapshot().push_on_save("sync_tasks"):
+            backend.push_records(self, raise_errors=True)
         return res
@@ -0,0 +1,8 @@
+# odoo_gohighlevel_connector/tests/__init__.py
+from . import test_query_budget
+from . import test_pull
+from . import test_push
+from . import test_circuit_breaker
+from . import test_scope
+from . import test_page_size
+from . import test_sweep_partition
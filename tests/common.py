@@ -0,0 +1,132 @@
+# odoo_gohighlevel_connector/tests/common.py
+import json
+import re
+import threading
+from urllib.parse import parse_qsl, urlsplit
+
+from odoo.tests.common import TransactionCase
+
+from odoo.addons.odoo_gohighlevel_connector.models import backend as backend_module
+from odoo.addons.odoo_gohighlevel_connector.models.circuit_breaker import _breaker_cache
+from odoo.addons.odoo_gohighlevel_connector.models.query_guard import QUERY_BUDGETS
+
+LOCATION_ID = "loc1"
+
+# Queries a pull or push may spend outside its guarded pages and batches:
+# settings, watermarks, resume cursor, page size and lookup tables
+RUN_OVERHEAD = 40
+
+UPDATED_AT = "2026-01-01T10:00:00.000Z"
+
+
+def contact_row(i, **values):
+    """GHL contact ``c<i>`` as the contact list returns it."""
+    return {"id": f"c{i}", "firstName": f"Contact {i}", "dateUpdated": UPDATED_AT, **values}
+
+
+class FakeResponse:
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.text = json.dumps(body) if body is not None else ""
+        self.content = self.text.encode()
+        self.headers = {}
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeGHL:
+    """Stand-in for the shared ``requests`` session of the backend.
+
+    Answers each call with the handler routed to its method and path; a
+    handler gets the merged query / params, the JSON payload and the groups
+    of the path pattern, and returns a body or a ``(status, body)`` pair.
+    Thread-safe, like the session it replaces.
+    """
+
+    def __init__(self):
+        self.routes = []
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def route(self, method, pattern, handler):
+        self.routes.append((method, re.compile(pattern), handler))
+
+    def request(self, method, url, headers=None, params=None, json=None, timeout=None):
+        parts = urlsplit(url)
+        query = {**dict(parse_qsl(parts.query)), **(params or {})}
+        with self._lock:
+            self.calls.append((method, parts.path, query, json))
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(parts.path)
+            if route_method == method and match:
+                result = handler(query, json, *match.groups())
+                status, body = result if isinstance(result, tuple) else (200, result)
+                return FakeResponse(status, body)
+        return FakeResponse(404, {"message": f"No route for {method} {parts.path}"})
+
+
+def paged(key, rows, path):
+    """Handler serving ``rows`` under ``key`` the way the GHL list endpoints
+    do: ``limit`` sets the page size and ``meta.nextPageUrl`` carries the
+    cursor of the next page."""
+
+    def handler(query, payload):
+        start = int(query.get("startAfter") or 0)
+        page = rows[start:start + int(query.get("limit") or 20)]
+        end = start + len(page)
+        next_url = f"{backend_module.GHL_BASE_URL}{path}?startAfter={end}" if end < len(rows) else None
+        return {key: page, "meta": {"total": len(rows), "nextPageUrl": next_url}}
+
+    return handler
+
+
+class GHLSyncCase(TransactionCase):
+    """Sync engine test case, talking to a FakeGHL instead of GoHighLevel."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ICP = cls.env["ir.config_parameter"].sudo()
+        for key, value in {
+            "odoo_ghl.api_token": "test-token",
+            "odoo_ghl.location_id": LOCATION_ID,
+            "odoo_ghl.sync_direction": "both",
+            "odoo_ghl.sync_contacts": "True",
+            "odoo_ghl.sync_opportunities": "True",
+            "odoo_ghl.sync_tasks": "True",
+            "odoo_ghl.sync_notes": "True",
+            "odoo_ghl.adaptive_polling": "False",
+            "odoo_ghl.pull_prefetch_pages": "0",
+            "odoo_ghl.cron_time_budget_seconds": "0",
+            # Any page or batch over its budget fails the test
+            "odoo_ghl.query_guard": "strict",
+        }.items():
+            ICP.set_param(key, value)
+        cls.backend = cls.env["odoo.ghl.backend"]
+
+    def setUp(self):
+        super().setUp()
+        # The breaker and the API lanes write through their own cursors
+        self.registry.enter_test_mode(self.cr)
+        self.addCleanup(self.registry.leave_test_mode)
+        _breaker_cache.clear()
+        self.addCleanup(_breaker_cache.clear)
+        self.ghl = FakeGHL()
+        self.patch(backend_module, "_http_session", self.ghl)
+
+    def set_param(self, key, value):
+        self.env["ir.config_parameter"].sudo().set_param(f"odoo_ghl.{key}", value)
+
+    def create_contacts(self, count, prefix="c"):
+        """Partners bound to the GHL contacts ``<prefix>0`` … ``<prefix>{count - 1}``."""
+        return self.backend._sync_env(self.env["res.partner"]).create([
+            {"name": f"Contact {i}", "ghl_id": f"{prefix}{i}"} for i in range(count)
+        ])
+
+    def query_bound(self, budget, units, records=0):
+        """SQL queries allowed to a run of ``units`` pages / swept contacts
+        writing ``records`` records, per the guard budget ``budget``."""
+        budget = QUERY_BUDGETS[budget]
+        return budget.sql * units + budget.sql_per_record * records + RUN_OVERHEAD
@@ -0,0 +1,88 @@
+# odoo_gohighlevel_connector/tests/test_circuit_breaker.py
+from odoo.tests import tagged
+
+from odoo.addons.odoo_gohighlevel_connector.models.circuit_breaker import GHLCircuitOpenError, _breaker_cache
+
+from .common import UPDATED_AT, GHLSyncCase
+
+
+@tagged("post_install", "-at_install")
+class TestCircuitBreaker(GHLSyncCase):
+
+    def setUp(self):
+        super().setUp()
+        self.set_param("circuit_failure_threshold", "1")
+        self.set_param("circuit_cooldown_seconds", "60")
+        self.breaker = self.env["ghl.circuit.breaker"]
+        self.breaker._record_failure("GHL is down")
+
+    def state(self):
+        _breaker_cache.clear()
+        return self.breaker._get_cached_state()[0]
+
+    def cool_down(self, column):
+        self.cr.execute(
+            f"UPDATE ghl_circuit_breaker SET {column} = {column} - interval '2 minutes' WHERE id = %s",
+            (self.breaker._get_breaker_id(),),
+        )
+        _breaker_cache.clear()
+
+    def test_open_half_open_closed(self):
+        self.assertEqual(self.state(), "open")
+        self.assertFalse(self.breaker._is_available())
+        with self.assertRaises(GHLCircuitOpenError):
+            self.breaker._before_call()
+
+        # Past the cooldown: one probe goes through, the others wait for it
+        self.cool_down("opened_at")
+        self.assertTrue(self.breaker._is_available())
+        self.breaker._before_call()
+        self.assertEqual(self.state(), "half_open")
+        self.assertFalse(self.breaker._is_available())
+        with self.assertRaises(GHLCircuitOpenError):
+            self.breaker._before_call()
+
+        # A probe that never reported back is replaced after the cooldown
+        self.cool_down("probe_at")
+        self.assertTrue(self.breaker._is_available())
+        self.breaker._before_call()
+
+        self.breaker._record_success()
+        self.assertEqual(self.state(), "closed")
+        self.assertTrue(self.breaker._is_available())
+
+    def test_failed_probe_reopens(self):
+        self.cool_down("opened_at")
+        self.breaker._before_call()
+        self.breaker._record_failure("Still down")
+        self.assertEqual(self.state(), "open")
+        self.assertFalse(self.breaker._is_available())
+
+    def test_deferred_pushes_probe(self):
+        """The deferred pushes are sent once the cooldown is over, and close
+        the breaker when GHL answers."""
+        partner = self.backend._sync_env(self.env["res.partner"]).create({"name": "Jane Doe"})
+        self.backend._enqueue_push(partner, "GHL is down", state="draft")
+        self.ghl.route("POST", "/contacts/", lambda query, payload: {
+            "contact": {"id": "g1", "dateUpdated": UPDATED_AT},
+        })
+        Queue = self.env["ghl.sync.queue"]
+        Queue._process_pending()
+        self.assertFalse(self.ghl.calls)
+
+        self.cool_down("opened_at")
+        Queue._process_pending()
+        self.assertEqual(len(self.ghl.calls), 1)
+        self.assertEqual(partner.ghl_id, "g1")
+        self.assertEqual(self.state(), "closed")
+        self.assertFalse(Queue.search([("record_id", "=", partner.id), ("state", "!=", "done")]))
+
+    def test_retry_cron_sends_deferred_pushes(self):
+        partner = self.backend._sync_env(self.env["res.partner"]).create({"name": "Jane Doe"})
+        self.backend._enqueue_push(partner, "GHL is down", state="draft")
+        self.ghl.route("POST", "/contacts/", lambda query, payload: {
+            "contact": {"id": "g1", "dateUpdated": UPDATED_AT},
+        })
+        self.cool_down("opened_at")
+        self.env["ghl.sync.queue"].cron_retry_failed_syncs()
+        self.assertEqual(partner.ghl_id, "g1")
@@ -0,0 +1,70 @@
+# odoo_gohighlevel_connector/tests/test_page_size.py
+from types import SimpleNamespace
+
+from odoo.tests import BaseCase, tagged
+
+from odoo.addons.odoo_gohighlevel_connector.models.page_size import (
+    DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, RECOVERY_PAGES, PageSizer,
+)
+
+TIMEOUT = SimpleNamespace(status_code=None)
+
+
+@tagged("post_install", "-at_install")
+class TestPageSizer(BaseCase):
+
+    def full_page(self, sizer, seconds_per_record=0.01):
+        sizer.observe(sizer.size * seconds_per_record, sizer.size)
+
+    def test_grow_shrink_recover(self):
+        sizer = PageSizer(50)
+        # Bigger pages cost less per record: grow up to the maximum
+        self.full_page(sizer, 0.02)
+        self.assertEqual(sizer.size, 75)
+        self.full_page(sizer, 0.015)
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE)
+
+        # A timeout halves the size and caps it below the size that failed
+        self.assertTrue(sizer.failed(TIMEOUT))
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE // 2)
+        for _page in range(RECOVERY_PAGES - 1):
+            self.full_page(sizer)
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE // 2)
+
+        # Enough healthy pages: the cap is lifted and the size grows back
+        self.full_page(sizer, 0.02)
+        self.assertEqual(sizer.size, 75)
+        self.full_page(sizer, 0.015)
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE)
+
+    def test_no_gain_settles(self):
+        sizer = PageSizer(50)
+        self.full_page(sizer, 0.01)
+        self.full_page(sizer, 0.01)  # Same latency per record at 75
+        self.assertEqual(sizer.size, 50)
+        self.full_page(sizer, 0.001)
+        self.assertEqual(sizer.size, 50)
+
+    def test_default_starts_at_maximum(self):
+        """A first run fetches full pages until GHL struggles."""
+        sizer = PageSizer(DEFAULT_PAGE_SIZE)
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE)
+        self.full_page(sizer)
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE)
+        self.assertTrue(sizer.failed(TIMEOUT))
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE // 2)
+        for _page in range(RECOVERY_PAGES):
+            self.full_page(sizer, 0.01)
+        self.full_page(sizer, 0.005)
+        self.assertEqual(sizer.size, MAX_PAGE_SIZE)
+
+    def test_client_error_not_retried(self):
+        sizer = PageSizer(DEFAULT_PAGE_SIZE)
+        self.assertFalse(sizer.failed(SimpleNamespace(status_code=422)))
+        self.assertEqual(sizer.size, DEFAULT_PAGE_SIZE)
+
+    def test_fixed(self):
+        sizer = PageSizer(40, fixed=True)
+        self.full_page(sizer, 0.02)
+        self.assertFalse(sizer.failed(TIMEOUT))
+        self.assertEqual(sizer.size, 40)
@@ -0,0 +1,81 @@
+# odoo_gohighlevel_connector/tests/test_pull.py
+from odoo.tests import tagged
+
+from .common import GHLSyncCase, contact_row, paged
+
+
+@tagged("post_install", "-at_install")
+class TestPull(GHLSyncCase):
+
+    def setUp(self):
+        super().setUp()
+        self.rows = [contact_row(0)]
+        self.ghl.route("GET", "/contacts/", paged("contacts", self.rows, "/contacts/"))
+        self.backend.pull_contacts()
+        self.partner = self.env["res.partner"].search([("ghl_id", "=", "c0")])
+
+    def edit_in_ghl(self, **values):
+        self.rows[0] = contact_row(0, dateUpdated="2026-01-02T10:00:00.000Z", **values)
+
+    def queued(self):
+        return self.env["ghl.sync.queue"].search(
+            [("model_name", "=", "res.partner"), ("record_id", "=", self.partner.id)]
+        )
+
+    def test_remote_edit_applied(self):
+        """A change made only in GHL is no conflict, whatever the policy."""
+        self.set_param("conflict_policy", "odoo")
+        self.edit_in_ghl(firstName="Renamed")
+        self.backend.pull_contacts()
+        self.assertEqual(self.partner.name, "Renamed")
+        self.assertFalse(self.queued())
+
+    def edit_in_odoo(self, **values):
+        """Edit the partner in a later transaction than the first pull."""
+        self.partner.write(values)
+        self.cr.execute(
+            "UPDATE res_partner SET write_date = write_date + interval '1 minute' WHERE id = %s",
+            (self.partner.id,),
+        )
+        self.partner.invalidate_recordset(["write_date"])
+
+    def test_two_sided_edit_keeps_odoo(self):
+        self.set_param("conflict_policy", "odoo")
+        self.edit_in_odoo(email="jane@example.com")
+        self.edit_in_ghl(firstName="Renamed")
+        self.backend.pull_contacts()
+        self.assertEqual(self.partner.name, "Contact 0")
+        self.assertEqual(self.queued().state, "draft")
+        # The next poll sees the same conflict: still one queued push
+        self.backend.with_context(ghl_reconcile=True).pull_contacts()
+        self.assertEqual(len(self.queued()), 1)
+
+    def test_unsynced_edit_no_conflict(self):
+        """An Odoo edit of a field GHL does not sync is no conflict."""
+        self.set_param("conflict_policy", "odoo")
+        self.edit_in_odoo(comment="Called on Monday")
+        self.edit_in_ghl(firstName="Renamed")
+        self.backend.pull_contacts()
+        self.assertEqual(self.partner.name, "Renamed")
+        self.assertFalse(self.queued())
+
+    def test_reconcile_applies_missed_edit(self):
+        """An edit older than the watermark is only caught by a reconciliation."""
+        self.rows.append(contact_row(1, dateUpdated="2026-01-03T10:00:00.000Z"))
+        self.backend.pull_contacts()
+        self.edit_in_ghl(firstName="Renamed")  # Updated on Jan 2, before the watermark
+        self.backend.pull_contacts()
+        self.assertEqual(self.partner.name, "Contact 0")
+        self.backend.with_context(ghl_reconcile=True).pull_contacts()
+        self.assertEqual(self.partner.name, "Renamed")
+
+    def test_run_keeps_own_cursor(self):
+        """A manual sync run neither resumes nor clears the poll cron's cursor."""
+        self.backend._set_resume("contacts", {"pages": 3})
+        run_backend = self.backend.with_context(ghl_sync_run_id=1)
+        self.assertEqual(run_backend._resume_key("contacts"), "run:1:contacts")
+        self.assertFalse(run_backend._get_resume(run_backend._resume_key("contacts")))
+        self.edit_in_ghl(firstName="Renamed")
+        run_backend.pull_contacts()
+        self.assertEqual(self.partner.name, "Renamed")
+        self.assertEqual(self.backend._get_resume("contacts"), {"pages": 3})
@@ -0,0 +1,66 @@
+# odoo_gohighlevel_connector/tests/test_push.py
+from odoo.tests import tagged
+
+from .common import UPDATED_AT, GHLSyncCase
+
+DUPLICATE = "This location does not allow duplicated contacts."
+
+
+@tagged("post_install", "-at_install")
+class TestPush(GHLSyncCase):
+
+    def setUp(self):
+        super().setUp()
+        self.partner = self.backend._sync_env(self.env["res.partner"]).create({
+            "name": "Jane Doe", "email": "jane@example.com",
+        })
+
+    def duplicate_of(self, ghl_id):
+        self.ghl.route("POST", "/contacts/", lambda query, payload: (
+            400, {"message": DUPLICATE, "meta": {"contactId": ghl_id}}
+        ))
+
+    def test_duplicate_contact_linked(self):
+        self.duplicate_of("g1")
+        self.ghl.route("PUT", "/contacts/g1", lambda query, payload: {
+            "contact": {"id": "g1", "dateUpdated": UPDATED_AT},
+        })
+        self.assertFalse(self.backend.push_records(self.partner))
+        self.assertEqual(self.partner.ghl_id, "g1")
+
+    def test_duplicate_of_linked_contact(self):
+        """A duplicate of a contact already linked to another partner fails
+        cleanly, leaving the transaction usable."""
+        linked = self.create_contacts(1)
+        self.duplicate_of("c0")
+        failures = self.backend.push_records(self.partner)
+        self.assertEqual([record for record, _error in failures], [self.partner])
+        self.assertFalse(self.partner.ghl_id)
+        self.assertEqual(linked.ghl_id, "c0")
+        queued = self.env["ghl.sync.queue"].search([("record_id", "=", self.partner.id)])
+        self.assertEqual(queued.state, "failed")
+
+    def test_error_redacted(self):
+        """Failed calls keep the contact data of the response out of the
+        error message, which ends up in logs, the queue and the breaker."""
+        self.ghl.route("POST", "/contacts/", lambda query, payload: (
+            422, {"message": "Invalid contact", "email": "jane@example.com", "phone": "+1 555 010 9999"}
+        ))
+        [(_record, error)] = self.backend.push_records(self.partner)
+        self.assertIn("jane@example.com", error.response_body)
+        self.assertNotIn("jane@example.com", str(error))
+        self.assertNotIn("555 010 9999", str(error))
+
+    def test_push_keeps_write_date(self):
+        """Only the binding is written back: the partner's write_date still
+        tells when it was last edited in Odoo."""
+        self.cr.execute(
+            "UPDATE res_partner SET write_date = '2026-01-01 10:00:00' WHERE id = %s", (self.partner.id,)
+        )
+        self.partner.invalidate_recordset(["write_date"])
+        self.ghl.route("POST", "/contacts/", lambda query, payload: {
+            "contact": {"id": "g1", "dateUpdated": UPDATED_AT},
+        })
+        self.backend.push_contact(self.partner)
+        self.assertEqual(self.partner.ghl_id, "g1")
+        self.assertEqual(str(self.partner.write_date), "2026-01-01 10:00:00")
@@ -0,0 +1,142 @@
+# odoo_gohighlevel_connector/tests/test_query_budget.py
+import threading
+
+from odoo.tests import tagged
+
+from odoo.addons.odoo_gohighlevel_connector.models import backend as backend_module
+from odoo.addons.odoo_gohighlevel_connector.models.query_guard import http_call_count
+
+from .common import LOCATION_ID, UPDATED_AT, GHLSyncCase, contact_row, paged
+
+
+@tagged("post_install", "-at_install")
+class TestQueryBudget(GHLSyncCase):
+    """Every pull and push path stays within its SQL and GHL call budget."""
+
+    def assertCalls(self, expected, calls_before):
+        self.assertEqual(len(self.ghl.calls), expected)
+        self.assertEqual(http_call_count() - calls_before, expected)
+
+    def test_pull_contacts(self):
+        self.ghl.route("GET", "/contacts/", paged("contacts", [contact_row(i) for i in range(120)], "/contacts/"))
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("contacts", units=3, records=120)):
+            self.backend.pull_contacts(limit=50)
+        self.assertCalls(3, calls)
+        self.assertEqual(len(self.env["ghl.binding"]._get_ghl_ids("res.partner")), 120)
+
+        # Nothing changed since: the same pages, no record work
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("contacts", units=3)):
+            self.backend.pull_contacts(limit=50)
+        self.assertEqual(http_call_count() - calls, 3)
+
+    def test_pull_cost_independent_of_page_size(self):
+        """A page of 40 contacts costs the same queries as a page of 10,
+        whether they are created or unchanged."""
+        company = self.env["res.partner"].create({"name": "Company 0", "is_company": True})
+        rows = []
+        self.ghl.route("GET", "/contacts/", paged("contacts", rows, "/contacts/"))
+
+        def pull_page(first, count):
+            # Each contact works at another company, resolved for the whole page
+            rows[:] = [contact_row(i, companyName=f"Company {i}") for i in range(first, first + count)]
+            queries = self.cr.sql_log_count
+            self.backend.pull_contacts(limit=100)
+            return self.cr.sql_log_count - queries
+
+        pull_page(200, 5)  # Loads the settings, lookups and sync state rows
+        self.assertEqual(pull_page(100, 40), pull_page(0, 10), "contacts created")
+        self.assertEqual(pull_page(100, 40), pull_page(0, 10), "contacts unchanged")
+        self.assertEqual(self.env["res.partner"].search([("ghl_id", "=", "c0")]).parent_id, company)
+
+    def test_pull_contacts_prefetch(self):
+        """Pages fetched ahead by the prefetch thread count for the pull."""
+        self.set_param("pull_prefetch_pages", "1")
+        self.ghl.route("GET", "/contacts/", paged("contacts", [contact_row(i) for i in range(60)], "/contacts/"))
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("contacts", units=3, records=60)):
+            self.backend.pull_contacts(limit=20)
+        self.assertCalls(3, calls)
+
+    def test_call_count_per_thread(self):
+        """Calls of unrelated threads do not eat into the budget of a run."""
+        self.ghl.route("GET", "/users/", lambda query, payload: {"users": []})
+        calls = http_call_count()
+        other = threading.Thread(target=lambda: [
+            backend_module._ghl_http("GET", f"{backend_module.GHL_BASE_URL}/users/", {}) for _i in range(3)
+        ])
+        other.start()
+        other.join()
+        self.assertEqual(len(self.ghl.calls), 3)
+        self.assertEqual(http_call_count(), calls)
+
+    def test_pull_opportunities(self):
+        self.create_contacts(10)
+        rows = [
+            {"id": f"o{i}", "name": f"Deal {i}", "contactId": f"c{i % 10}", "status": "open",
+             "monetaryValue": 100, "updatedAt": UPDATED_AT}
+            for i in range(80)
+        ]
+        self.ghl.route("GET", "/opportunities/search", paged("opportunities", rows, "/opportunities/search"))
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("opportunities", units=2, records=80)):
+            self.backend.pull_opportunities(limit=40)
+        self.assertCalls(2, calls)
+        self.assertEqual(len(self.env["ghl.binding"]._get_ghl_ids("crm.lead")), 80)
+
+    def test_pull_tasks_search(self):
+        self.create_contacts(10)
+        tasks = [
+            {"id": f"t{i}", "title": f"Task {i}", "contactId": f"c{i % 10}", "updatedAt": UPDATED_AT}
+            for i in range(150)
+        ]
+
+        def search(query, payload):
+            return {"tasks": tasks[payload["skip"]:payload["skip"] + payload["limit"]]}
+
+        self.ghl.route("POST", f"/locations/{LOCATION_ID}/tasks/search", search)
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("task_search", units=2, records=150)):
+            self.backend.pull_tasks()
+        self.assertCalls(2, calls)
+        self.assertEqual(len(self.env["ghl.binding"]._get_ghl_ids("project.task")), 150)
+
+    def test_pull_tasks_sweep(self):
+        self.set_param("task_pull_mode", "sweep")
+        self.create_contacts(30)
+        self.ghl.route("GET", r"/contacts/([^/]+)/tasks", lambda query, payload, contact: {"tasks": [
+            {"id": f"{contact}-t{i}", "title": f"Task {i}", "updatedAt": UPDATED_AT} for i in range(2)
+        ]})
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("tasks", units=30, records=60)):
+            self.backend.pull_tasks()
+        self.assertCalls(30, calls)
+        self.assertEqual(len(self.env["ghl.binding"]._get_ghl_ids("project.task")), 60)
+
+    def test_pull_notes(self):
+        self.create_contacts(30)
+        self.ghl.route("GET", r"/contacts/([^/]+)/notes", lambda query, payload, contact: {"notes": [
+            {"id": f"{contact}-n{i}", "body": f"Note {i}", "dateAdded": UPDATED_AT} for i in range(2)
+        ]})
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("notes", units=30, records=60)):
+            self.backend.pull_notes()
+        self.assertCalls(30, calls)
+        self.assertEqual(len(self.env["ghl.binding"]._get_ghl_ids("mail.message")), 60)
+
+    def test_push_records(self):
+        partners = self.backend._sync_env(self.env["res.partner"]).create([
+            {"name": f"Contact {i}", "email": f"contact{i}@example.com"} for i in range(12)
+        ])
+
+        def create(query, payload):
+            return {"contact": {"id": f"ghl-{payload['email'].split('@')[0]}", "dateUpdated": UPDATED_AT}}
+
+        self.ghl.route("POST", "/contacts/", create)
+        calls = http_call_count()
+        with self.assertQueryCount(self.query_bound("push", units=1, records=12)):
+            failures = self.backend.push_records(partners)
+        self.assertFalse(failures)
+        self.assertCalls(12, calls)
+        self.assertEqual(partners[0].ghl_id, "ghl-contact0")
@@ -0,0 +1,33 @@
+# odoo_gohighlevel_connector/tests/test_scope.py
+from odoo.exceptions import UserError
+from odoo.tests import tagged
+
+from .common import GHLSyncCase
+
+INVALID_DOMAIN = "[('no_such_field', '=', 1)]"
+
+
+@tagged("post_install", "-at_install")
+class TestScope(GHLSyncCase):
+
+    def test_invalid_domain_refused(self):
+        settings = self.env["res.config.settings"].create({"ghl_contact_domain": INVALID_DOMAIN})
+        with self.assertRaises(UserError):
+            settings.execute()
+
+    def test_broken_domain_syncs_nothing(self):
+        """A domain broken after it was saved does not fail the save hooks,
+        and puts no record in scope."""
+        self.set_param("contact_domain", INVALID_DOMAIN)
+        with self.assertLogs("odoo.addons.odoo_gohighlevel_connector.models.backend", "ERROR"):
+            partner = self.env["res.partner"].create({"name": "Jane Doe"})
+        self.assertFalse(self.ghl.calls)
+        self.assertFalse(self.backend._filter_in_scope(partner))
+
+    def test_invalid_number_setting(self):
+        """A mistyped numeric parameter falls back to its default instead
+        of failing every save."""
+        self.set_param("poll_min_minutes", "five")
+        with self.assertLogs("odoo.addons.odoo_gohighlevel_connector.models.backend", "WARNING"):
+            self.assertEqual(self.backend._get_config_snapshot().poll_min_minutes, 5)
+        self.env["res.partner"].create({"name": "Jane Doe"})
@@ -0,0 +1,71 @@
+# odoo_gohighlevel_connector/tests/test_sweep_partition.py
+from datetime import datetime
+
+from odoo.tests import tagged
+
+from odoo.addons.odoo_gohighlevel_connector.models import backend as backend_module
+
+from .common import GHLSyncCase
+
+
+@tagged("post_install", "-at_install")
+class TestSweepPartition(GHLSyncCase):
+
+    def setUp(self):
+        super().setUp()
+        self.set_param("sweep_partitions", "2")
+        self.Partition = self.env["ghl.sync.partition"]
+        self.Partition._schedule("notes")
+
+    def claim(self, index):
+        part = self.Partition.search([("entity", "=", "notes"), ("partition", "=", index)])
+        self.cr.execute(
+            "UPDATE ghl_sync_partition SET owner = 'w', pending = false WHERE id = %s", (part.id,)
+        )
+        return part
+
+    def sweep(self, index, latest):
+        """Sweep partition ``index``, pulling updates up to ``latest``."""
+        part = self.claim(index)
+        self.Partition._record_latest("notes", index, latest)
+        part._release("w")
+        self.Partition._complete_round("notes")
+
+    def watermark(self):
+        return self.env["ghl.sync.state"]._get_watermarks(["notes"]).get("notes")
+
+    def test_watermark_waits_for_round(self):
+        """The note watermark only moves once every partition is swept, to
+        the latest update any of them pulled."""
+        self.sweep(1, datetime(2026, 1, 3))
+        self.assertFalse(self.watermark())
+        self.sweep(0, datetime(2026, 1, 2))
+        self.assertEqual(self.watermark(), datetime(2026, 1, 3))
+        self.assertFalse(any(self.Partition.search([]).mapped("latest")))
+
+    def test_failed_partition_holds_watermark(self):
+        self.sweep(0, datetime(2026, 1, 2))
+        self.claim(1)._release("w", error="GHL is down")
+        self.Partition._complete_round("notes")
+        self.assertFalse(self.watermark())
+
+    def test_sweep_contacts_fetched_by_partition(self):
+        """The partition filter and the fetch limit run in SQL; the sweep
+        continues after the last contact fetched."""
+        self.patch(backend_module, "SWEEP_FETCH_SIZE", 2)
+        partners = self.create_contacts(6)
+        partition = [p for p in partners.sorted("id") if p.id % 2 == 1]
+        contacts, next_after_id = self.backend._get_sweep_contacts((1, 2))
+        self.assertEqual(list(contacts), partition[:2])
+        self.assertEqual(next_after_id, partition[1].id)
+        contacts, next_after_id = self.backend._get_sweep_contacts((1, 2), after_id=partition[1].id)
+        self.assertEqual(list(contacts), partition[2:])
+        self.assertIsNone(next_after_id)
+
+    def test_search_unbound(self):
+        Partner = self.env["res.partner"]
+        bound = self.create_contacts(2)
+        unbound = Partner.create({"name": "Unbound"})
+        self.assertEqual(Partner.search([("id", "in", (bound | unbound).ids), ("ghl_id", "!=", False)]), bound)
+        self.assertEqual(Partner.search([("id", "in", (bound | unbound).ids), ("ghl_id", "=", False)]), unbound)
+        self.assertEqual(Partner.search([("ghl_id", "=", "c1")]), bound[1])